@@ -179,9 +179,11 @@ def mock_auth():
 
 @pytest.fixture(scope="session")
 def data_client(auth_client):
-    """Create authenticated Data360Client."""
+    """Create authenticated Data360Client sharing one connection pool."""
     from scripts.datacloud_client import Data360Client
-    return Data360Client(auth_client)
+    client = Data360Client(auth_client)
+    yield client
+    client.close()
 
 
 @pytest.fixture
@@ -22,23 +22,28 @@ Usage:
         pass
 """
 
+import functools
 import io
 import json
 import os
+import pickle
 import sys
 import tempfile
 import shutil
 import pytest
 from pathlib import Path
 from typing import Dict, List, Optional, Any
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 from urllib.error import HTTPError, URLError
 
-# Add skill scripts to path
-SKILL_ROOT = Path(__file__).parent.parent
+# Add skill scripts to path, plus this directory so test modules can
+# `from conftest import ...` helpers regardless of the invocation directory
+VALIDATION_DIR = Path(__file__).parent
+SKILL_ROOT = VALIDATION_DIR.parent
 SCRIPTS_DIR = SKILL_ROOT / "hooks" / "scripts"
 TEMPLATES_DIR = SKILL_ROOT / "templates"
 sys.path.insert(0, str(SCRIPTS_DIR))
+sys.path.insert(0, str(VALIDATION_DIR))
 
 from agent_api_client import (
     AgentAPIClient,
@@ -49,6 +54,7 @@ from agent_api_client import (
     parse_variables,
     _parse_messages,
 )
+from multi_turn_test_runner import evaluate_turn, _build_parser
 
 
 # =============================================================================
@@ -65,6 +71,8 @@ def pytest_configure(config):
     config.addinivalue_line("markers", "offline: Test uses only local fixtures (no network)")
     config.addinivalue_line("markers", "live_api: Test requires live Salesforce API")
     config.addinivalue_line("markers", "slow: Test is slow-running")
+    # Registered here too so --strict-markers passes when pytest-xdist is absent
+    config.addinivalue_line("markers", "xdist_group(name): pytest-xdist worker affinity group")
 
 
 def pytest_collection_modifyitems(config, items):
@@ -73,6 +81,14 @@ def pytest_collection_modifyitems(config, items):
     tier_filter = config.getoption("--tier", default=None)
 
     for item in items:
+        # Pin live tests to one xdist worker so the session-scoped live_client
+        # authenticates once; offline tests stay free to spread across workers
+        # (pytest -n auto --dist=loadgroup). A live test that declares its own
+        # xdist_group keeps it, so independent sessions can be opted into
+        # separate workers where the org's concurrent-session limits allow.
+        if "live_api" in item.keywords and item.get_closest_marker("xdist_group") is None:
+            item.add_marker(pytest.mark.xdist_group("live_api"))
+
         # Skip live_api tests when --offline
         if offline and "live_api" in item.keywords:
             item.add_marker(pytest.mark.skip(reason="Skipping live API tests (--offline)"))
@@ -116,6 +132,47 @@ def templates_dir() -> Path:
     return TEMPLATES_DIR
 
 
+@pytest.fixture(scope="session")
+def parsed_template(request, templates_dir):
+    """
+    Return a loader for parsed templates by file name.
+
+    Parsed data is memoized in-process and pickled under the pytest cache
+    directory, so unchanged templates skip the YAML parse on later runs. A
+    pickle older than its template, or one that fails to load, is rebuilt;
+    pickles are written atomically, so parallel xdist workers never read a
+    partial file. Callers must treat the returned data as read-only.
+    """
+    import yaml
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    cache = getattr(request.config, "cache", None)  # None under -p no:cacheprovider
+    cache_dir = cache.mkdir("parsed-templates") if cache is not None else None
+
+    @functools.lru_cache(maxsize=None)
+    def _load(template_name: str) -> Any:
+        source = templates_dir / template_name
+        if cache_dir is None:
+            return yaml.load(source.read_text(), Loader=loader)
+
+        pickled = cache_dir / f"{template_name}.pkl"
+        try:
+            if pickled.stat().st_mtime > source.stat().st_mtime:
+                with pickled.open("rb") as f:
+                    return pickle.load(f)
+        except Exception:
+            pass  # missing, unreadable or corrupt: re-parse below
+
+        data = yaml.load(source.read_text(), Loader=loader)
+        tmp_file = pickled.with_name(f"{pickled.name}.{os.getpid()}.tmp")
+        with tmp_file.open("wb") as f:
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, pickled)
+        return data
+
+    return _load
+
+
 @pytest.fixture(scope="session")
 def scenario_registry() -> dict:
     """Load scenario_registry.json configuration."""
@@ -128,6 +185,27 @@ def scenario_registry() -> dict:
 # Mock urllib Fixtures
 # =============================================================================
 
+class _MockResponse:
+    """Minimal stand-in for the context manager returned by urlopen()."""
+
+    __slots__ = ("status", "code", "headers", "_body")
+
+    def __init__(self, status: int, body: bytes, headers: dict):
+        self.status = status
+        self.code = status
+        self.headers = headers
+        self._body = body
+
+    def read(self) -> bytes:
+        return self._body
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+
 def make_mock_response(status: int = 200, body: Any = None, headers: dict = None):
     """
     Create a mock urllib response object.
@@ -138,12 +216,8 @@ def make_mock_response(status: int = 200, body: Any = None, headers: dict = None
         headers: Optional response headers
 
     Returns:
-        MagicMock mimicking urllib response context manager
+        _MockResponse mimicking urllib response context manager
     """
-    mock_resp = MagicMock()
-    mock_resp.status = status
-    mock_resp.code = status
-
     if body is None:
         body = {}
     if isinstance(body, (dict, list)):
@@ -153,11 +227,7 @@ def make_mock_response(status: int = 200, body: Any = None, headers: dict = None
     else:
         raw_body = body
 
-    mock_resp.read.return_value = raw_body
-    mock_resp.headers = headers or {}
-    mock_resp.__enter__ = lambda s: s
-    mock_resp.__exit__ = MagicMock(return_value=False)
-    return mock_resp
+    return _MockResponse(status, raw_body, headers or {})
 
 
 def make_http_error(code: int = 400, body: Any = None, url: str = "https://test"):
@@ -205,6 +275,42 @@ def mock_urlopen():
         yield mock
 
 
+# =============================================================================
+# Stub Session
+# =============================================================================
+
+class StubSession:
+    """
+    Lightweight stand-in for AgentSession used as a context manager.
+
+    send() returns the given responses in order; an Exception instance in the
+    list is raised instead of returned. Much cheaper than a MagicMock session.
+
+    Usage:
+        stub = StubSession([error_turn, success_turn])
+        with patch.object(mock_client, "session", return_value=stub):
+            ...
+        assert stub.send_calls == 2
+    """
+
+    def __init__(self, responses):
+        self._responses = iter(responses)
+        self.send_calls = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def send(self, *args, **kwargs):
+        self.send_calls += 1
+        response = next(self._responses)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
 # =============================================================================
 # Mock Client Fixtures
 # =============================================================================
@@ -308,6 +414,32 @@ def sample_turn_result(sample_agent_messages):
     return _factory
 
 
+@pytest.fixture
+def assert_eval(sample_turn_result):
+    """
+    Build a turn, evaluate it against expectations, and assert the outcome.
+
+    Usage:
+        def test_something(assert_eval):
+            assert_eval("I can help", {"response_not_empty": True})
+            result = assert_eval("Hello", {"response_contains": "order"}, False)
+
+    Extra keyword arguments are forwarded to sample_turn_result. Returns the
+    evaluate_turn() result dict for further assertions.
+    """
+    def _assert_eval(
+        agent_text: str,
+        expectations: Dict[str, Any],
+        expected_passed: bool = True,
+        **turn_kwargs,
+    ) -> Dict[str, Any]:
+        turn = sample_turn_result(agent_text=agent_text, **turn_kwargs)
+        result = evaluate_turn(turn, expectations, [])
+        assert result["passed"] is expected_passed, result["checks"]
+        return result
+    return _assert_eval
+
+
 # =============================================================================
 # YAML Scenario Fixtures
 # =============================================================================
@@ -351,6 +483,12 @@ def mock_yaml_scenario():
     return _factory
 
 
+@pytest.fixture(scope="session")
+def cli_parser():
+    """The runner's real argparse parser, built once per session."""
+    return _build_parser()
+
+
 # =============================================================================
 # Temp Directory Fixtures
 # =============================================================================
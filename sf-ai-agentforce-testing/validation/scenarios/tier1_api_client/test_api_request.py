@@ -8,16 +8,10 @@ response body handling.
 Points: 5
 """
 
-import sys
-from pathlib import Path
-
 import pytest
 from unittest.mock import patch
 from urllib.error import URLError
 
-# Allow importing helpers from the validation conftest
-sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
-
 from agent_api_client import AgentAPIClient, AgentAPIError
 from conftest import make_mock_response, make_http_error
 
@@ -65,6 +59,21 @@ class TestApiRequest:
         assert result == {"ok": True}
         assert mock_urlopen.call_count == 2
 
+    def test_retries_share_ssl_context(self, mock_urlopen):
+        """Every attempt reuses the client's TLS context instead of building a new one."""
+        mock_urlopen.side_effect = [
+            make_http_error(500, {"error": "internal"}),
+            make_mock_response(200, {"ok": True}),
+        ]
+        client = _make_authed_client(retry_count=1)
+
+        with patch("agent_api_client.time.sleep"):
+            client._api_request("GET", "https://api.salesforce.com/test")
+
+        contexts = [c.kwargs["context"] for c in mock_urlopen.call_args_list]
+        assert contexts[0] is not None
+        assert contexts[0] is contexts[1]
+
     def test_retry_on_500(self, mock_urlopen):
         """500 (server error) triggers a retry; second attempt succeeds."""
         mock_urlopen.side_effect = [
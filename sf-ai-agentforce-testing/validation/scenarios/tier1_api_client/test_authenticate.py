@@ -7,15 +7,9 @@ credentials, HTTP errors, and malformed responses.
 Points: 6
 """
 
-import sys
-from pathlib import Path
-
 import pytest
 from urllib.error import URLError
 
-# Allow importing helpers from the validation conftest
-sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
-
 from agent_api_client import AgentAPIClient, AgentAPIError
 from conftest import make_mock_response, make_http_error
 
@@ -11,10 +11,17 @@ Tests for:
 """
 
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
-from multi_turn_test_runner import evaluate_turn, _run_check, execute_scenario
-from agent_api_client import TurnResult, AgentMessage, AgentAPIClient, AgentAPIError
+from multi_turn_test_runner import (
+    evaluate_turn,
+    _run_check,
+    execute_scenario,
+    _extract_variable_keyword,
+    _word_boundary_pattern,
+)
+from agent_api_client import AgentAPIClient, AgentAPIError
+from conftest import StubSession
 
 
 # ─────────────────────────────────────────────────────────────────────────
@@ -23,80 +30,62 @@ from agent_api_client import TurnResult, AgentMessage, AgentAPIClient, AgentAPIE
 
 @pytest.mark.tier2
 @pytest.mark.offline
-def test_action_invoked_bool_true_passes(sample_turn_result):
+def test_action_invoked_bool_true_passes(assert_eval):
     """action_invoked: true passes when action result is present."""
-    turn = sample_turn_result(agent_text="Found your order.", has_action_result=True)
-    result = evaluate_turn(turn, {"action_invoked": True}, [])
-    assert result["passed"] is True
+    assert_eval("Found your order.", {"action_invoked": True}, has_action_result=True)
 
 
 @pytest.mark.tier2
 @pytest.mark.offline
-def test_action_invoked_bool_true_fails(sample_turn_result):
+def test_action_invoked_bool_true_fails(assert_eval):
     """action_invoked: true fails when no action result."""
-    turn = sample_turn_result(agent_text="I can help with that.")
-    result = evaluate_turn(turn, {"action_invoked": True}, [])
-    assert result["passed"] is False
+    assert_eval("I can help with that.", {"action_invoked": True}, False)
 
 
 @pytest.mark.tier2
 @pytest.mark.offline
-def test_action_invoked_bool_false_passes(sample_turn_result):
+def test_action_invoked_bool_false_passes(assert_eval):
     """action_invoked: false passes when no action result."""
-    turn = sample_turn_result(agent_text="Hello there.")
-    result = evaluate_turn(turn, {"action_invoked": False}, [])
-    assert result["passed"] is True
+    assert_eval("Hello there.", {"action_invoked": False})
 
 
-@pytest.mark.tier2
-@pytest.mark.offline
-def test_action_invoked_string_passes():
-    """action_invoked with string checks action name in raw_response."""
-    turn = TurnResult(
-        sequence_id=1,
+@pytest.fixture
+def action_turn(request, sample_turn_result):
+    """TurnResult with an action result whose raw response names request.param."""
+    return sample_turn_result(
         user_message="Look up order",
-        agent_messages=[AgentMessage(
-            type="Inform", id="msg-001", message="Found your order.",
-            result=[{"orderId": "12345"}],
-        )],
-        raw_response={"messages": [
-            {"type": "Inform", "message": "Found it.", "actionName": "LookupOrder"}
-        ]},
-        elapsed_ms=100.0,
+        messages=[{
+            "message": "Found your order.",
+            "result": [{"orderId": "12345"}],
+            "actionName": request.param,
+        }],
     )
-    result = evaluate_turn(turn, {"action_invoked": "LookupOrder"}, [])
-    assert result["passed"] is True
 
 
 @pytest.mark.tier2
 @pytest.mark.offline
-def test_action_invoked_string_fails_no_action(sample_turn_result):
-    """action_invoked with string fails when no action result at all."""
-    turn = sample_turn_result(agent_text="I don't know about that.")
-    result = evaluate_turn(turn, {"action_invoked": "LookupOrder"}, [])
-    assert result["passed"] is False
-    assert "No action result" in result["checks"][0]["detail"]
+@pytest.mark.parametrize(
+    "action_turn,expected_passed,detail",
+    [
+        ("LookupOrder", True, "invoked successfully"),
+        ("CancelOrder", False, "not found"),
+    ],
+    indirect=["action_turn"],
+    ids=["matching_action", "wrong_action"],
+)
+def test_action_invoked_string(action_turn, expected_passed, detail):
+    """action_invoked with string checks the action name in raw_response."""
+    result = evaluate_turn(action_turn, {"action_invoked": "LookupOrder"}, [])
+    assert result["passed"] is expected_passed
+    assert detail in result["checks"][0]["detail"]
 
 
 @pytest.mark.tier2
 @pytest.mark.offline
-def test_action_invoked_string_fails_wrong_action():
-    """action_invoked with string fails when a different action was invoked."""
-    turn = TurnResult(
-        sequence_id=1,
-        user_message="Cancel order",
-        agent_messages=[AgentMessage(
-            type="Inform", id="msg-001", message="Order cancelled.",
-            result=[{"status": "cancelled"}],
-        )],
-        raw_response={"messages": [
-            {"type": "Inform", "message": "Done.", "actionName": "CancelOrder"}
-        ]},
-        elapsed_ms=100.0,
-    )
-    result = evaluate_turn(turn, {"action_invoked": "LookupOrder"}, [])
-    assert result["passed"] is False
-    assert "not found" in result["checks"][0]["detail"]
+def test_action_invoked_string_fails_no_action(assert_eval):
+    """action_invoked with string fails when no action result at all."""
+    result = assert_eval("I don't know about that.", {"action_invoked": "LookupOrder"}, False)
+    assert "No action result" in result["checks"][0]["detail"]
 
 
 # ─────────────────────────────────────────────────────────────────────────
@@ -105,20 +94,23 @@ def test_action_invoked_string_fails_wrong_action():
 
 @pytest.mark.tier2
 @pytest.mark.offline
-def test_action_uses_variable_no_reask_passes(sample_turn_result):
+def test_action_uses_variable_no_reask_passes(assert_eval):
     """Passes when agent does NOT re-ask for the variable's keyword."""
-    turn = sample_turn_result(agent_text="I found the details for your account.")
-    result = evaluate_turn(turn, {"action_uses_variable": "$Context.AccountId"}, [])
-    assert result["passed"] is True
+    assert_eval(
+        "I found the details for your account.",
+        {"action_uses_variable": "$Context.AccountId"},
+    )
 
 
 @pytest.mark.tier2
 @pytest.mark.offline
-def test_action_uses_variable_reask_fails(sample_turn_result):
+def test_action_uses_variable_reask_fails(assert_eval):
     """Fails when agent re-asks for the variable's keyword."""
-    turn = sample_turn_result(agent_text="Could you please provide the account number?")
-    result = evaluate_turn(turn, {"action_uses_variable": "$Context.AccountId"}, [])
-    assert result["passed"] is False
+    result = assert_eval(
+        "Could you please provide the account number?",
+        {"action_uses_variable": "$Context.AccountId"},
+        False,
+    )
     assert "re-asked" in result["checks"][0]["detail"].lower()
 
 
@@ -128,24 +120,18 @@ def test_action_uses_variable_reask_fails(sample_turn_result):
 
 @pytest.mark.tier2
 @pytest.mark.offline
-def test_response_contains_bool_fails_with_message(sample_turn_result):
+def test_response_contains_bool_fails_with_message(assert_eval):
     """Passing a bool to response_contains should fail with helpful message."""
-    turn = sample_turn_result(agent_text="Hello there")
-    result = evaluate_turn(turn, {"response_contains": True}, [])
-    assert result["passed"] is False
+    result = assert_eval("Hello there", {"response_contains": True}, False)
     assert "expects a string" in result["checks"][0]["detail"]
 
 
 @pytest.mark.tier2
 @pytest.mark.offline
-def test_response_contains_string_still_works(sample_turn_result):
+def test_response_contains_string_still_works(assert_eval):
     """response_contains with normal string should still pass/fail correctly."""
-    turn = sample_turn_result(agent_text="I can help with your order")
-    result = evaluate_turn(turn, {"response_contains": "order"}, [])
-    assert result["passed"] is True
-
-    result2 = evaluate_turn(turn, {"response_contains": "invoice"}, [])
-    assert result2["passed"] is False
+    assert_eval("I can help with your order", {"response_contains": "order"})
+    assert_eval("I can help with your order", {"response_contains": "invoice"}, False)
 
 
 # ─────────────────────────────────────────────────────────────────────────
@@ -154,30 +140,24 @@ def test_response_contains_string_still_works(sample_turn_result):
 
 @pytest.mark.tier2
 @pytest.mark.offline
-def test_turn_elapsed_max_passes(sample_turn_result):
+def test_turn_elapsed_max_passes(assert_eval):
     """Turn within time limit should pass."""
-    turn = sample_turn_result(agent_text="Quick response.", elapsed_ms=500.0)
-    result = evaluate_turn(turn, {"turn_elapsed_max": 10000}, [])
-    assert result["passed"] is True
+    assert_eval("Quick response.", {"turn_elapsed_max": 10000}, elapsed_ms=500.0)
 
 
 @pytest.mark.tier2
 @pytest.mark.offline
-def test_turn_elapsed_max_fails(sample_turn_result):
+def test_turn_elapsed_max_fails(assert_eval):
     """Turn exceeding time limit should fail."""
-    turn = sample_turn_result(agent_text="Slow response.", elapsed_ms=15000.0)
-    result = evaluate_turn(turn, {"turn_elapsed_max": 10000}, [])
-    assert result["passed"] is False
+    result = assert_eval("Slow response.", {"turn_elapsed_max": 10000}, False, elapsed_ms=15000.0)
     assert "EXCEEDED" in result["checks"][0]["detail"]
 
 
 @pytest.mark.tier2
 @pytest.mark.offline
-def test_turn_elapsed_max_exact_boundary(sample_turn_result):
+def test_turn_elapsed_max_exact_boundary(assert_eval):
     """Turn at exact boundary should pass (<=)."""
-    turn = sample_turn_result(agent_text="Boundary response.", elapsed_ms=10000.0)
-    result = evaluate_turn(turn, {"turn_elapsed_max": 10000}, [])
-    assert result["passed"] is True
+    assert_eval("Boundary response.", {"turn_elapsed_max": 10000}, elapsed_ms=10000.0)
 
 
 # ─────────────────────────────────────────────────────────────────────────
@@ -186,29 +166,30 @@ def test_turn_elapsed_max_exact_boundary(sample_turn_result):
 
 @pytest.mark.tier2
 @pytest.mark.offline
-def test_topic_contains_word_boundary_passes(sample_turn_result):
+def test_topic_contains_word_boundary_passes(assert_eval):
     """Exact word match should pass."""
-    turn = sample_turn_result(agent_text="I can help cancel your subscription.")
-    result = evaluate_turn(turn, {"topic_contains": "cancel"}, [])
-    assert result["passed"] is True
+    assert_eval("I can help cancel your subscription.", {"topic_contains": "cancel"})
 
 
 @pytest.mark.tier2
 @pytest.mark.offline
-def test_topic_contains_word_boundary_fails_substring(sample_turn_result):
+def test_topic_contains_word_boundary_fails_substring(assert_eval):
     """Substring-only match (no word boundary) should fail."""
-    turn = sample_turn_result(agent_text="I can help with cancellation details.")
-    result = evaluate_turn(turn, {"topic_contains": "cancel"}, [])
-    assert result["passed"] is False
+    assert_eval("I can help with cancellation details.", {"topic_contains": "cancel"}, False)
 
 
 @pytest.mark.tier2
 @pytest.mark.offline
-def test_topic_contains_case_insensitive(sample_turn_result):
+def test_topic_contains_case_insensitive(assert_eval):
     """Word boundary match should be case-insensitive."""
-    turn = sample_turn_result(agent_text="CANCEL your order now.")
-    result = evaluate_turn(turn, {"topic_contains": "cancel"}, [])
-    assert result["passed"] is True
+    assert_eval("CANCEL your order now.", {"topic_contains": "cancel"})
+
+
+@pytest.mark.tier2
+@pytest.mark.offline
+def test_topic_contains_pattern_cached():
+    """Word-boundary matcher is compiled once per keyword and reused."""
+    assert _word_boundary_pattern("cancel") is _word_boundary_pattern("cancel")
 
 
 # ─────────────────────────────────────────────────────────────────────────
@@ -226,10 +207,7 @@ def test_execute_scenario_generic_exception(mock_client):
             {"user": "Hello", "expect": {"response_not_empty": True}},
         ],
     }
-    mock_sess = MagicMock()
-    mock_sess.send.side_effect = TypeError("unexpected type error")
-    mock_sess.__enter__ = lambda s: s
-    mock_sess.__exit__ = MagicMock(return_value=False)
+    mock_sess = StubSession([TypeError("unexpected type error")])
 
     with patch.object(mock_client, "session", return_value=mock_sess):
         result = execute_scenario(mock_client, "agent-id-001", scenario)
@@ -246,7 +224,6 @@ def test_execute_scenario_generic_exception(mock_client):
 @pytest.mark.offline
 def test_extract_variable_keyword():
     """Helper should extract meaningful keyword from variable names."""
-    from multi_turn_test_runner import _extract_variable_keyword
     assert _extract_variable_keyword("$Context.AccountId") == "account"
     assert _extract_variable_keyword("$Context.EndUserLanguage") == "end"
     assert _extract_variable_keyword("CaseId") == "case"
@@ -257,5 +234,4 @@ def test_extract_variable_keyword():
 @pytest.mark.offline
 def test_extract_variable_keyword_id_only():
     """Variable that is only 'Id' should return None."""
-    from multi_turn_test_runner import _extract_variable_keyword
     assert _extract_variable_keyword("Id") is None
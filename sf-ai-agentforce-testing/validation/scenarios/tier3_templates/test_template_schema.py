@@ -10,9 +10,7 @@ Deeper structural validation of multi-turn YAML templates:
 Each test is parametrized over all 4 multi-turn templates.
 """
 
-import yaml
 import pytest
-from pathlib import Path
 
 MULTI_TURN_TEMPLATES = [
     "multi-turn-comprehensive.yaml",
@@ -21,7 +19,7 @@ MULTI_TURN_TEMPLATES = [
     "multi-turn-escalation-flows.yaml",
 ]
 
-VALID_CHECK_TYPES = {
+VALID_CHECK_TYPES = frozenset({
     "response_not_empty",
     "response_contains",
     "response_contains_any",
@@ -50,10 +48,10 @@ VALID_CHECK_TYPES = {
     "response_length_min",
     "response_length_max",
     "action_result_contains",
-}
+})
 
-REQUIRED_TOP_LEVEL_FIELDS = {"apiVersion", "kind", "metadata", "scenarios"}
-REQUIRED_METADATA_FIELDS = {"name", "testMode", "description"}
+REQUIRED_TOP_LEVEL_FIELDS = frozenset({"apiVersion", "kind", "metadata", "scenarios"})
+REQUIRED_METADATA_FIELDS = frozenset({"name", "testMode", "description"})
 
 
 @pytest.mark.tier3
@@ -62,23 +60,17 @@ REQUIRED_METADATA_FIELDS = {"name", "testMode", "description"}
 class TestTemplateSchema:
     """Schema-level validation for multi-turn YAML templates."""
 
-    def _load(self, templates_dir, template_name):
-        """Helper: load and return parsed YAML data."""
-        path = templates_dir / template_name
-        with open(path) as f:
-            return yaml.safe_load(f)
-
-    def test_required_top_level_fields(self, templates_dir, template_name):
+    def test_required_top_level_fields(self, parsed_template, template_name):
         """Template must have: apiVersion, kind, metadata, scenarios."""
-        data = self._load(templates_dir, template_name)
-        missing = REQUIRED_TOP_LEVEL_FIELDS - set(data.keys())
+        data = parsed_template(template_name)
+        missing = REQUIRED_TOP_LEVEL_FIELDS - data.keys()
         assert not missing, (
             f"Template {template_name} missing top-level fields: {missing}"
         )
 
-    def test_metadata_structure(self, templates_dir, template_name):
+    def test_metadata_structure(self, parsed_template, template_name):
         """metadata must have: name, testMode, description."""
-        data = self._load(templates_dir, template_name)
+        data = parsed_template(template_name)
         assert "metadata" in data, (
             f"Template {template_name} missing 'metadata' key"
         )
@@ -86,14 +78,14 @@ class TestTemplateSchema:
         assert isinstance(metadata, dict), (
             f"Template {template_name}: 'metadata' is not a dict"
         )
-        missing = REQUIRED_METADATA_FIELDS - set(metadata.keys())
+        missing = REQUIRED_METADATA_FIELDS - metadata.keys()
         assert not missing, (
             f"Template {template_name} metadata missing fields: {missing}"
         )
 
-    def test_turn_structure(self, templates_dir, template_name):
+    def test_turn_structure(self, parsed_template, template_name):
         """Each turn must have: user (str), expect (dict)."""
-        data = self._load(templates_dir, template_name)
+        data = parsed_template(template_name)
         for scenario in data["scenarios"]:
             sname = scenario.get("name", "?")
             for i, turn in enumerate(scenario["turns"]):
@@ -110,16 +102,15 @@ class TestTemplateSchema:
                     f"{template_name} > '{sname}' > turn {i}: 'expect' must be a dict"
                 )
 
-    def test_expect_keys_are_valid_check_types(self, templates_dir, template_name):
+    def test_expect_keys_are_valid_check_types(self, parsed_template, template_name):
         """Every key in every turn's 'expect' dict must be a recognized check type."""
-        data = self._load(templates_dir, template_name)
+        data = parsed_template(template_name)
         for scenario in data["scenarios"]:
             sname = scenario.get("name", "?")
             for i, turn in enumerate(scenario["turns"]):
-                expect = turn.get("expect", {})
-                for key in expect:
-                    assert key in VALID_CHECK_TYPES, (
-                        f"{template_name} > '{sname}' > turn {i}: "
-                        f"unrecognized check type '{key}'. "
-                        f"Valid types: {sorted(VALID_CHECK_TYPES)}"
-                    )
+                invalid = turn.get("expect", {}).keys() - VALID_CHECK_TYPES
+                assert not invalid, (
+                    f"{template_name} > '{sname}' > turn {i}: "
+                    f"unrecognized check types {sorted(invalid)}. "
+                    f"Valid types: {sorted(VALID_CHECK_TYPES)}"
+                )
@@ -13,15 +13,10 @@ Tests:
 """
 
 import json
-import sys
 import time
-from pathlib import Path
 
 import pytest
 
-# Allow importing helpers from the validation conftest
-sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
-
 from agent_api_client import (
     AgentAPIClient,
     AgentAPIError,
@@ -42,8 +37,8 @@ from conftest import make_mock_response, make_http_error
 def test_non_json_response_body(mock_urlopen, mock_client):
     """_api_request raises json.JSONDecodeError when response body is not JSON.
 
-    The code path: resp_body = resp.read().decode("utf-8"), then json.loads(resp_body).
-    Non-JSON body causes json.loads to raise JSONDecodeError, which is not caught.
+    The code path: resp_body = resp.read(), then _json_loads(resp_body).
+    Non-JSON body causes the decoder to raise JSONDecodeError, which is not caught.
     """
     mock_urlopen.return_value = make_mock_response(
         status=200,
@@ -25,7 +25,7 @@ from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, field
 from enum import Enum
 
-from .dependency_checker import DependencyChecker
+from .dependency_checker import get_checker
 
 
 class SkillType(Enum):
@@ -127,7 +127,7 @@ class CodeAnalyzerScanner:
         """
         self.config_path = config_path or self._find_config()
         self.timeout_seconds = timeout_seconds
-        self._dep_checker = DependencyChecker()
+        self._dep_checker = get_checker()
         self._engine_availability = None
         self._java_env = self._get_java_env()
 
@@ -12,26 +12,89 @@ Features:
 - Actionable recommendations
 """
 
+import os
+import re
 import sys
 import json
 import argparse
+import io
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, field, asdict
 from datetime import datetime
+from functools import lru_cache
+
+# PyYAML is imported on first validation rather than at startup, so --help
+# stays fast and works without it. See _load_yaml_module().
+yaml = None
+_YamlLoader = None
+
+
+def _load_yaml_module():
+    """Import PyYAML once, exiting with install instructions if it is missing."""
+    global yaml, _YamlLoader
+    if yaml is not None:
+        return yaml
+    try:
+        import yaml as yaml_module
+    except ImportError:
+        print("\n" + "=" * 70)
+        print("ERROR: PyYAML is required but not installed")
+        print("=" * 70)
+        print("\nTo install PyYAML, run ONE of these commands:\n")
+        print("  pip3 install --break-system-packages pyyaml")
+        print("  brew install pyyaml")
+        print("=" * 70)
+        sys.exit(1)
+    # libyaml's C loader when available: same safe semantics, several times
+    # faster than the pure-Python SafeLoader.
+    _YamlLoader = getattr(yaml_module, "CSafeLoader", None)
+    if _YamlLoader is None:
+        _YamlLoader = yaml_module.SafeLoader
+        # stderr, so --format json output stays parseable
+        print(
+            f"{Colors.YELLOW}⚠️  PyYAML was built without libyaml; validation uses the "
+            f"slower pure-Python loader. Reinstall PyYAML with libyaml "
+            f"(e.g. apt install libyaml-dev && pip3 install --force-reinstall "
+            f"--no-binary pyyaml pyyaml) to speed it up.{Colors.NC}",
+            file=sys.stderr,
+        )
+    yaml = yaml_module
+    return yaml
+
+
+# Parsed agents/openai.yaml files, memoized for the life of the process.
+# Keyed by (path, st_mtime_ns, st_size) so an edited file is parsed again.
+_yaml_cache: Dict[Tuple[str, int, int], object] = {}
+
+
+def _load_yaml_cached(path: Path):
+    """
+    Parse a YAML file, reusing the memoized result while the file is unchanged.
+
+    Raises yaml.YAMLError (or OSError) like a direct load; failures are not
+    cached.
+    """
+    st = os.stat(path)
+    key = (str(path), st.st_mtime_ns, st.st_size)
+    if key in _yaml_cache:
+        return _yaml_cache[key]
+    data = _yaml_cache[key] = yaml.load(path.read_text(), Loader=_YamlLoader)
+    return data
+
+
+def _json_dumps(obj) -> str:
+    """
+    2-space-indented JSON. Uses orjson when installed (imported here, as
+    only --format json needs it); output is the same document either way,
+    with non-ASCII characters written as-is.
+    """
+    try:
+        import orjson
+    except ImportError:
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode('utf-8')
 
-try:
-    import yaml
-except ImportError:
-    print("\n" + "=" * 70)
-    print("ERROR: PyYAML is required but not installed")
-    print("=" * 70)
-    print("\nTo install PyYAML, run ONE of these commands:\n")
-    print("  pip3 install --break-system-packages pyyaml")
-    print("  brew install pyyaml")
-    print("=" * 70)
-    sys.exit(1)
 
 # ANSI color codes
 class Colors:
@@ -45,26 +108,59 @@ class Colors:
     NC = '\033[0m'  # No Color
 
 
+# Colored prefixes repeated on every issue line of the console report
+_SKILL_BRANCH = f"{Colors.BOLD}└─ "
+_ERROR_MARK = f"{Colors.RED}❌{Colors.NC}"
+_FIX_LABEL = f"{Colors.CYAN}Fix:{Colors.NC}"
+_WARNING_MARK = f"{Colors.YELLOW}⚠️ {Colors.NC}"
+
+
 # Valid Claude Code tools
-VALID_TOOLS = [
+VALID_TOOLS = (
     "Bash", "Read", "Write", "Edit", "Glob", "Grep", "WebFetch",
     "AskUserQuestion", "TodoWrite", "SlashCommand", "Skill",
     "BashOutput", "KillShell", "NotebookEdit", "Task", "EnterPlanMode",
     "ExitPlanMode"
-]
+)
+_VALID_TOOLS_SET = frozenset(VALID_TOOLS)
+# Lowercased name -> canonical spelling, for "did you mean" on case mistakes
+_TOOLS_LOWER = {tool.lower(): tool for tool in VALID_TOOLS}
+
+# Skill names are kebab-case; versions are X.Y.Z. \Z rather than $ so a
+# trailing newline is not accepted.
+_KEBAB_RE = re.compile(r"^[a-z][a-z0-9]*(-[a-z0-9]+)*\Z")
+_SEMVER_RE = re.compile(r"^\d+\.\d+\.\d+\Z")
+
+# A frontmatter delimiter line: `---`, optionally padded (incl. a CRLF's \r)
+_FRONTMATTER_DELIM_RE = re.compile(rb"^[ \t\r\f\v]*---[ \t\r\f\v]*$", re.MULTILINE)
+_FRONTMATTER_READ_CHUNK = 4096
 
 # Agent Skills / Codex frontmatter allowlist (agentskills.io)
-CODEX_ALLOWED_FRONTMATTER_FIELDS = {
+CODEX_ALLOWED_FRONTMATTER_FIELDS = frozenset({
     "name",
     "description",
     "license",
     "allowed-tools",
     "metadata",
     "compatibility",
-}
+})
+
+
+# Tokens that must not remain in a Codex export body, with the fix for each.
+# Checked with one `in` scan per token: for a handful of literals, CPython's
+# substring search beats a single regex alternation over the body.
+CODEX_PORTABILITY_TOKENS = (
+    ("~/.claude", "Replace Claude install paths with $CODEX_HOME/skills/..."),
+    ("${SHARED_HOOKS}", "Remove placeholders and use $SHARED_DIR/..."),
+    ("${SKILL_HOOKS}", "Remove placeholders and use $SKILL_DIR/..."),
+)
+
+# Slotted dataclasses (3.10+) drop the per-instance __dict__; issues are
+# created per finding, so this adds up on large runs.
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ValidationIssue:
     """Represents a validation issue."""
     severity: str  # 'error', 'warning', 'info'
@@ -73,7 +169,7 @@ class ValidationIssue:
     fix: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class SkillValidationResult:
     """Represents validation result for a single skill."""
     skill_name: str
@@ -81,14 +177,9 @@ class SkillValidationResult:
     location_type: str  # 'global' or 'project'
     version: str = "unknown"
     is_valid: bool = False
-    errors: List[ValidationIssue] = None
-    warnings: List[ValidationIssue] = None
-    infos: List[ValidationIssue] = None
-
-    def __post_init__(self):
-        self.errors = self.errors or []
-        self.warnings = self.warnings or []
-        self.infos = self.infos or []
+    errors: List[ValidationIssue] = field(default_factory=list)
+    warnings: List[ValidationIssue] = field(default_factory=list)
+    infos: List[ValidationIssue] = field(default_factory=list)
 
     @property
     def total_issues(self) -> int:
@@ -99,7 +190,7 @@ class SkillValidationResult:
         return len(self.errors) > 0
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ValidationReport:
     """Complete validation report."""
     total_skills: int
@@ -111,6 +202,50 @@ class ValidationReport:
     duration_seconds: float
 
 
+def _scan_skill_dirs(
+    base_dir: Path, location_type: str, skip_hidden: bool = False
+) -> List[Tuple[Path, str]]:
+    """
+    List (SKILL.md path, location_type) for each immediate subdirectory of
+    base_dir that contains a SKILL.md.
+
+    Uses os.scandir so the directory check comes from the dirent type rather
+    than a stat per entry; symlinked skill directories are still followed.
+    A missing base_dir yields no skills.
+    """
+    found: List[Tuple[Path, str]] = []
+    try:
+        with os.scandir(base_dir) as entries:
+            for entry in entries:
+                if skip_hidden and entry.name.startswith("."):
+                    continue
+                if not entry.is_dir():
+                    continue
+                skill_md = os.path.join(entry.path, "SKILL.md")
+                if os.path.isfile(skill_md):
+                    found.append((Path(skill_md), location_type))
+    except (FileNotFoundError, NotADirectoryError):
+        pass
+    return found
+
+
+def _file_identity(path: Path) -> object:
+    """
+    Key identifying the file behind path, however it was reached.
+
+    One stat() gives (st_dev, st_ino), which is cheaper than canonicalizing
+    the path with resolve(). Filesystems without inode numbers (st_ino == 0
+    on some Windows volumes) fall back to the normalized real path.
+    """
+    try:
+        st = os.stat(path)
+        if st.st_ino:
+            return (st.st_dev, st.st_ino)
+    except OSError:
+        pass
+    return os.path.normcase(os.path.realpath(path))
+
+
 def discover_skills() -> List[Tuple[Path, str]]:
     """
     Discover all skills in global and project-specific locations.
@@ -121,33 +256,19 @@ def discover_skills() -> List[Tuple[Path, str]]:
     skills: List[Tuple[Path, str]] = []
 
     # Global skills (~/.claude/skills/)
-    global_skills_dir = Path.home() / ".claude" / "skills"
-    if global_skills_dir.exists():
-        for skill_dir in global_skills_dir.iterdir():
-            if skill_dir.is_dir() and (skill_dir / "SKILL.md").exists():
-                skills.append((skill_dir / "SKILL.md", "global"))
+    skills.extend(_scan_skill_dirs(Path.home() / ".claude" / "skills", "global"))
 
     # Project-specific skills (./claude/skills/)
-    project_skills_dir = Path.cwd() / ".claude" / "skills"
-    if project_skills_dir.exists():
-        for skill_dir in project_skills_dir.iterdir():
-            if skill_dir.is_dir() and (skill_dir / "SKILL.md").exists():
-                skills.append((skill_dir / "SKILL.md", "project"))
+    skills.extend(_scan_skill_dirs(Path.cwd() / ".claude" / "skills", "project"))
 
     # Repo skills (./<skill>/SKILL.md) - useful when validating the sf-skills repo itself
-    for skill_dir in Path.cwd().iterdir():
-        if (
-            skill_dir.is_dir()
-            and not skill_dir.name.startswith(".")
-            and (skill_dir / "SKILL.md").exists()
-        ):
-            skills.append((skill_dir / "SKILL.md", "repo"))
+    skills.extend(_scan_skill_dirs(Path.cwd(), "repo", skip_hidden=True))
 
     # De-duplicate while preserving order
     unique: List[Tuple[Path, str]] = []
-    seen: set[str] = set()
+    seen: set = set()
     for skill_path, location_type in skills:
-        key = str(skill_path.resolve())
+        key = _file_identity(skill_path)
         if key not in seen:
             seen.add(key)
             unique.append((skill_path, location_type))
@@ -155,14 +276,14 @@ def discover_skills() -> List[Tuple[Path, str]]:
     return unique
 
 
-SF_SKILLS_V4_HOOK_EVENTS = {
+SF_SKILLS_V4_HOOK_EVENTS = frozenset({
     "SessionStart",
     "PreToolUse",
     "PostToolUse",
     "SubagentStop",
     "PermissionRequest",
     "UserPromptSubmit",
-}
+})
 
 
 def is_sf_skills_v4_frontmatter(data: dict) -> bool:
@@ -181,57 +302,86 @@ def find_plugin_root(start_dir: Path) -> Optional[Path]:
     - repo checkout (./shared/hooks)
     - installed layout (~/.claude/sf-skills/shared/hooks)
     """
-    current = start_dir.resolve()
-    while current != current.parent:
-        if (current / "shared" / "hooks").exists():
-            return current
-        current = current.parent
-    return None
+    root = _plugin_root_at_or_above(str(start_dir.resolve()))
+    return Path(root) if root else None
 
 
-def resolve_hook_path_token(token: str, skill_dir: Path, plugin_root: Optional[Path]) -> Optional[Path]:
+@lru_cache(maxsize=None)
+def _plugin_root_at_or_above(directory: str) -> Optional[str]:
     """
-    Resolve a single argv token that points to a hook file via placeholders.
+    Nearest directory at or above `directory` (resolved) holding shared/hooks.
+
+    Memoized per directory, so sibling skills share the walk above their
+    common parent and each ancestor is checked once per run.
+    """
+    parent = os.path.dirname(directory)
+    if parent == directory:
+        return None
+    if os.path.isdir(os.path.join(directory, "shared", "hooks")):
+        return directory
+    return _plugin_root_at_or_above(parent)
+
+
+def hook_path_placeholders(skill_dir: Path, plugin_root: Optional[Path]) -> Dict[str, str]:
+    """
+    Map each supported hook-path placeholder prefix to its base directory.
 
     Supports:
       - ${SHARED_HOOKS}/...
       - ${SKILL_HOOKS}/...
       - ${CLAUDE_PLUGIN_ROOT}/...
       - ${PLUGIN_ROOT}/... (legacy)
+
+    The plugin-root placeholders are only available when plugin_root is
+    known. Built once per skill and shared by all of its hook commands.
     """
+    skill_dir_str = str(skill_dir)
     placeholders = {
-        "${SKILL_HOOKS}/": skill_dir / "hooks" / "scripts",
-        "${CLAUDE_PLUGIN_ROOT}/": skill_dir,
+        "${SKILL_HOOKS}/": os.path.join(skill_dir_str, "hooks", "scripts"),
+        "${CLAUDE_PLUGIN_ROOT}/": skill_dir_str,
     }
 
     if plugin_root:
+        plugin_root_str = str(plugin_root)
         placeholders.update(
             {
-                "${SHARED_HOOKS}/": plugin_root / "shared" / "hooks",
-                "${PLUGIN_ROOT}/": plugin_root,
+                "${SHARED_HOOKS}/": os.path.join(plugin_root_str, "shared", "hooks"),
+                "${PLUGIN_ROOT}/": plugin_root_str,
             }
         )
 
+    return placeholders
+
+
+def resolve_hook_path_token(token: str, placeholders: Dict[str, str]) -> Optional[str]:
+    """
+    Resolve a single argv token that points to a hook file via placeholders.
+
+    Returns the path as a string, or None if the token uses no known
+    placeholder (see hook_path_placeholders()).
+    """
     for prefix, base_dir in placeholders.items():
         if token.startswith(prefix):
-            rel = token[len(prefix):]
-            return base_dir / rel
+            return os.path.join(base_dir, token[len(prefix):])
 
     return None
 
 
-def validate_hook_command_paths(
-    command: str, skill_dir: Path, plugin_root: Optional[Path]
-) -> List[Path]:
+def validate_hook_command_paths(command: str, placeholders: Dict[str, str]) -> List[str]:
     """
     Extract and resolve any placeholder-based file paths inside a hook command.
 
     Returns:
-        List of resolved Paths found in the command.
+        List of resolved paths found in the command.
     """
     import shlex
 
-    resolved: List[Path] = []
+    resolved: List[str] = []
+    # Every supported placeholder starts with "${"; without one there is
+    # nothing to resolve and no need to tokenize.
+    if "${" not in command:
+        return resolved
+
     try:
         tokens = shlex.split(command)
     except ValueError:
@@ -239,7 +389,9 @@ def validate_hook_command_paths(
         return resolved
 
     for token in tokens:
-        path = resolve_hook_path_token(token, skill_dir=skill_dir, plugin_root=plugin_root)
+        if not token.startswith("${"):
+            continue
+        path = resolve_hook_path_token(token, placeholders)
         if path is not None:
             resolved.append(path)
 
@@ -248,12 +400,13 @@ def validate_hook_command_paths(
 
 def validate_v4_hooks(hooks: object, result: SkillValidationResult, skill_dir: Path):
     """Validate sf-skills v4 hook frontmatter structure + referenced scripts."""
+    hooks_loc = f"{result.skill_path}:frontmatter:hooks"
     if hooks is None:
         result.warnings.append(
             ValidationIssue(
                 severity="warning",
                 message="No hooks defined in frontmatter",
-                location=f"{result.skill_path}:frontmatter:hooks",
+                location=hooks_loc,
             )
         )
         return
@@ -263,13 +416,15 @@ def validate_v4_hooks(hooks: object, result: SkillValidationResult, skill_dir: P
             ValidationIssue(
                 severity="error",
                 message="Invalid hooks - expected a mapping (YAML object)",
-                location=f"{result.skill_path}:frontmatter:hooks",
+                location=hooks_loc,
                 fix="Set hooks to a YAML mapping, e.g. hooks: { SessionStart: [...] }",
             )
         )
         return
 
-    plugin_root = find_plugin_root(skill_dir)
+    # Only placeholder paths in hook commands need the plugin root
+    plugin_root = find_plugin_root(skill_dir) if hooks else None
+    placeholders = hook_path_placeholders(skill_dir, plugin_root)
 
     for event_name, steps in hooks.items():
         if event_name not in SF_SKILLS_V4_HOOK_EVENTS:
@@ -277,7 +432,7 @@ def validate_v4_hooks(hooks: object, result: SkillValidationResult, skill_dir: P
                 ValidationIssue(
                     severity="warning",
                     message=f"Unknown hook event '{event_name}'",
-                    location=f"{result.skill_path}:frontmatter:hooks",
+                    location=hooks_loc,
                 )
             )
 
@@ -286,14 +441,14 @@ def validate_v4_hooks(hooks: object, result: SkillValidationResult, skill_dir: P
                 ValidationIssue(
                     severity="error",
                     message=f"Invalid hooks.{event_name} - expected a list",
-                    location=f"{result.skill_path}:frontmatter:hooks:{event_name}",
+                    location=f"{hooks_loc}:{event_name}",
                     fix="Define hooks for an event as a YAML list",
                 )
             )
             continue
 
         for i, step in enumerate(steps):
-            location_prefix = f"{result.skill_path}:frontmatter:hooks:{event_name}[{i}]"
+            location_prefix = f"{hooks_loc}:{event_name}[{i}]"
 
             if not isinstance(step, dict):
                 result.errors.append(
@@ -306,8 +461,9 @@ def validate_v4_hooks(hooks: object, result: SkillValidationResult, skill_dir: P
                 continue
 
             # Matcher-based step (PreToolUse/PostToolUse)
-            if "matcher" in step:
-                matcher = step.get("matcher")
+            has_matcher = "matcher" in step
+            if has_matcher:
+                matcher = step["matcher"]
                 nested = step.get("hooks")
                 if not isinstance(matcher, str) or not matcher.strip():
                     result.errors.append(
@@ -334,25 +490,34 @@ def validate_v4_hooks(hooks: object, result: SkillValidationResult, skill_dir: P
                         action=action,
                         location=action_loc,
                         result=result,
-                        skill_dir=skill_dir,
-                        plugin_root=plugin_root,
+                        placeholders=placeholders,
                     )
             else:
                 _validate_v4_hook_action(
                     action=step,
                     location=location_prefix,
                     result=result,
-                    skill_dir=skill_dir,
-                    plugin_root=plugin_root,
+                    placeholders=placeholders,
                 )
 
 
+@lru_cache(maxsize=4096)
+def _path_exists_cached(path: str) -> bool:
+    """
+    os.path.exists, memoized for the current run.
+
+    Hook commands across skills mostly point at the same ${SHARED_HOOKS}
+    scripts, so each is stat'd once; validate_skills() clears the cache so
+    every run sees the filesystem fresh.
+    """
+    return os.path.exists(path)
+
+
 def _validate_v4_hook_action(
     action: object,
     location: str,
     result: SkillValidationResult,
-    skill_dir: Path,
-    plugin_root: Optional[Path],
+    placeholders: Dict[str, str],
 ):
     """Validate a single hook action object for sf-skills v4 schema."""
     if not isinstance(action, dict):
@@ -412,9 +577,9 @@ def _validate_v4_hook_action(
 
     # Best-effort check that referenced scripts exist.
     # Only validates placeholder-based paths (SHARED_HOOKS/SKILL_HOOKS/etc).
-    resolved_paths = validate_hook_command_paths(command, skill_dir=skill_dir, plugin_root=plugin_root)
+    resolved_paths = validate_hook_command_paths(command, placeholders)
     for path in resolved_paths:
-        if not path.exists():
+        if not _path_exists_cached(path):
             result.errors.append(
                 ValidationIssue(
                     severity="error",
@@ -426,29 +591,76 @@ def _validate_v4_hook_action(
 
 
 def extract_frontmatter(file_path: Path) -> Tuple[str, str]:
-    """Extract YAML frontmatter from SKILL.md file."""
-    with open(file_path, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
-
-    delimiter_indices = []
-    for i, line in enumerate(lines):
-        if line.strip() == '---':
-            delimiter_indices.append(i)
-            if len(delimiter_indices) == 2:
-                break
+    """
+    Extract YAML frontmatter from SKILL.md file.
 
-    if len(delimiter_indices) < 2:
-        return "", "".join(lines)
+    Returns (yaml_content, content): the text between the first two `---`
+    lines and the text after the second, or ("", whole file) if there are
+    fewer than two. The file is read once as bytes and only the two slices
+    are decoded.
+    """
+    with open(file_path, 'rb') as f:
+        raw = f.read()
 
-    yaml_lines = lines[delimiter_indices[0] + 1:delimiter_indices[1]]
-    yaml_content = "".join(yaml_lines)
+    first = _FRONTMATTER_DELIM_RE.search(raw)
+    second = first and _FRONTMATTER_DELIM_RE.search(raw, first.end() + 1)
+    if not second:
+        return "", raw.decode('utf-8')
 
-    content_lines = lines[delimiter_indices[1] + 1:]
-    content = "".join(content_lines)
+    yaml_content = raw[first.end() + 1:second.start()].decode('utf-8')
+    content = raw[second.end() + 1:].decode('utf-8')
 
     return yaml_content, content
 
 
+def read_frontmatter(file_path: Path) -> Tuple[str, bool]:
+    """
+    Read only as much of SKILL.md as validation needs.
+
+    Returns (yaml_content, has_content): the frontmatter text, as in
+    extract_frontmatter(), and whether anything but whitespace follows it.
+    The file is read in chunks and reading stops at the first non-blank
+    body text, so long bodies are never loaded.
+    """
+    buf = b""
+    with open(file_path, 'rb') as f:
+        while True:
+            chunk = f.read(_FRONTMATTER_READ_CHUNK)
+            buf += chunk
+            delims = _complete_delimiters(buf, at_eof=not chunk)
+            if len(delims) == 2:
+                break
+            if not chunk:
+                return "", False
+
+        first, second = delims
+        yaml_content = buf[first.end() + 1:second.start()].decode('utf-8')
+
+        body = buf[second.end() + 1:]
+        while True:
+            if body.decode('utf-8', errors='ignore').strip():
+                return yaml_content, True
+            chunk = f.read(_FRONTMATTER_READ_CHUNK)
+            if not chunk:
+                return yaml_content, False
+            body += chunk
+
+
+def _complete_delimiters(buf: bytes, at_eof: bool) -> List[re.Match]:
+    """
+    First two frontmatter delimiter matches in buf, skipping a match that
+    runs into the end of a partial read (the line may continue).
+    """
+    delims = []
+    for match in _FRONTMATTER_DELIM_RE.finditer(buf):
+        if match.end() == len(buf) and not at_eof:
+            break
+        delims.append(match)
+        if len(delims) == 2:
+            break
+    return delims
+
+
 def validate_single_skill(skill_path: Path, location_type: str) -> SkillValidationResult:
     """
     Validate a single skill file.
@@ -456,24 +668,27 @@ def validate_single_skill(skill_path: Path, location_type: str) -> SkillValidati
     Returns:
         SkillValidationResult with all findings
     """
+    _load_yaml_module()
     if location_type == "codex-export":
         return validate_single_codex_export_skill(skill_path)
 
     skill_name = skill_path.parent.name
+    skill_loc = str(skill_path)
+    frontmatter_loc = f"{skill_loc}:frontmatter"
     result = SkillValidationResult(
         skill_name=skill_name,
         skill_path=skill_path,
         location_type=location_type
     )
 
-    # Extract frontmatter
+    # Extract frontmatter; only the body's emptiness matters here
     try:
-        yaml_content, content = extract_frontmatter(skill_path)
+        yaml_content, has_content = read_frontmatter(skill_path)
     except Exception as e:
         result.errors.append(ValidationIssue(
             severity='error',
             message=f"Failed to read skill file: {e}",
-            location=str(skill_path)
+            location=skill_loc
         ))
         return result
 
@@ -481,19 +696,19 @@ def validate_single_skill(skill_path: Path, location_type: str) -> SkillValidati
         result.errors.append(ValidationIssue(
             severity='error',
             message="No YAML frontmatter found",
-            location=str(skill_path),
+            location=skill_loc,
             fix="Add YAML frontmatter between --- delimiters"
         ))
         return result
 
     # Parse YAML
     try:
-        data = yaml.safe_load(yaml_content)
+        data = yaml.load(yaml_content, Loader=_YamlLoader)
     except yaml.YAMLError as e:
         result.errors.append(ValidationIssue(
             severity='error',
             message=f"Invalid YAML syntax: {e}",
-            location=str(skill_path),
+            location=skill_loc,
             fix="Fix YAML syntax errors"
         ))
         return result
@@ -503,7 +718,7 @@ def validate_single_skill(skill_path: Path, location_type: str) -> SkillValidati
             ValidationIssue(
                 severity="error",
                 message="Invalid YAML frontmatter - expected a mapping (YAML object)",
-                location=f"{skill_path}:frontmatter",
+                location=frontmatter_loc,
             )
         )
         return result
@@ -518,19 +733,17 @@ def validate_single_skill(skill_path: Path, location_type: str) -> SkillValidati
             ValidationIssue(
                 severity="error",
                 message="Missing required field: 'name'",
-                location=f"{skill_path}:frontmatter",
+                location=frontmatter_loc,
                 fix="Add name: <kebab-case-skill-name> to YAML frontmatter",
             )
         )
     else:
-        import re
-
-        if not re.match(r"^[a-z][a-z0-9]*(-[a-z0-9]+)*$", str(name)):
+        if not _is_kebab_case(str(name)):
             result.errors.append(
                 ValidationIssue(
                     severity="error",
                     message=f"Invalid skill name '{name}' - must be kebab-case",
-                    location=f"{skill_path}:frontmatter:name",
+                    location=f"{frontmatter_loc}:name",
                     fix="Use lowercase letters, numbers, and hyphens only (e.g., 'my-skill')",
                 )
             )
@@ -539,7 +752,7 @@ def validate_single_skill(skill_path: Path, location_type: str) -> SkillValidati
                 ValidationIssue(
                     severity="warning",
                     message=f"Skill name '{name}' does not match directory '{skill_name}'",
-                    location=f"{skill_path}:frontmatter:name",
+                    location=f"{frontmatter_loc}:name",
                 )
             )
 
@@ -552,7 +765,7 @@ def validate_single_skill(skill_path: Path, location_type: str) -> SkillValidati
                     ValidationIssue(
                         severity="error",
                         message=f"Missing required field: '{field}'",
-                        location=f"{skill_path}:frontmatter",
+                        location=frontmatter_loc,
                     )
                 )
 
@@ -562,7 +775,7 @@ def validate_single_skill(skill_path: Path, location_type: str) -> SkillValidati
                 ValidationIssue(
                     severity="error",
                     message="Invalid metadata - expected a mapping (YAML object)",
-                    location=f"{skill_path}:frontmatter:metadata",
+                    location=f"{frontmatter_loc}:metadata",
                 )
             )
         else:
@@ -570,14 +783,12 @@ def validate_single_skill(skill_path: Path, location_type: str) -> SkillValidati
             if version:
                 version_str = str(version)
                 result.version = version_str
-                import re
-
-                if not re.match(r"^\d+\.\d+\.\d+$", version_str):
+                if not _SEMVER_RE.match(version_str):
                     result.errors.append(
                         ValidationIssue(
                             severity="error",
                             message=f"Invalid metadata.version '{version_str}' - must be semver (X.Y.Z)",
-                            location=f"{skill_path}:frontmatter:metadata:version",
+                            location=f"{frontmatter_loc}:metadata:version",
                             fix="Use semantic versioning format (e.g., '1.0.0')",
                         )
                     )
@@ -586,7 +797,7 @@ def validate_single_skill(skill_path: Path, location_type: str) -> SkillValidati
                     ValidationIssue(
                         severity="error",
                         message="Missing required field: metadata.version",
-                        location=f"{skill_path}:frontmatter:metadata",
+                        location=f"{frontmatter_loc}:metadata",
                         fix="Add metadata: { version: \"1.0.0\" }",
                     )
                 )
@@ -596,7 +807,7 @@ def validate_single_skill(skill_path: Path, location_type: str) -> SkillValidati
                     ValidationIssue(
                         severity="info",
                         message="Consider adding metadata.author for attribution",
-                        location=f"{skill_path}:frontmatter:metadata",
+                        location=f"{frontmatter_loc}:metadata",
                     )
                 )
 
@@ -612,7 +823,7 @@ def validate_single_skill(skill_path: Path, location_type: str) -> SkillValidati
                     ValidationIssue(
                         severity="error",
                         message=f"Missing required field: '{field}'",
-                        location=f"{skill_path}:frontmatter",
+                        location=frontmatter_loc,
                         fix=f"Add '{field}' field to YAML frontmatter",
                     )
                 )
@@ -623,15 +834,13 @@ def validate_single_skill(skill_path: Path, location_type: str) -> SkillValidati
 
         # Validate version format (semver)
         if "version" in data:
-            import re
-
             version = str(data["version"])
-            if not re.match(r"^\d+\.\d+\.\d+$", version):
+            if not _SEMVER_RE.match(version):
                 result.errors.append(
                     ValidationIssue(
                         severity="error",
                         message=f"Invalid version '{version}' - must be semver (X.Y.Z)",
-                        location=f"{skill_path}:version",
+                        location=f"{skill_loc}:version",
                         fix="Use semantic versioning format (e.g., '1.0.0')",
                     )
                 )
@@ -641,14 +850,15 @@ def validate_single_skill(skill_path: Path, location_type: str) -> SkillValidati
             allowed_tools = data["allowed-tools"]
             if allowed_tools:
                 for tool in allowed_tools:
-                    if tool not in VALID_TOOLS:
-                        correct_case = next((t for t in VALID_TOOLS if t.lower() == str(tool).lower()), None)
+                    # YAML can yield non-hashable entries (e.g. a mapping)
+                    if not isinstance(tool, str) or tool not in _VALID_TOOLS_SET:
+                        correct_case = _TOOLS_LOWER.get(str(tool).lower())
                         if correct_case:
                             result.errors.append(
                                 ValidationIssue(
                                     severity="error",
                                     message=f"Invalid tool '{tool}' - should be '{correct_case}' (case-sensitive)",
-                                    location=f"{skill_path}:allowed-tools",
+                                    location=f"{skill_loc}:allowed-tools",
                                     fix=f"Change '{tool}' to '{correct_case}'",
                                 )
                             )
@@ -657,7 +867,7 @@ def validate_single_skill(skill_path: Path, location_type: str) -> SkillValidati
                                 ValidationIssue(
                                     severity="error",
                                     message=f"Unknown tool '{tool}'",
-                                    location=f"{skill_path}:allowed-tools",
+                                    location=f"{skill_loc}:allowed-tools",
                                     fix=f"Remove '{tool}' or check valid tool names",
                                 )
                             )
@@ -666,7 +876,7 @@ def validate_single_skill(skill_path: Path, location_type: str) -> SkillValidati
                     ValidationIssue(
                         severity="warning",
                         message="No allowed-tools specified - skill may not be functional",
-                        location=f"{skill_path}:allowed-tools",
+                        location=f"{skill_loc}:allowed-tools",
                     )
                 )
         else:
@@ -674,16 +884,16 @@ def validate_single_skill(skill_path: Path, location_type: str) -> SkillValidati
                 ValidationIssue(
                     severity="warning",
                     message="No allowed-tools field - skill may not be functional",
-                    location=f"{skill_path}:frontmatter",
+                    location=frontmatter_loc,
                 )
             )
 
     # Check for content
-    if not content.strip():
+    if not has_content:
         result.errors.append(ValidationIssue(
             severity='error',
             message="No content found after YAML frontmatter",
-            location=str(skill_path),
+            location=skill_loc,
             fix="Add skill instructions, workflow, and examples"
         ))
 
@@ -694,7 +904,7 @@ def validate_single_skill(skill_path: Path, location_type: str) -> SkillValidati
                 ValidationIssue(
                     severity="info",
                     message="Consider adding 'author' field for attribution",
-                    location=f"{skill_path}:frontmatter",
+                    location=frontmatter_loc,
                 )
             )
 
@@ -703,7 +913,7 @@ def validate_single_skill(skill_path: Path, location_type: str) -> SkillValidati
                 ValidationIssue(
                     severity="info",
                     message="Consider adding 'tags' for categorization",
-                    location=f"{skill_path}:frontmatter",
+                    location=frontmatter_loc,
                 )
             )
 
@@ -712,7 +922,7 @@ def validate_single_skill(skill_path: Path, location_type: str) -> SkillValidati
                 ValidationIssue(
                     severity="info",
                     message="Consider adding 'examples' to help users",
-                    location=f"{skill_path}:frontmatter",
+                    location=frontmatter_loc,
                 )
             )
 
@@ -723,9 +933,7 @@ def validate_single_skill(skill_path: Path, location_type: str) -> SkillValidati
 
 
 def _is_kebab_case(name: str) -> bool:
-    import re
-
-    return bool(re.match(r"^[a-z][a-z0-9]*(-[a-z0-9]+)*$", str(name)))
+    return bool(_KEBAB_RE.match(str(name)))
 
 
 def validate_single_codex_export_skill(skill_path: Path) -> SkillValidationResult:
@@ -738,7 +946,10 @@ def validate_single_codex_export_skill(skill_path: Path) -> SkillValidationResul
       - agents/openai.yaml should exist (recommended for Codex UX)
       - No ~/.claude paths or ${SHARED_HOOKS}/${SKILL_HOOKS} placeholders should remain
     """
+    _load_yaml_module()
     skill_name = skill_path.parent.name
+    skill_loc = str(skill_path)
+    frontmatter_loc = f"{skill_loc}:frontmatter"
     result = SkillValidationResult(
         skill_name=skill_name,
         skill_path=skill_path,
@@ -752,7 +963,7 @@ def validate_single_codex_export_skill(skill_path: Path) -> SkillValidationResul
             ValidationIssue(
                 severity="error",
                 message=f"Failed to read skill file: {e}",
-                location=str(skill_path),
+                location=skill_loc,
             )
         )
         return result
@@ -762,20 +973,20 @@ def validate_single_codex_export_skill(skill_path: Path) -> SkillValidationResul
             ValidationIssue(
                 severity="error",
                 message="No YAML frontmatter found",
-                location=str(skill_path),
+                location=skill_loc,
                 fix="Add YAML frontmatter between --- delimiters",
             )
         )
         return result
 
     try:
-        data = yaml.safe_load(yaml_content)
+        data = yaml.load(yaml_content, Loader=_YamlLoader)
     except yaml.YAMLError as e:
         result.errors.append(
             ValidationIssue(
                 severity="error",
                 message=f"Invalid YAML syntax: {e}",
-                location=str(skill_path),
+                location=skill_loc,
             )
         )
         return result
@@ -785,18 +996,18 @@ def validate_single_codex_export_skill(skill_path: Path) -> SkillValidationResul
             ValidationIssue(
                 severity="error",
                 message="Invalid YAML frontmatter - expected a mapping (YAML object)",
-                location=f"{skill_path}:frontmatter",
+                location=frontmatter_loc,
             )
         )
         return result
 
-    unexpected_fields = set(data.keys()) - CODEX_ALLOWED_FRONTMATTER_FIELDS
+    unexpected_fields = data.keys() - CODEX_ALLOWED_FRONTMATTER_FIELDS
     if unexpected_fields:
         result.errors.append(
             ValidationIssue(
                 severity="error",
                 message=f"Unexpected frontmatter fields for Codex export: {', '.join(sorted(unexpected_fields))}",
-                location=f"{skill_path}:frontmatter",
+                location=frontmatter_loc,
                 fix=f"Remove fields not in {sorted(CODEX_ALLOWED_FRONTMATTER_FIELDS)}",
             )
         )
@@ -806,7 +1017,7 @@ def validate_single_codex_export_skill(skill_path: Path) -> SkillValidationResul
             ValidationIssue(
                 severity="error",
                 message="Frontmatter must not include hooks in Codex export",
-                location=f"{skill_path}:frontmatter:hooks",
+                location=f"{frontmatter_loc}:hooks",
                 fix="Remove hooks from frontmatter and document manual validations in the body",
             )
         )
@@ -817,7 +1028,7 @@ def validate_single_codex_export_skill(skill_path: Path) -> SkillValidationResul
             ValidationIssue(
                 severity="error",
                 message="Missing required field: 'name'",
-                location=f"{skill_path}:frontmatter",
+                location=frontmatter_loc,
             )
         )
     else:
@@ -826,7 +1037,7 @@ def validate_single_codex_export_skill(skill_path: Path) -> SkillValidationResul
                 ValidationIssue(
                     severity="error",
                     message=f"Invalid skill name '{name}' - must be kebab-case",
-                    location=f"{skill_path}:frontmatter:name",
+                    location=f"{frontmatter_loc}:name",
                 )
             )
         elif str(name) != skill_name:
@@ -834,7 +1045,7 @@ def validate_single_codex_export_skill(skill_path: Path) -> SkillValidationResul
                 ValidationIssue(
                     severity="error",
                     message=f"Skill name '{name}' does not match directory '{skill_name}'",
-                    location=f"{skill_path}:frontmatter:name",
+                    location=f"{frontmatter_loc}:name",
                 )
             )
 
@@ -843,7 +1054,7 @@ def validate_single_codex_export_skill(skill_path: Path) -> SkillValidationResul
             ValidationIssue(
                 severity="error",
                 message="Missing required field: 'description'",
-                location=f"{skill_path}:frontmatter",
+                location=frontmatter_loc,
             )
         )
 
@@ -853,7 +1064,7 @@ def validate_single_codex_export_skill(skill_path: Path) -> SkillValidationResul
             ValidationIssue(
                 severity="error",
                 message="Invalid metadata - expected a mapping (YAML object)",
-                location=f"{skill_path}:frontmatter:metadata",
+                location=f"{frontmatter_loc}:metadata",
             )
         )
     elif isinstance(metadata, dict):
@@ -866,7 +1077,7 @@ def validate_single_codex_export_skill(skill_path: Path) -> SkillValidationResul
                 ValidationIssue(
                     severity="warning",
                     message="metadata.short-description missing (recommended for Codex)",
-                    location=f"{skill_path}:frontmatter:metadata",
+                    location=f"{frontmatter_loc}:metadata",
                 )
             )
 
@@ -875,30 +1086,42 @@ def validate_single_codex_export_skill(skill_path: Path) -> SkillValidationResul
             ValidationIssue(
                 severity="error",
                 message="No content found after YAML frontmatter",
-                location=str(skill_path),
+                location=skill_loc,
             )
         )
 
     # Content portability checks
-    portability_errors = [
-        ("~/.claude", "Replace Claude install paths with $CODEX_HOME/skills/..."),
-        ("${SHARED_HOOKS}", "Remove placeholders and use $SHARED_DIR/..."),
-        ("${SKILL_HOOKS}", "Remove placeholders and use $SKILL_DIR/..."),
-    ]
-    for token, fix in portability_errors:
+    for token, fix in CODEX_PORTABILITY_TOKENS:
         if token in content:
             result.errors.append(
                 ValidationIssue(
                     severity="error",
                     message=f"Found non-portable token in body: {token}",
-                    location=str(skill_path),
+                    location=skill_loc,
                     fix=fix,
                 )
             )
 
     # Codex metadata file
+    # One stat (inside _load_yaml_cached) serves as both the existence
+    # check and the cache key
     openai_yaml = skill_path.parent / "agents" / "openai.yaml"
-    if not openai_yaml.exists():
+    openai_missing = False
+    try:
+        openai_data = _load_yaml_cached(openai_yaml)
+    except FileNotFoundError:
+        openai_missing = True
+    except yaml.YAMLError as e:
+        result.errors.append(
+            ValidationIssue(
+                severity="error",
+                message=f"Invalid YAML in agents/openai.yaml: {e}",
+                location=str(openai_yaml),
+            )
+        )
+        openai_data = None
+
+    if openai_missing:
         result.errors.append(
             ValidationIssue(
                 severity="error",
@@ -908,17 +1131,6 @@ def validate_single_codex_export_skill(skill_path: Path) -> SkillValidationResul
             )
         )
     else:
-        try:
-            openai_data = yaml.safe_load(openai_yaml.read_text())
-        except yaml.YAMLError as e:
-            result.errors.append(
-                ValidationIssue(
-                    severity="error",
-                    message=f"Invalid YAML in agents/openai.yaml: {e}",
-                    location=str(openai_yaml),
-                )
-            )
-            openai_data = None
 
         if openai_data is not None and not isinstance(openai_data, dict):
             result.errors.append(
@@ -950,7 +1162,47 @@ def validate_single_codex_export_skill(skill_path: Path) -> SkillValidationResul
     return result
 
 
-def validate_all_skills(parallel: bool = True) -> ValidationReport:
+# Validation is mostly file reads and YAML parsing, so size the pool for I/O
+# concurrency rather than CPU count.
+VALIDATION_MAX_WORKERS = min(32, (os.cpu_count() or 4) * 4)
+
+
+def validate_skills(
+    skills: List[Tuple[Path, str]],
+    parallel: bool = True,
+    max_workers: Optional[int] = None,
+) -> List[SkillValidationResult]:
+    """
+    Validate each (skill_path, location_type) pair.
+
+    Results are returned in the order of `skills`, whether or not the
+    validation ran in parallel. A skill whose validator raises is reported
+    on stdout and left out of the results. max_workers defaults to
+    VALIDATION_MAX_WORKERS.
+    """
+    _load_yaml_module()
+    _path_exists_cached.cache_clear()
+    if not (parallel and len(skills) > 1):
+        return [validate_single_skill(path, loc_type) for path, loc_type in skills]
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    results = []
+    workers = min(max_workers or VALIDATION_MAX_WORKERS, len(skills))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(validate_single_skill, path, loc_type): path
+            for path, loc_type in skills
+        }
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                print(f"Error validating {futures[future]}: {e}")
+    return results
+
+
+def validate_all_skills(parallel: bool = True, max_workers: Optional[int] = None) -> ValidationReport:
     """
     Validate all discovered skills.
 
@@ -960,28 +1212,7 @@ def validate_all_skills(parallel: bool = True) -> ValidationReport:
     start_time = datetime.now()
 
     skills = discover_skills()
-    results = []
-
-    if parallel and len(skills) > 1:
-        # Parallel validation
-        with ThreadPoolExecutor(max_workers=4) as executor:
-            futures = {
-                executor.submit(validate_single_skill, path, loc_type): (path, loc_type)
-                for path, loc_type in skills
-            }
-
-            for future in as_completed(futures):
-                try:
-                    result = future.result()
-                    results.append(result)
-                except Exception as e:
-                    path, loc_type = futures[future]
-                    print(f"Error validating {path}: {e}")
-    else:
-        # Sequential validation
-        for skill_path, loc_type in skills:
-            result = validate_single_skill(skill_path, loc_type)
-            results.append(result)
+    results = validate_skills(skills, parallel=parallel, max_workers=max_workers)
 
     end_time = datetime.now()
     duration = (end_time - start_time).total_seconds()
@@ -1004,69 +1235,82 @@ def validate_all_skills(parallel: bool = True) -> ValidationReport:
 
 def generate_console_report(report: ValidationReport, errors_only: bool = False):
     """Generate and print console report."""
-    print(f"{Colors.MAGENTA}{Colors.BOLD}╔══════════════════════════════════════════════════════════╗{Colors.NC}")
-    print(f"{Colors.MAGENTA}{Colors.BOLD}║     Claude Code Skills - Bulk Validation Report         ║{Colors.NC}")
-    print(f"{Colors.MAGENTA}{Colors.BOLD}╚══════════════════════════════════════════════════════════╝{Colors.NC}\n")
+    # Built in memory and written once, rather than one print() per line
+    buf = io.StringIO()
+    w = buf.write
+
+    w(f"{Colors.MAGENTA}{Colors.BOLD}╔══════════════════════════════════════════════════════════╗{Colors.NC}\n")
+    w(f"{Colors.MAGENTA}{Colors.BOLD}║     Claude Code Skills - Bulk Validation Report         ║{Colors.NC}\n")
+    w(f"{Colors.MAGENTA}{Colors.BOLD}╚══════════════════════════════════════════════════════════╝{Colors.NC}\n\n")
 
     # Summary
-    print(f"{Colors.BOLD}📊 Summary:{Colors.NC}")
-    print(f"   Total Skills: {report.total_skills}")
-    print(f"   {Colors.GREEN}✓ Valid: {report.valid_skills} ({report.valid_skills*100//max(report.total_skills,1)}%){Colors.NC}")
+    w(f"{Colors.BOLD}📊 Summary:{Colors.NC}\n")
+    w(f"   Total Skills: {report.total_skills}\n")
+    w(f"   {Colors.GREEN}✓ Valid: {report.valid_skills} ({report.valid_skills*100//max(report.total_skills,1)}%){Colors.NC}\n")
 
     if report.skills_with_warnings > 0:
-        print(f"   {Colors.YELLOW}⚠️  Warnings: {report.skills_with_warnings} ({report.skills_with_warnings*100//max(report.total_skills,1)}%){Colors.NC}")
+        w(f"   {Colors.YELLOW}⚠️  Warnings: {report.skills_with_warnings} ({report.skills_with_warnings*100//max(report.total_skills,1)}%){Colors.NC}\n")
 
     if report.skills_with_errors > 0:
-        print(f"   {Colors.RED}❌ Errors: {report.skills_with_errors} ({report.skills_with_errors*100//max(report.total_skills,1)}%){Colors.NC}")
-
-    print(f"   Duration: {report.duration_seconds:.2f}s\n")
+        w(f"   {Colors.RED}❌ Errors: {report.skills_with_errors} ({report.skills_with_errors*100//max(report.total_skills,1)}%){Colors.NC}\n")
+
+    w(f"   Duration: {report.duration_seconds:.2f}s\n\n")
+
+    # Bucket results and count recommendation inputs in one pass
+    error_results = []
+    warning_results = []
+    unknown_versions = 0
+    missing_hooks = 0
+    for r in report.results:
+        if r.has_errors:
+            error_results.append(r)
+        elif r.warnings:
+            warning_results.append(r)
+        if not r.version or r.version == "unknown":
+            unknown_versions += 1
+        if any("No hooks defined in frontmatter" in warning.message for warning in r.warnings):
+            missing_hooks += 1
 
     # Critical issues
-    error_results = [r for r in report.results if r.has_errors]
     if error_results:
-        print(f"{Colors.RED}{Colors.BOLD}🔴 Critical Issues ({len(error_results)}):{Colors.NC}")
+        w(f"{Colors.RED}{Colors.BOLD}🔴 Critical Issues ({len(error_results)}):{Colors.NC}\n")
         for result in error_results:
-            print(f"\n   {Colors.BOLD}└─ {result.skill_name}{Colors.NC} (v{result.version}) [{result.location_type}]")
+            w(f"\n   {_SKILL_BRANCH}{result.skill_name}{Colors.NC} (v{result.version}) [{result.location_type}]\n")
             for error in result.errors[:3]:  # Show first 3 errors
-                print(f"      {Colors.RED}❌{Colors.NC} {error.message}")
+                w(f"      {_ERROR_MARK} {error.message}\n")
                 if error.fix:
-                    print(f"         {Colors.CYAN}Fix:{Colors.NC} {error.fix}")
+                    w(f"         {_FIX_LABEL} {error.fix}\n")
             if len(result.errors) > 3:
-                print(f"      ... and {len(result.errors) - 3} more errors")
+                w(f"      ... and {len(result.errors) - 3} more errors\n")
 
     if not errors_only:
         # Warnings
-        warning_results = [r for r in report.results if len(r.warnings) > 0 and not r.has_errors]
         if warning_results:
-            print(f"\n{Colors.YELLOW}{Colors.BOLD}⚠️  Warnings ({len(warning_results)}):{Colors.NC}")
+            w(f"\n{Colors.YELLOW}{Colors.BOLD}⚠️  Warnings ({len(warning_results)}):{Colors.NC}\n")
             for result in warning_results[:5]:  # Show first 5
-                print(f"\n   {Colors.BOLD}└─ {result.skill_name}{Colors.NC} (v{result.version})")
+                w(f"\n   {_SKILL_BRANCH}{result.skill_name}{Colors.NC} (v{result.version})\n")
                 for warning in result.warnings[:2]:
-                    print(f"      {Colors.YELLOW}⚠️ {Colors.NC} {warning.message}")
+                    w(f"      {_WARNING_MARK} {warning.message}\n")
             if len(warning_results) > 5:
-                print(f"\n   ... and {len(warning_results) - 5} more skills with warnings")
+                w(f"\n   ... and {len(warning_results) - 5} more skills with warnings\n")
 
     # Recommendations
-    print(f"\n{Colors.CYAN}{Colors.BOLD}💡 Recommendations:{Colors.NC}")
+    w(f"\n{Colors.CYAN}{Colors.BOLD}💡 Recommendations:{Colors.NC}\n")
 
-    unknown_versions = sum(1 for r in report.results if not r.version or r.version == "unknown")
     if unknown_versions > 0:
-        print(f"   • {unknown_versions} skill(s) missing a detectable version - add metadata.version (sf-skills v4) or version (legacy)")
+        w(f"   • {unknown_versions} skill(s) missing a detectable version - add metadata.version (sf-skills v4) or version (legacy)\n")
 
-    missing_hooks = sum(
-        1
-        for r in report.results
-        if any("No hooks defined in frontmatter" in w.message for w in r.warnings)
-    )
     if missing_hooks > 0:
-        print(f"   • {missing_hooks} skill(s) without hooks - add frontmatter hooks to enable auto-validation")
+        w(f"   • {missing_hooks} skill(s) without hooks - add frontmatter hooks to enable auto-validation\n")
 
     if report.skills_with_errors > 0:
-        print(f"   • Fix {report.skills_with_errors} critical issues to ensure skills load correctly")
-        print(f"   • Run with --auto-fix to automatically fix common issues")
+        w(f"   • Fix {report.skills_with_errors} critical issues to ensure skills load correctly\n")
+        w(f"   • Run with --auto-fix to automatically fix common issues\n")
 
     if not errors_only and report.skills_with_warnings > 0:
-        print(f"   • Review {report.skills_with_warnings} warnings for potential improvements")
+        w(f"   • Review {report.skills_with_warnings} warnings for potential improvements\n")
+
+    sys.stdout.write(buf.getvalue())
 
 
 def generate_json_report(report: ValidationReport) -> str:
@@ -1096,7 +1340,7 @@ def generate_json_report(report: ValidationReport) -> str:
         }
         report_dict['results'].append(result_dict)
 
-    return json.dumps(report_dict, indent=2)
+    return _json_dumps(report_dict)
 
 
 def main():
@@ -1117,6 +1361,9 @@ Examples:
 
   # Sequential validation (no parallel)
   %(prog)s --no-parallel
+
+  # More concurrent reads (e.g. skills on a network filesystem)
+  %(prog)s --workers 64
         '''
     )
 
@@ -1139,6 +1386,13 @@ Examples:
         help='Disable parallel validation'
     )
 
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=None,
+        help=f'Parallel validation threads (default: {VALIDATION_MAX_WORKERS})'
+    )
+
     parser.add_argument(
         '--auto-fix',
         action='store_true',
@@ -1179,22 +1433,9 @@ Examples:
         # Reuse report builder but with our custom skill list
         # (keeps output format identical)
         start_time = datetime.now()
-        results = []
-        if (not args.no_parallel) and len(skills) > 1:
-            with ThreadPoolExecutor(max_workers=4) as executor:
-                futures = {
-                    executor.submit(validate_single_skill, path, loc_type): (path, loc_type)
-                    for path, loc_type in skills
-                }
-                for future in as_completed(futures):
-                    try:
-                        results.append(future.result())
-                    except Exception as e:
-                        path, _ = futures[future]
-                        print(f"Error validating {path}: {e}")
-        else:
-            for skill_path, loc_type in skills:
-                results.append(validate_single_skill(skill_path, loc_type))
+        results = validate_skills(
+            skills, parallel=not args.no_parallel, max_workers=args.workers
+        )
 
         duration = (datetime.now() - start_time).total_seconds()
         valid_skills = sum(1 for r in results if r.is_valid)
@@ -1211,11 +1452,19 @@ Examples:
             duration_seconds=duration,
         )
     else:
-        report = validate_all_skills(parallel=not args.no_parallel)
+        report = validate_all_skills(parallel=not args.no_parallel, max_workers=args.workers)
 
     # Generate report
     if args.format == 'json':
-        print(generate_json_report(report))
+        output = generate_json_report(report) + '\n'
+        stdout_buffer = getattr(sys.stdout, 'buffer', None)
+        if stdout_buffer is None:
+            print(output, end='')
+        else:
+            # UTF-8 regardless of the locale, as the report is not ASCII-escaped
+            sys.stdout.flush()
+            stdout_buffer.write(output.encode('utf-8'))
+            stdout_buffer.flush()
     else:
         generate_console_report(report, errors_only=args.errors_only)
 
@@ -34,6 +34,7 @@ Usage:
 """
 
 import json
+import threading
 import time
 from pathlib import Path
 from typing import Iterator, Dict, Any, Optional, List
@@ -53,6 +54,7 @@ DEFAULT_BATCH_SIZE = 2000
 DEFAULT_TIMEOUT = 120.0  # seconds
 MAX_RETRIES = 3
 INITIAL_BACKOFF = 1.0  # seconds
+MAX_CONNECTIONS = 16  # keep-alive pool shared by concurrent queries
 
 
 @dataclass
@@ -107,6 +109,10 @@ class Data360Client:
     batch_size: int = DEFAULT_BATCH_SIZE
     timeout: float = DEFAULT_TIMEOUT
     _stats: QueryStats = field(default_factory=QueryStats)
+    _http: Optional[httpx.Client] = field(default=None, init=False, repr=False, compare=False)
+    _http_lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
 
     @property
     def base_url(self) -> str:
@@ -120,15 +126,48 @@ class Data360Client:
 
     @property
     def stats(self) -> QueryStats:
-        """Get statistics from the last query."""
+        """
+        Get statistics from the last query started.
+
+        Each query counts into its own QueryStats, so concurrent queries
+        don't corrupt each other's numbers; with several in flight, this is
+        whichever started last.
+        """
         return self._stats
 
+    def _http_client(self) -> httpx.Client:
+        """
+        Get the shared HTTP client, creating it on first use.
+
+        Reusing one keep-alive pool avoids a TCP+TLS handshake per request.
+        httpx.Client is thread-safe, and creation is locked so concurrent
+        first queries don't each open (and leak) their own pool.
+        """
+        with self._http_lock:
+            if self._http is None:
+                self._http = httpx.Client(
+                    timeout=self.timeout,
+                    limits=httpx.Limits(
+                        max_connections=MAX_CONNECTIONS,
+                        max_keepalive_connections=MAX_CONNECTIONS,
+                    ),
+                )
+            return self._http
+
+    def close(self) -> None:
+        """Close the shared HTTP connection pool."""
+        with self._http_lock:
+            if self._http is not None:
+                self._http.close()
+                self._http = None
+
     def _execute_request(
         self,
         url: str,
         method: str = "POST",
         json_body: Optional[dict] = None,
-        retry_count: int = 0
+        retry_count: int = 0,
+        stats: Optional[QueryStats] = None
     ) -> dict:
         """
         Execute an HTTP request with retry logic and rate limit handling.
@@ -138,6 +177,7 @@ class Data360Client:
             method: HTTP method (GET, POST, DELETE)
             json_body: Request body for POST requests
             retry_count: Current retry attempt
+            stats: QueryStats to count into (default: the last query's)
 
         Returns:
             Response JSON (empty dict for DELETE with 204)
@@ -145,68 +185,70 @@ class Data360Client:
         Raises:
             RuntimeError: If request fails after retries
         """
-        with httpx.Client(timeout=self.timeout) as client:
-            try:
-                if method == "POST":
-                    response = client.post(
-                        url,
-                        headers=self.auth.get_headers(),
-                        json=json_body
-                    )
-                elif method == "DELETE":
-                    response = client.delete(url, headers=self.auth.get_headers())
-                else:
-                    response = client.get(url, headers=self.auth.get_headers())
-
-                # Handle rate limiting
-                if response.status_code == 429:
-                    if retry_count >= MAX_RETRIES:
-                        raise RuntimeError("Rate limit exceeded after max retries")
-
-                    wait_time = INITIAL_BACKOFF * (2 ** retry_count)
-                    retry_after = response.headers.get("Retry-After")
-                    if retry_after:
-                        wait_time = max(wait_time, float(retry_after))
-
-                    self._stats.rate_limit_waits += 1
-                    time.sleep(wait_time)
-
-                    return self._execute_request(url, method, json_body, retry_count + 1)
-
-                # Handle authentication errors
-                if response.status_code == 401:
-                    # Force token refresh and retry
-                    self.auth.get_token(force_refresh=True)
-                    if retry_count < MAX_RETRIES:
-                        return self._execute_request(url, method, json_body, retry_count + 1)
-                    raise RuntimeError("Authentication failed after token refresh")
-
-                # Handle other errors
-                if response.status_code >= 400:
-                    error_msg = response.text
-                    try:
-                        error_data = response.json()
-                        if isinstance(error_data, list) and error_data:
-                            error_msg = error_data[0].get("message", error_msg)
-                        elif isinstance(error_data, dict):
-                            error_msg = error_data.get("message", error_data.get("error", error_msg))
-                    except json.JSONDecodeError:
-                        pass
-                    raise RuntimeError(f"Query failed ({response.status_code}): {error_msg}")
-
-                self._stats.bytes_transferred += len(response.content)
-
-                # Handle 204 No Content (e.g., DELETE success)
-                if response.status_code == 204:
-                    return {}
-
-                return response.json()
-
-            except httpx.TimeoutException:
+        if stats is None:
+            stats = self._stats
+        client = self._http_client()
+        try:
+            if method == "POST":
+                response = client.post(
+                    url,
+                    headers=self.auth.get_headers(),
+                    json=json_body
+                )
+            elif method == "DELETE":
+                response = client.delete(url, headers=self.auth.get_headers())
+            else:
+                response = client.get(url, headers=self.auth.get_headers())
+
+            # Handle rate limiting
+            if response.status_code == 429:
+                if retry_count >= MAX_RETRIES:
+                    raise RuntimeError("Rate limit exceeded after max retries")
+
+                wait_time = INITIAL_BACKOFF * (2 ** retry_count)
+                retry_after = response.headers.get("Retry-After")
+                if retry_after:
+                    wait_time = max(wait_time, float(retry_after))
+
+                stats.rate_limit_waits += 1
+                time.sleep(wait_time)
+
+                return self._execute_request(url, method, json_body, retry_count + 1, stats)
+
+            # Handle authentication errors
+            if response.status_code == 401:
+                # Force token refresh and retry
+                self.auth.get_token(force_refresh=True)
                 if retry_count < MAX_RETRIES:
-                    time.sleep(INITIAL_BACKOFF * (2 ** retry_count))
-                    return self._execute_request(url, method, json_body, retry_count + 1)
-                raise RuntimeError(f"Request timed out after {MAX_RETRIES} retries")
+                    return self._execute_request(url, method, json_body, retry_count + 1, stats)
+                raise RuntimeError("Authentication failed after token refresh")
+
+            # Handle other errors
+            if response.status_code >= 400:
+                error_msg = response.text
+                try:
+                    error_data = response.json()
+                    if isinstance(error_data, list) and error_data:
+                        error_msg = error_data[0].get("message", error_msg)
+                    elif isinstance(error_data, dict):
+                        error_msg = error_data.get("message", error_data.get("error", error_msg))
+                except json.JSONDecodeError:
+                    pass
+                raise RuntimeError(f"Query failed ({response.status_code}): {error_msg}")
+
+            stats.bytes_transferred += len(response.content)
+
+            # Handle 204 No Content (e.g., DELETE success)
+            if response.status_code == 204:
+                return {}
+
+            return response.json()
+
+        except httpx.TimeoutException:
+            if retry_count < MAX_RETRIES:
+                time.sleep(INITIAL_BACKOFF * (2 ** retry_count))
+                return self._execute_request(url, method, json_body, retry_count + 1, stats)
+            raise RuntimeError(f"Request timed out after {MAX_RETRIES} retries")
 
     def query(self, sql: str, limit: Optional[int] = None) -> Iterator[Dict[str, Any]]:
         """
@@ -226,13 +268,13 @@ class Data360Client:
             >>> for record in client.query("SELECT * FROM ssot__AIAgentSession__dlm LIMIT 100"):
             ...     print(record["ssot__Id__c"])
         """
-        self._stats = QueryStats(start_time=datetime.now())
+        stats = self._stats = QueryStats(start_time=datetime.now())
         records_yielded = 0
 
         # v65.0 Query SQL API - just send the SQL, no pageSize
         request_body = {"sql": sql}
 
-        response = self._execute_request(self.query_url, "POST", request_body)
+        response = self._execute_request(self.query_url, "POST", request_body, stats=stats)
 
         # Extract column names from metadata for converting arrays to dicts
         metadata = response.get("metadata", [])
@@ -241,17 +283,17 @@ class Data360Client:
         while True:
             # v65.0 returns data as array of arrays, not array of dicts
             raw_data = response.get("data", [])
-            self._stats.batches_fetched += 1
+            stats.batches_fetched += 1
 
             for row in raw_data:
                 if limit and records_yielded >= limit:
-                    self._stats.end_time = datetime.now()
+                    stats.end_time = datetime.now()
                     return
 
                 # Convert array row to dict using column names
                 record = dict(zip(column_names, row))
 
-                self._stats.records_fetched += 1
+                stats.records_fetched += 1
                 records_yielded += 1
                 yield record
 
@@ -265,7 +307,7 @@ class Data360Client:
                 if query_id:
                     # Fetch next chunk via /rows endpoint
                     next_url = f"{self.query_url}/{query_id}/rows"
-                    response = self._execute_request(next_url, "GET")
+                    response = self._execute_request(next_url, "GET", stats=stats)
                     continue
 
             # Check for legacy nextRecordsUrl (backwards compatibility)
@@ -276,9 +318,9 @@ class Data360Client:
             if not next_url.startswith("http"):
                 next_url = f"{self.auth.instance_url}{next_url}"
 
-            response = self._execute_request(next_url, "GET")
+            response = self._execute_request(next_url, "GET", stats=stats)
 
-        self._stats.end_time = datetime.now()
+        stats.end_time = datetime.now()
 
     def query_all(self, sql: str) -> List[Dict[str, Any]]:
         """
@@ -425,7 +467,7 @@ class Data360Client:
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        self._stats = QueryStats(start_time=datetime.now())
+        stats = self._stats = QueryStats(start_time=datetime.now())
         records_written = 0
         batches = []
         inferred_schema = schema
@@ -448,7 +490,7 @@ class Data360Client:
             # v65.0 Query SQL API - just send the SQL, no pageSize
             request_body = {"sql": sql}
 
-            response = self._execute_request(self.query_url, "POST", request_body)
+            response = self._execute_request(self.query_url, "POST", request_body, stats=stats)
 
             # Extract column names from metadata for converting arrays to dicts
             metadata = response.get("metadata", [])
@@ -457,7 +499,7 @@ class Data360Client:
             while True:
                 # v65.0 returns data as array of arrays
                 raw_data = response.get("data", [])
-                self._stats.batches_fetched += 1
+                stats.batches_fetched += 1
 
                 if raw_data:
                     # Convert array rows to dicts using column names
@@ -471,7 +513,7 @@ class Data360Client:
                     batch_table = self._records_to_table(data, inferred_schema)
                     batches.append(batch_table)
                     records_written += len(data)
-                    self._stats.records_fetched += len(data)
+                    stats.records_fetched += len(data)
 
                     if progress and task is not None:
                         progress.update(task, records=records_written)
@@ -484,7 +526,7 @@ class Data360Client:
                     query_id = status.get("queryId")
                     if query_id:
                         next_url = f"{self.query_url}/{query_id}/rows"
-                        response = self._execute_request(next_url, "GET")
+                        response = self._execute_request(next_url, "GET", stats=stats)
                         continue
 
                 # Legacy pagination fallback
@@ -495,7 +537,7 @@ class Data360Client:
                 if not next_url.startswith("http"):
                     next_url = f"{self.auth.instance_url}{next_url}"
 
-                response = self._execute_request(next_url, "GET")
+                response = self._execute_request(next_url, "GET", stats=stats)
 
             # Combine all batches and write
             if batches:
@@ -528,7 +570,7 @@ class Data360Client:
             if progress:
                 progress.stop()
 
-        self._stats.end_time = datetime.now()
+        stats.end_time = datetime.now()
         return records_written
 
     def _infer_schema(self, record: Dict[str, Any]) -> pa.Schema:
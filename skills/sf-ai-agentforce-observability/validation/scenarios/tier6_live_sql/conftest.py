@@ -18,6 +18,9 @@ from pathlib import Path
 # Query execution timeout (seconds)
 QUERY_TIMEOUT = 120
 
+# Fenced ```sql blocks in the query-patterns doc
+_SQL_FENCE_RE = re.compile(r'```sql\s*(.*?)```', re.DOTALL | re.IGNORECASE)
+
 
 @pytest.fixture(scope="session")
 def query_patterns_content() -> str:
@@ -30,9 +33,8 @@ def query_patterns_content() -> str:
 @pytest.fixture(scope="session")
 def all_sql_blocks(query_patterns_content: str) -> List[str]:
     """Extract all SQL blocks from query-patterns.md."""
-    pattern = r'```sql\s*(.*?)```'
-    matches = re.findall(pattern, query_patterns_content, re.DOTALL | re.IGNORECASE)
-    return [m.strip() for m in matches if m.strip()]
+    blocks = (m.strip() for m in _SQL_FENCE_RE.findall(query_patterns_content))
+    return [block for block in blocks if block]
 
 
 @pytest.fixture(scope="session")
@@ -98,44 +100,37 @@ def substitute_template_vars(sample_session_id, sample_interaction_id):
             sql = substitute_template_vars("SELECT * WHERE id = '{{SESSION_ID}}'")
             results = list(data_client.query(sql))
     """
-    def _substitute(sql: str, skip_if_no_session: bool = True) -> str:
-        # Session ID substitution
-        if "{{SESSION_ID}}" in sql:
-            if sample_session_id:
-                sql = sql.replace("{{SESSION_ID}}", sample_session_id)
-            elif skip_if_no_session:
-                pytest.skip("No sessions available for template substitution")
-            else:
-                # Use a placeholder that will return no results
-                sql = sql.replace("{{SESSION_ID}}", "00000000-0000-0000-0000-000000000000")
-
-        # Interaction ID substitution
-        if "{{INTERACTION_ID}}" in sql:
-            if sample_interaction_id:
-                sql = sql.replace("{{INTERACTION_ID}}", sample_interaction_id)
-            elif skip_if_no_session:
-                pytest.skip("No interactions available for template substitution")
-            else:
-                sql = sql.replace("{{INTERACTION_ID}}", "00000000-0000-0000-0000-000000000000")
-
+    placeholder_id = "00000000-0000-0000-0000-000000000000"
+    end_date = datetime.utcnow()
+    start_date = end_date - timedelta(days=30)
+
+    # Built once per fixture instance; every call is then a single regex pass
+    subs = {
+        "{{SESSION_ID}}": sample_session_id or placeholder_id,
+        "{{INTERACTION_ID}}": sample_interaction_id or placeholder_id,
         # Date substitutions
-        end_date = datetime.utcnow()
-        start_date = end_date - timedelta(days=30)
-
-        sql = sql.replace("{{START_DATE}}", start_date.strftime("%Y-%m-%dT%H:%M:%S.000Z"))
-        sql = sql.replace("{{END_DATE}}", end_date.strftime("%Y-%m-%dT%H:%M:%S.000Z"))
-
+        "{{START_DATE}}": start_date.strftime("%Y-%m-%dT%H:%M:%S.000Z"),
+        "{{END_DATE}}": end_date.strftime("%Y-%m-%dT%H:%M:%S.000Z"),
         # Knowledge retrieval placeholders
-        sql = sql.replace("{{USER_QUERY}}", "test query")
-        sql = sql.replace("{{FILTER_CLAUSE}}", "")
-        sql = sql.replace("{{KNOWLEDGE_ARTICLE_DMO}}", "Knowledge_kav__dlm")
-
+        "{{USER_QUERY}}": "test query",
+        "{{FILTER_CLAUSE}}": "",
+        "{{KNOWLEDGE_ARTICLE_DMO}}": "Knowledge_kav__dlm",
         # Agent names placeholder
-        sql = sql.replace("{{AGENT_NAMES}}", "'Test_Agent'")
-        sql = sql.replace("{{SESSION_IDS}}", f"'{sample_session_id or '00000000-0000-0000-0000-000000000000'}'")
-        sql = sql.replace("{{INTERACTION_IDS}}", f"'{sample_interaction_id or '00000000-0000-0000-0000-000000000000'}'")
+        "{{AGENT_NAMES}}": "'Test_Agent'",
+        "{{SESSION_IDS}}": f"'{sample_session_id or placeholder_id}'",
+        "{{INTERACTION_IDS}}": f"'{sample_interaction_id or placeholder_id}'",
+    }
+    pattern = re.compile("|".join(re.escape(k) for k in subs))
+
+    def _substitute(sql: str, skip_if_no_session: bool = True) -> str:
+        if skip_if_no_session:
+            # Without a real ID the query would use the no-results placeholder
+            if not sample_session_id and "{{SESSION_ID}}" in sql:
+                pytest.skip("No sessions available for template substitution")
+            if not sample_interaction_id and "{{INTERACTION_ID}}" in sql:
+                pytest.skip("No interactions available for template substitution")
 
-        return sql
+        return pattern.sub(lambda m: subs[m.group(0)], sql)
 
     return _substitute
 
@@ -19,8 +19,10 @@ For full output saved to file:
     pytest -v -s scenarios/tier6_live_sql/test_comprehensive_dmo_discovery.py 2>&1 | tee dmo-discovery-full.txt
 """
 
+import heapq
 import pytest
 import json
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional, Set
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -31,7 +33,7 @@ from datetime import datetime
 # =============================================================================
 
 # Audit & Feedback DLO/DMOs (13)
-AUDIT_FEEDBACK_DMOS = [
+AUDIT_FEEDBACK_DMOS = (
     "GenAIAppGeneration__dlm",
     "GenAIContentCategory__dlm",
     "GenAIContentQuality__dlm",
@@ -45,43 +47,46 @@ AUDIT_FEEDBACK_DMOS = [
     "GenAIGtwyObjRecord__dlm",
     "GenAIGtwyRequestLLM__dlm",
     "GenAIGtwyRequestMetadata__dlm",
-]
+)
 
 # Session Trace DMOs (5) - with ssot__ prefix
-SESSION_TRACE_DMOS = [
+SESSION_TRACE_DMOS = (
     "ssot__AIAgentInteraction__dlm",
     "ssot__AiAgentInteractionMessage__dlm",
     "ssot__AIAgentInteractionStep__dlm",
     "ssot__AIAgentSession__dlm",
     "ssot__AIAgentSessionParticipant__dlm",
-]
+)
 
 # RAG Quality Monitoring (3)
-RAG_QUALITY_DMOS = [
+RAG_QUALITY_DMOS = (
     "GenAIRetrieverResponse__dlm",
     "GenAIRetrieverRequest__dlm",
     "GenAIRetrieverQualityMetric__dlm",
-]
+)
 
 # Agent Optimizer DLOs (6) - with ssot__ prefix
-AGENT_OPTIMIZER_DMOS = [
+AGENT_OPTIMIZER_DMOS = (
     "ssot__AiAgentMoment__dlm",
     "ssot__AiAgentTagDefinition__dlm",
     "ssot__AiAgentTagAssociation__dlm",
     "ssot__AiAgentMomentInteraction__dlm",
     "ssot__AiAgentTag__dlm",
     "ssot__AiAgentTagDefinitionAssociation__dlm",
-]
+)
 
 # All DMOs combined
 ALL_DMOS = AUDIT_FEEDBACK_DMOS + SESSION_TRACE_DMOS + RAG_QUALITY_DMOS + AGENT_OPTIMIZER_DMOS
 
+# Concurrent existence probes (bounded to stay clear of API rate limits)
+PROBE_MAX_WORKERS = 8
+
 
 # =============================================================================
 # Discovery Result Tracking
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class DmoDiscoveryResult:
     """Result of probing a single DMO."""
     dmo_name: str
@@ -113,9 +118,11 @@ class ComprehensiveDiscoveryTracker:
             "=" * 80,
         ]
 
-        # Summary
-        found = [r for r in self.results.values() if r.exists]
-        not_found = [r for r in self.results.values() if not r.exists]
+        # Summary (sorted once; both buckets keep name order)
+        found = []
+        not_found = []
+        for result in sorted(self.results.values(), key=lambda x: x.dmo_name):
+            (found if result.exists else not_found).append(result)
 
         lines.append(f"\n📊 SUMMARY: {len(found)} found, {len(not_found)} not found")
         lines.append(f"   Metadata API available: {self.metadata_api_available}")
@@ -128,7 +135,7 @@ class ComprehensiveDiscoveryTracker:
             lines.append("✅ FOUND DMOs (Add to documentation)")
             lines.append("=" * 80)
 
-            for result in sorted(found, key=lambda x: x.dmo_name):
+            for result in found:
                 lines.append(f"\n📦 {result.dmo_name}")
                 lines.append(f"   Fields: {len(result.fields)}")
                 if result.record_count is not None:
@@ -137,7 +144,7 @@ class ComprehensiveDiscoveryTracker:
                 # List fields
                 if result.fields:
                     lines.append("   Field List:")
-                    for f in sorted(result.fields)[:30]:  # First 30 fields
+                    for f in heapq.nsmallest(30, result.fields):  # First 30 fields
                         ftype = result.field_types.get(f, "?")
                         lines.append(f"      - {f} ({ftype})")
                     if len(result.fields) > 30:
@@ -156,7 +163,7 @@ class ComprehensiveDiscoveryTracker:
             lines.append("\n" + "=" * 80)
             lines.append("❌ NOT FOUND DMOs (Skip in documentation)")
             lines.append("=" * 80)
-            for result in sorted(not_found, key=lambda x: x.dmo_name):
+            for result in not_found:
                 error_snippet = result.error[:80] if result.error else "No error"
                 lines.append(f"   - {result.dmo_name}: {error_snippet}")
 
@@ -168,7 +175,7 @@ class ComprehensiveDiscoveryTracker:
                 lines.append("\n" + "=" * 80)
                 lines.append("🆕 ADDITIONAL DMOs FROM API (Not in our probe list)")
                 lines.append("=" * 80)
-                for dmo in sorted(unknown)[:50]:
+                for dmo in heapq.nsmallest(50, unknown):
                     lines.append(f"   - {dmo}")
                 if len(unknown) > 50:
                     lines.append(f"   ... and {len(unknown) - 50} more")
@@ -188,6 +195,157 @@ def print_comprehensive_report(request):
     print("\n" + tracker.generate_report())
 
 
+def _probe_dmo(data_client, dmo_name: str) -> tuple:
+    """Run a ``SELECT * ... LIMIT 1`` probe, returning ``(rows, error)``."""
+    try:
+        return list(data_client.query(f"SELECT * FROM {dmo_name} LIMIT 1", limit=1)), None
+    except Exception as e:
+        return None, str(e)
+
+
+@pytest.fixture(scope="module")
+def dmo_probes(data_client) -> Dict[str, tuple]:
+    """
+    Existence probes for the single-row DMO groups, issued concurrently.
+
+    Each probe is an independent round trip, so the whole sweep costs
+    roughly one query latency instead of one per DMO.
+    """
+    dmo_names = AUDIT_FEEDBACK_DMOS + RAG_QUALITY_DMOS
+    with ThreadPoolExecutor(max_workers=PROBE_MAX_WORKERS) as executor:
+        outcomes = executor.map(lambda name: _probe_dmo(data_client, name), dmo_names)
+        return dict(zip(dmo_names, outcomes))
+
+
+def _discover_session_trace_dmo(data_client, dmo_name: str) -> DmoDiscoveryResult:
+    """Fields, 30-day record count and type/status/role enum values."""
+    result = DmoDiscoveryResult(dmo_name=dmo_name)
+
+    try:
+        # Get all fields via SELECT *
+        sql = f"SELECT * FROM {dmo_name} LIMIT 3"
+        rows = list(data_client.query(sql, limit=3))
+
+        result.exists = True
+
+        if rows:
+            # Collect all unique fields across rows
+            all_fields = set()
+            for row in rows:
+                all_fields.update(row.keys())
+            result.fields = sorted(all_fields)
+
+            # Type inference from first row
+            for k, v in rows[0].items():
+                if v is None:
+                    result.field_types[k] = "null"
+                elif isinstance(v, bool):
+                    result.field_types[k] = "boolean"
+                elif isinstance(v, (int, float)):
+                    result.field_types[k] = "number"
+                else:
+                    result.field_types[k] = "string"
+
+            result.sample_row = rows[0]
+
+        # Get record count (last 30 days)
+        try:
+            count_sql = f"""
+                SELECT COUNT(*) as cnt FROM {dmo_name}
+                WHERE ssot__StartTimestamp__c >= current_date - INTERVAL '30' DAY
+            """
+            count_result = list(data_client.query(count_sql, limit=1))
+            if count_result:
+                result.record_count = count_result[0].get("cnt")
+        except:
+            pass  # Count may fail if no timestamp field
+
+        # Discover enum values for type/status fields
+        type_fields = [f for f in result.fields if "Type" in f or "Status" in f or "Role" in f]
+        for type_field in type_fields[:5]:  # Limit to 5 enum fields
+            try:
+                enum_sql = f"""
+                    SELECT DISTINCT {type_field}
+                    FROM {dmo_name}
+                    WHERE {type_field} IS NOT NULL
+                    LIMIT 20
+                """
+                enum_rows = list(data_client.query(enum_sql, limit=20))
+                if enum_rows:
+                    values = [r.get(type_field) for r in enum_rows if r.get(type_field)]
+                    if values:
+                        result.enum_values[type_field] = values
+            except:
+                pass
+
+    except Exception as e:
+        result.exists = False
+        result.error = str(e)
+
+    return result
+
+
+def _discover_agent_optimizer_dmo(data_client, dmo_name: str) -> DmoDiscoveryResult:
+    """Fields and type/source enum values."""
+    result = DmoDiscoveryResult(dmo_name=dmo_name)
+
+    try:
+        sql = f"SELECT * FROM {dmo_name} LIMIT 3"
+        rows = list(data_client.query(sql, limit=3))
+
+        result.exists = True
+
+        if rows:
+            all_fields = set()
+            for row in rows:
+                all_fields.update(row.keys())
+            result.fields = sorted(all_fields)
+            result.sample_row = rows[0]
+
+            # Type inference
+            for k, v in rows[0].items():
+                result.field_types[k] = type(v).__name__ if v is not None else "null"
+
+        # Discover enum values
+        type_fields = [f for f in result.fields if "Type" in f or "Source" in f]
+        for type_field in type_fields[:3]:
+            try:
+                enum_sql = f"""
+                    SELECT DISTINCT {type_field}
+                    FROM {dmo_name}
+                    WHERE {type_field} IS NOT NULL
+                    LIMIT 20
+                """
+                enum_rows = list(data_client.query(enum_sql, limit=20))
+                if enum_rows:
+                    values = [r.get(type_field) for r in enum_rows if r.get(type_field)]
+                    if values:
+                        result.enum_values[type_field] = values
+            except:
+                pass
+
+    except Exception as e:
+        result.exists = False
+        result.error = str(e)
+
+    return result
+
+
+@pytest.fixture(scope="module")
+def dmo_discoveries(data_client) -> Dict[str, DmoDiscoveryResult]:
+    """
+    Full discovery for the Session Trace and Agent Optimizer DMOs.
+
+    Each DMO's queries depend on its own SELECT * probe, so they run in
+    order, but the per-DMO chains are independent and share the pool.
+    """
+    jobs = [(name, _discover_session_trace_dmo) for name in SESSION_TRACE_DMOS]
+    jobs += [(name, _discover_agent_optimizer_dmo) for name in AGENT_OPTIMIZER_DMOS]
+    with ThreadPoolExecutor(max_workers=PROBE_MAX_WORKERS) as executor:
+        futures = {name: executor.submit(discover, data_client, name) for name, discover in jobs}
+        return {name: future.result() for name, future in futures.items()}
+
+
 # =============================================================================
 # T6.D3.1: Metadata API Discovery
 # =============================================================================
@@ -269,14 +427,15 @@ class TestAuditFeedbackDmos:
     """Probe all Audit & Feedback DLO/DMOs."""
 
     @pytest.mark.parametrize("dmo_name", AUDIT_FEEDBACK_DMOS)
-    def test_audit_feedback_dmo_exists(self, data_client, dmo_name):
+    def test_audit_feedback_dmo_exists(self, dmo_probes, dmo_name):
         """Probe Audit & Feedback DMO existence and fields."""
         result = DmoDiscoveryResult(dmo_name=dmo_name)
 
         try:
-            # Try SELECT * to get all fields
-            sql = f"SELECT * FROM {dmo_name} LIMIT 1"
-            rows = list(data_client.query(sql, limit=1))
+            # SELECT * probe (batched in dmo_probes) to get all fields
+            rows, error = dmo_probes[dmo_name]
+            if error is not None:
+                raise RuntimeError(error)
 
             result.exists = True
 
@@ -324,83 +483,24 @@ class TestSessionTraceDmos:
     """Probe all Session Trace DMOs with full field discovery."""
 
     @pytest.mark.parametrize("dmo_name", SESSION_TRACE_DMOS)
-    def test_session_trace_dmo_full_discovery(self, data_client, dmo_name):
+    def test_session_trace_dmo_full_discovery(self, dmo_discoveries, dmo_name):
         """
         Full discovery of Session Trace DMOs including:
         - All fields
         - Enum values for type fields
         - Record counts
         """
-        result = DmoDiscoveryResult(dmo_name=dmo_name)
-
-        try:
-            # Get all fields via SELECT *
-            sql = f"SELECT * FROM {dmo_name} LIMIT 3"
-            rows = list(data_client.query(sql, limit=3))
-
-            result.exists = True
-
-            if rows:
-                # Collect all unique fields across rows
-                all_fields = set()
-                for row in rows:
-                    all_fields.update(row.keys())
-                result.fields = sorted(all_fields)
-
-                # Type inference from first row
-                for k, v in rows[0].items():
-                    if v is None:
-                        result.field_types[k] = "null"
-                    elif isinstance(v, bool):
-                        result.field_types[k] = "boolean"
-                    elif isinstance(v, (int, float)):
-                        result.field_types[k] = "number"
-                    else:
-                        result.field_types[k] = "string"
-
-                result.sample_row = rows[0]
-
-            # Get record count (last 30 days)
-            try:
-                count_sql = f"""
-                    SELECT COUNT(*) as cnt FROM {dmo_name}
-                    WHERE ssot__StartTimestamp__c >= current_date - INTERVAL '30' DAY
-                """
-                count_result = list(data_client.query(count_sql, limit=1))
-                if count_result:
-                    result.record_count = count_result[0].get("cnt")
-            except:
-                pass  # Count may fail if no timestamp field
-
-            # Discover enum values for type/status fields
-            type_fields = [f for f in result.fields if "Type" in f or "Status" in f or "Role" in f]
-            for type_field in type_fields[:5]:  # Limit to 5 enum fields
-                try:
-                    enum_sql = f"""
-                        SELECT DISTINCT {type_field}
-                        FROM {dmo_name}
-                        WHERE {type_field} IS NOT NULL
-                        LIMIT 20
-                    """
-                    enum_rows = list(data_client.query(enum_sql, limit=20))
-                    if enum_rows:
-                        values = [r.get(type_field) for r in enum_rows if r.get(type_field)]
-                        if values:
-                            result.enum_values[type_field] = values
-                except:
-                    pass
+        result = dmo_discoveries[dmo_name]
 
+        if result.exists:
             print(f"\n✅ {dmo_name}:")
             print(f"   Fields: {len(result.fields)}")
             if result.record_count:
                 print(f"   Records (30d): {result.record_count}")
             if result.enum_values:
                 print(f"   Enum fields: {list(result.enum_values.keys())}")
-
-        except Exception as e:
-            result.exists = False
-            result.error = str(e)
-            print(f"\n❌ {dmo_name}: {str(e)[:80]}")
+        else:
+            print(f"\n❌ {dmo_name}: {result.error[:80]}")
 
         tracker.add_result(result)
 
@@ -419,13 +519,14 @@ class TestRagQualityDmos:
     """Probe RAG Quality Monitoring DMOs."""
 
     @pytest.mark.parametrize("dmo_name", RAG_QUALITY_DMOS)
-    def test_rag_quality_dmo_exists(self, data_client, dmo_name):
+    def test_rag_quality_dmo_exists(self, dmo_probes, dmo_name):
         """Probe RAG Quality Monitoring DMO."""
         result = DmoDiscoveryResult(dmo_name=dmo_name)
 
         try:
-            sql = f"SELECT * FROM {dmo_name} LIMIT 1"
-            rows = list(data_client.query(sql, limit=1))
+            rows, error = dmo_probes[dmo_name]
+            if error is not None:
+                raise RuntimeError(error)
 
             result.exists = True
             if rows:
@@ -456,53 +557,16 @@ class TestAgentOptimizerDmos:
     """Probe all Agent Optimizer DLOs."""
 
     @pytest.mark.parametrize("dmo_name", AGENT_OPTIMIZER_DMOS)
-    def test_agent_optimizer_dmo_full_discovery(self, data_client, dmo_name):
+    def test_agent_optimizer_dmo_full_discovery(self, dmo_discoveries, dmo_name):
         """Full discovery of Agent Optimizer DMOs."""
-        result = DmoDiscoveryResult(dmo_name=dmo_name)
-
-        try:
-            sql = f"SELECT * FROM {dmo_name} LIMIT 3"
-            rows = list(data_client.query(sql, limit=3))
-
-            result.exists = True
-
-            if rows:
-                all_fields = set()
-                for row in rows:
-                    all_fields.update(row.keys())
-                result.fields = sorted(all_fields)
-                result.sample_row = rows[0]
-
-                # Type inference
-                for k, v in rows[0].items():
-                    result.field_types[k] = type(v).__name__ if v is not None else "null"
-
-            # Discover enum values
-            type_fields = [f for f in result.fields if "Type" in f or "Source" in f]
-            for type_field in type_fields[:3]:
-                try:
-                    enum_sql = f"""
-                        SELECT DISTINCT {type_field}
-                        FROM {dmo_name}
-                        WHERE {type_field} IS NOT NULL
-                        LIMIT 20
-                    """
-                    enum_rows = list(data_client.query(enum_sql, limit=20))
-                    if enum_rows:
-                        values = [r.get(type_field) for r in enum_rows if r.get(type_field)]
-                        if values:
-                            result.enum_values[type_field] = values
-                except:
-                    pass
+        result = dmo_discoveries[dmo_name]
 
+        if result.exists:
             print(f"\n✅ {dmo_name}: {len(result.fields)} fields")
             if result.enum_values:
                 print(f"   Enums: {result.enum_values}")
-
-        except Exception as e:
-            result.exists = False
-            result.error = str(e)
-            print(f"\n❌ {dmo_name}: {str(e)[:80]}")
+        else:
+            print(f"\n❌ {dmo_name}: {result.error[:80]}")
 
         tracker.add_result(result)
 
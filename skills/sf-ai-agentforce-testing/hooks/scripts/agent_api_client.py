@@ -7,6 +7,7 @@ Handles authentication (ECA Client Credentials), session lifecycle,
 multi-turn messaging, and context variable injection.
 
 Uses only Python standard library (urllib) — no pip dependencies.
+If orjson is installed it is used to parse response bodies.
 
 Usage:
     from agent_api_client import AgentAPIClient
@@ -47,6 +48,8 @@ License: MIT
 """
 
 import json
+import re
+import ssl
 import uuid
 import urllib.request
 import urllib.error
@@ -57,6 +60,15 @@ import sys
 from typing import Optional, List, Dict, Any, Tuple
 from dataclasses import dataclass, field
 
+# Optional faster JSON decoding. Both decoders accept raw bytes, and
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers keep
+# catching json.JSONDecodeError either way.
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 # Data Classes
@@ -359,6 +371,7 @@ class AgentAPIClient:
         self._log_callback = log_callback
         self._access_token: Optional[str] = None
         self._token_issued_at: float = 0
+        self._ssl_context: Optional[ssl.SSLContext] = None
 
         # Normalize domain
         if self.my_domain and not self.my_domain.startswith("https://"):
@@ -372,6 +385,18 @@ class AgentAPIClient:
             else:
                 print(f"  [api] {msg}", file=sys.stderr)
 
+    def _get_ssl_context(self) -> ssl.SSLContext:
+        """
+        Shared TLS context for all requests made by this client.
+
+        Without an explicit context, every urlopen() builds a fresh default
+        context and reloads the CA bundle. Creating it once keeps retries and
+        re-auth round trips from paying that cost repeatedly.
+        """
+        if self._ssl_context is None:
+            self._ssl_context = ssl.create_default_context()
+        return self._ssl_context
+
     # ─── Authentication ────────────────────────────────────────────────
 
     def authenticate(self) -> str:
@@ -408,8 +433,10 @@ class AgentAPIClient:
         )
 
         try:
-            with urllib.request.urlopen(req, timeout=30) as resp:
-                result = json.loads(resp.read().decode("utf-8"))
+            with urllib.request.urlopen(
+                req, timeout=30, context=self._get_ssl_context()
+            ) as resp:
+                result = _json_loads(resp.read())
         except urllib.error.HTTPError as e:
             body = e.read().decode("utf-8", errors="replace")
             try:
@@ -551,10 +578,12 @@ class AgentAPIClient:
             )
 
             try:
-                with urllib.request.urlopen(req, timeout=self._timeout) as resp:
-                    resp_body = resp.read().decode("utf-8")
+                with urllib.request.urlopen(
+                    req, timeout=self._timeout, context=self._get_ssl_context()
+                ) as resp:
+                    resp_body = resp.read()
                     if resp_body:
-                        return json.loads(resp_body)
+                        return _json_loads(resp_body)
                     return {}
 
             except urllib.error.HTTPError as e:
@@ -605,6 +634,12 @@ class AgentAPIClient:
 # Helper Functions
 # ═══════════════════════════════════════════════════════════════════════════
 
+# "name=value" / "name:Type=value" — the type is split at the last colon
+# before the first '=', so "$Context.AccountId:Id=001XX" types as "Id".
+# The name may match empty here; parse_variables() rejects that.
+_VAR_RE = re.compile(r"^\s*([^=]*?)\s*(?::\s*([^:=]*?)\s*)?=\s*(.*?)\s*$", re.DOTALL)
+
+
 def _parse_messages(messages_data: list) -> List[AgentMessage]:
     """Parse raw message dicts into AgentMessage objects."""
     messages = []
@@ -640,21 +675,16 @@ def parse_variables(var_strings: List[str]) -> List[Dict[str, str]]:
     """
     variables = []
     for vs in var_strings:
-        if "=" not in vs:
+        m = _VAR_RE.match(vs)
+        name = m.group(1).strip() if m else ""
+        if not name:
             raise ValueError(f"Invalid variable format (expected name=value): {vs}")
 
-        name_part, value = vs.split("=", 1)
-
-        if ":" in name_part:
-            name, var_type = name_part.rsplit(":", 1)
-        else:
-            name = name_part
-            var_type = "Text"
-
+        _, var_type, value = m.groups()
         variables.append({
-            "name": name.strip(),
-            "type": var_type.strip(),
-            "value": value.strip(),
+            "name": name,
+            "type": "Text" if var_type is None else var_type,
+            "value": value,
         })
 
     return variables
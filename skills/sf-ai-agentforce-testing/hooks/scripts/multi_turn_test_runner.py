@@ -53,7 +53,7 @@ License: MIT
 """
 
 import argparse
-import concurrent.futures
+import functools
 import json
 import os
 import re
@@ -62,9 +62,8 @@ import sys
 import textwrap
 import threading
 import time
-from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 
 # Import sibling module
 sys.path.insert(0, str(Path(__file__).parent))
@@ -72,17 +71,6 @@ from agent_api_client import (
     AgentAPIClient, AgentSession, TurnResult, AgentAPIError, parse_variables,
 )
 
-# YAML import with helpful error
-try:
-    import yaml
-except ImportError:
-    print(
-        "ERROR: pyyaml is required for YAML template parsing.\n"
-        "Install with: pip3 install pyyaml",
-        file=sys.stderr,
-    )
-    sys.exit(2)
-
 # Rich library (optional — graceful fallback to legacy Unicode formatting)
 try:
     from rich.console import Console, Group
@@ -545,22 +533,23 @@ class StreamingConsole:
 # Turn Evaluation
 # ═══════════════════════════════════════════════════════════════════════════
 
-# Patterns that indicate a guardrail was triggered (agent declined the request)
-GUARDRAIL_PATTERNS = [
+# Patterns that indicate a guardrail was triggered (agent declined the request).
+# Compiled once at import; every guardrail/escalation check reuses them.
+GUARDRAIL_PATTERNS = tuple(re.compile(p) for p in (
     r"(?i)i\s*(?:can(?:'t|not)|am\s+(?:not\s+)?(?:able|allowed))\s+(?:to\s+)?(?:help|assist|provide|share|do\s+that)",
     r"(?i)(?:sorry|apologies?)[\s,]+(?:but\s+)?i\s+(?:can(?:'t|not))",
     r"(?i)(?:not\s+)?(?:able|allowed|permitted)\s+to\s+(?:provide|share|disclose|give)",
     r"(?i)(?:against|violates?)\s+(?:my|our|the)\s+(?:policy|policies|guidelines|rules)",
     r"(?i)(?:sensitive|confidential|private)\s+(?:information|data)",
     r"(?i)i\s+(?:must|need\s+to)\s+(?:decline|refuse|respectfully)",
-]
+))
 
 # Patterns that suggest escalation (agent handing off to human)
-ESCALATION_PATTERNS = [
+ESCALATION_PATTERNS = tuple(re.compile(p) for p in (
     r"(?i)(?:connect|transfer|escalat)\w*\s+(?:you\s+)?(?:to|with)\s+(?:a\s+)?(?:human|agent|specialist|representative|someone|person|team)",
     r"(?i)(?:let\s+me\s+)?(?:get|find)\s+(?:you\s+)?(?:a\s+)?(?:human|real\s+person|specialist|agent)",
     r"(?i)(?:hand|pass)\w*\s+(?:you\s+)?(?:off|over)\s+to",
-]
+))
 
 
 def evaluate_turn(
@@ -597,6 +586,21 @@ def evaluate_turn(
     }
 
 
+# Check handlers keyed by expectation name. Each handler fills in the
+# "actual", "passed" and "detail" fields of the check dict it is given.
+# Signature: handler(check, expected, turn, prior_turns, agent_text) -> None
+_CHECK_HANDLERS: Dict[str, Callable[..., None]] = {}
+
+
+def _register_check(*names: str):
+    """Register the decorated function as the handler for the given check names."""
+    def decorator(fn):
+        for check_name in names:
+            _CHECK_HANDLERS[check_name] = fn
+        return fn
+    return decorator
+
+
 def _run_check(
     name: str, expected: Any, turn: TurnResult, prior_turns: List[TurnResult]
 ) -> Dict[str, Any]:
@@ -609,325 +613,409 @@ def _run_check(
         "detail": "",
     }
 
-    text = turn.agent_text.lower()
+    handler = _CHECK_HANDLERS.get(name)
+    if handler is None:
+        check["detail"] = f"Unknown check '{name}' — skipped"
+        check["passed"] = True  # Don't fail on unknown checks
+        return check
 
     try:
-        if name == "response_not_empty":
-            check["actual"] = turn.has_response
-            check["passed"] = turn.has_response == expected
-            check["detail"] = f"Response {'has' if turn.has_response else 'has no'} content"
-
-        elif name == "response_contains":
-            if isinstance(expected, bool):
-                check["passed"] = False
-                check["detail"] = (
-                    "response_contains expects a string, got bool. "
-                    "Use response_not_empty for boolean checks."
-                )
-            else:
-                val = str(expected).lower()
-                found = val in text
-                check["actual"] = found
-                check["passed"] = found
-                check["detail"] = f"'{expected}' {'found' if found else 'not found'} in response"
-
-        elif name == "response_contains_any":
-            found_any = any(v.lower() in text for v in expected)
-            found_which = [v for v in expected if v.lower() in text]
-            check["actual"] = found_which
-            check["passed"] = found_any
-            check["detail"] = f"Found: {found_which}" if found_any else f"None of {expected} found"
-
-        elif name == "response_not_contains":
-            val = expected.lower()
-            found = val in text
-            check["actual"] = not found
-            check["passed"] = not found
-            check["detail"] = f"'{expected}' {'absent (good)' if not found else 'found (bad)'}"
-
-        elif name == "topic_contains":
-            # Heuristic: infer topic from response language (API doesn't return topic name)
-            # Use word-boundary matching to avoid false positives on substrings
-            val = expected.lower()
-            found = bool(re.search(rf"\b{re.escape(val)}\b", text))
-            check["actual"] = found
-            check["passed"] = found
-            check["detail"] = (
-                f"Topic keyword '{expected}' {'inferred' if found else 'not found'} in response"
-                " (heuristic — word-boundary match)"
-            )
+        # agent_text is a property that re-joins every message on each access;
+        # read it once per check instead of once per use.
+        handler(check, expected, turn, prior_turns, turn.agent_text)
+    except Exception as e:
+        check["detail"] = f"Check error: {e}"
+        check["passed"] = False
 
-        elif name == "escalation_triggered":
-            has_esc = turn.has_escalation or _matches_patterns(turn.agent_text, ESCALATION_PATTERNS)
-            check["actual"] = has_esc
-            check["passed"] = has_esc == expected
-            check["detail"] = (
-                f"Escalation {'detected' if has_esc else 'not detected'}"
-                f" (types: {turn.message_types})"
-            )
+    return check
 
-        elif name == "guardrail_triggered":
-            is_declined = _matches_patterns(turn.agent_text, GUARDRAIL_PATTERNS)
-            check["actual"] = is_declined
-            check["passed"] = is_declined == expected
-            check["detail"] = (
-                f"Guardrail {'triggered' if is_declined else 'not triggered'}"
-            )
 
-        elif name == "action_invoked":
-            has_action = turn.has_action_result
-            if isinstance(expected, bool):
-                check["actual"] = has_action
-                check["passed"] = has_action == expected
-                check["detail"] = (
-                    f"Action result {'present' if has_action else 'absent'}"
-                    f" (expected: {expected})"
-                )
-            else:
-                # String: check action was invoked AND the action name matches
-                action_name = str(expected)
-                raw_json = json.dumps(turn.raw_response)
-                name_found = action_name.lower() in raw_json.lower()
-                check["actual"] = has_action and name_found
-                check["passed"] = has_action and name_found
-                if not has_action:
-                    check["detail"] = f"No action result (expected action '{action_name}')"
-                elif not name_found:
-                    check["detail"] = f"Action invoked but '{action_name}' not found in response"
-                else:
-                    check["detail"] = f"Action '{action_name}' invoked successfully"
-
-        elif name == "has_action_result":
-            check["actual"] = turn.has_action_result
-            check["passed"] = turn.has_action_result == expected
-
-        elif name == "turn_elapsed_max":
-            elapsed = turn.elapsed_ms
-            check["actual"] = elapsed
-            check["passed"] = elapsed <= expected
-            check["detail"] = (
-                f"Turn took {elapsed:.0f}ms (max: {expected}ms)"
-                if elapsed <= expected
-                else f"Turn took {elapsed:.0f}ms — EXCEEDED max {expected}ms"
-            )
+# Heuristic phrase patterns used by individual checks (compiled once)
+_ACK_CHANGE_PATTERNS = tuple(re.compile(p) for p in (
+    r"(?i)(?:instead|sure|of\s+course|no\s+problem|let\s+me|I'?ll)",
+    r"(?i)(?:change|switch|update|rather|reschedule)",
+))
+_OFFERS_HELP_PATTERNS = tuple(re.compile(p) for p in (
+    r"(?i)(?:help|assist|can\s+I|would\s+you\s+like|let\s+me|try|here)",
+))
+_OFFERS_ALTERNATIVE_PATTERNS = tuple(re.compile(p) for p in (
+    r"(?i)(?:alternatively|another\s+option|you\s+(?:could|can)\s+also|try|instead|otherwise|how\s+about)",
+))
+_ACK_ERROR_PATTERNS = tuple(re.compile(p) for p in (
+    r"(?i)(?:sorry|apologize|error|issue|problem|unfortunately|went\s+wrong)",
+))
+_CONFUSION_PATTERNS = tuple(re.compile(p) for p in (
+    r"(?i)I\s+don'?t\s+have\s+(?:that|this)\s+information",
+    r"(?i)(?:could|can)\s+you\s+(?:please\s+)?(?:remind|tell)\s+me\s+again",
+    r"(?i)I'?m\s+not\s+(?:sure|aware)\s+(?:what|which)",
+))
+_PRIOR_OUTPUT_RE_ASK_PATTERNS = tuple(re.compile(p) for p in (
+    r"(?i)which\s+(?:account|record|order|contact|case)",
+    r"(?i)(?:could|can)\s+you\s+(?:provide|specify|tell\s+me)",
+))
+_RESOLVED_PATTERNS = tuple(re.compile(p) for p in (
+    r"(?i)(?:anything\s+else|is\s+there\s+anything|glad\s+I\s+could|happy\s+to\s+help)",
+    r"(?i)(?:done|complete|resolved|taken\s+care\s+of|all\s+set)",
+))
+_DECLINE_PATTERNS = tuple(re.compile(p) for p in (
+    r"(?i)(?:I'?m\s+)?(?:not\s+(?:able|equipped)|(?:can(?:'t|not))\s+(?:help|assist|provide))",
+    r"(?i)(?:outside|beyond)\s+(?:my|the)\s+(?:scope|area|capabilities)",
+    r"(?i)(?:focus|specialize)\s+(?:on|in)\s+(?:other|different)",
+))
+
+
+def _re_ask_patterns(keyword: str) -> List[str]:
+    """Patterns detecting the agent asking again for `keyword`."""
+    return [
+        rf"(?i)(?:what|which|could\s+you\s+(?:please\s+)?(?:provide|give|tell)).*{re.escape(keyword)}",
+        rf"(?i)(?:can\s+you|please)\s+(?:provide|share|give|tell).*{re.escape(keyword)}",
+    ]
+
+
+@_register_check("response_not_empty")
+def _check_response_not_empty(check, expected, turn, prior_turns, agent_text):
+    has_response = bool(agent_text.strip())
+    check["actual"] = has_response
+    check["passed"] = has_response == expected
+    check["detail"] = f"Response {'has' if has_response else 'has no'} content"
+
+
+@_register_check("response_contains")
+def _check_response_contains(check, expected, turn, prior_turns, agent_text):
+    if isinstance(expected, bool):
+        check["passed"] = False
+        check["detail"] = (
+            "response_contains expects a string, got bool. "
+            "Use response_not_empty for boolean checks."
+        )
+    else:
+        found = str(expected).lower() in agent_text.lower()
+        check["actual"] = found
+        check["passed"] = found
+        check["detail"] = f"'{expected}' {'found' if found else 'not found'} in response"
+
+
+@_register_check("response_contains_any")
+def _check_response_contains_any(check, expected, turn, prior_turns, agent_text):
+    text = agent_text.lower()
+    found_which = [v for v in expected if v.lower() in text]
+    found_any = bool(found_which)
+    check["actual"] = found_which
+    check["passed"] = found_any
+    check["detail"] = f"Found: {found_which}" if found_any else f"None of {expected} found"
+
+
+@_register_check("response_not_contains")
+def _check_response_not_contains(check, expected, turn, prior_turns, agent_text):
+    found = expected.lower() in agent_text.lower()
+    check["actual"] = not found
+    check["passed"] = not found
+    check["detail"] = f"'{expected}' {'absent (good)' if not found else 'found (bad)'}"
+
+
+@_register_check("topic_contains")
+def _check_topic_contains(check, expected, turn, prior_turns, agent_text):
+    # Heuristic: infer topic from response language (API doesn't return topic name)
+    # Use word-boundary matching to avoid false positives on substrings
+    found = bool(_word_boundary_pattern(expected.lower()).search(agent_text.lower()))
+    check["actual"] = found
+    check["passed"] = found
+    check["detail"] = (
+        f"Topic keyword '{expected}' {'inferred' if found else 'not found'} in response"
+        " (heuristic — word-boundary match)"
+    )
 
-        elif name == "response_acknowledges_change":
-            # Heuristic: look for acknowledgment phrases
-            ack_patterns = [
-                r"(?i)(?:instead|sure|of\s+course|no\s+problem|let\s+me|I'?ll)",
-                r"(?i)(?:change|switch|update|rather|reschedule)",
-            ]
-            acknowledged = _matches_patterns(turn.agent_text, ack_patterns)
-            check["actual"] = acknowledged
-            check["passed"] = acknowledged
-            check["detail"] = "Response acknowledges intent change" if acknowledged else "No acknowledgment detected"
-
-        elif name == "response_offers_help":
-            help_patterns = [
-                r"(?i)(?:help|assist|can\s+I|would\s+you\s+like|let\s+me|try|here)",
-            ]
-            offers_help = _matches_patterns(turn.agent_text, help_patterns)
-            check["actual"] = offers_help
-            check["passed"] = offers_help
-            check["detail"] = "Help offered" if offers_help else "No help offered"
-
-        elif name == "response_offers_alternative":
-            alt_patterns = [
-                r"(?i)(?:alternatively|another\s+option|you\s+(?:could|can)\s+also|try|instead|otherwise|how\s+about)",
-            ]
-            has_alt = _matches_patterns(turn.agent_text, alt_patterns)
-            check["actual"] = has_alt
-            check["passed"] = has_alt
-            check["detail"] = "Alternative offered" if has_alt else "No alternative detected"
-
-        elif name == "response_acknowledges_error":
-            err_patterns = [
-                r"(?i)(?:sorry|apologize|error|issue|problem|unfortunately|went\s+wrong)",
-            ]
-            acknowledged = _matches_patterns(turn.agent_text, err_patterns)
-            check["actual"] = acknowledged
-            check["passed"] = acknowledged
-            check["detail"] = "Error acknowledged" if acknowledged else "No error acknowledgment"
-
-        elif name == "resumes_normal":
-            # Check that the response is non-empty and doesn't contain guardrail language
-            is_normal = turn.has_response and not _matches_patterns(turn.agent_text, GUARDRAIL_PATTERNS)
-            check["actual"] = is_normal
-            check["passed"] = is_normal
-            check["detail"] = "Normal conversation resumed" if is_normal else "Did not resume normally"
-
-        elif name == "no_re_ask_for":
-            # Check that the agent doesn't re-ask for information already provided
-            re_ask_patterns = [
-                rf"(?i)(?:what|which|could\s+you\s+(?:please\s+)?(?:provide|give|tell)).*{re.escape(expected.lower())}",
-                rf"(?i)(?:can\s+you|please)\s+(?:provide|share|give|tell).*{re.escape(expected.lower())}",
-            ]
-            re_asked = _matches_patterns(turn.agent_text, re_ask_patterns)
-            check["actual"] = not re_asked
-            check["passed"] = not re_asked
-            check["detail"] = (
-                f"Agent did NOT re-ask for '{expected}' (good)"
-                if not re_asked
-                else f"Agent RE-ASKED for '{expected}' (bad)"
-            )
 
-        elif name == "response_references":
-            val = str(expected).lower()
-            found = val in text
-            check["actual"] = found
-            check["passed"] = found
-            check["detail"] = f"Reference to '{expected}' {'found' if found else 'not found'}"
-
-        elif name == "response_references_both":
-            found_all = all(str(v).lower() in text for v in expected)
-            missing = [str(v) for v in expected if str(v).lower() not in text]
-            check["actual"] = found_all
-            check["passed"] = found_all
-            check["detail"] = f"All references found" if found_all else f"Missing: {missing}"
-
-        elif name == "context_retained":
-            # Soft check: the response is non-empty and doesn't indicate confusion
-            confusion_patterns = [
-                r"(?i)I\s+don'?t\s+have\s+(?:that|this)\s+information",
-                r"(?i)(?:could|can)\s+you\s+(?:please\s+)?(?:remind|tell)\s+me\s+again",
-                r"(?i)I'?m\s+not\s+(?:sure|aware)\s+(?:what|which)",
-            ]
-            no_confusion = turn.has_response and not _matches_patterns(turn.agent_text, confusion_patterns)
-            check["actual"] = no_confusion
-            check["passed"] = no_confusion
-            check["detail"] = "Context appears retained" if no_confusion else "Context may be lost"
-
-        elif name == "context_uses":
-            val = str(expected).lower()
-            found = val in text
-            check["actual"] = found
-            check["passed"] = found
-            check["detail"] = f"Context '{expected}' {'used' if found else 'not used'} in response"
-
-        elif name == "action_uses_variable":
-            # Heuristic: extract keyword from variable name and check agent didn't re-ask
-            keyword = _extract_variable_keyword(str(expected))
-            if keyword:
-                re_ask_patterns = [
-                    rf"(?i)(?:what|which|could\s+you\s+(?:please\s+)?(?:provide|give|tell)).*{re.escape(keyword)}",
-                    rf"(?i)(?:can\s+you|please)\s+(?:provide|share|give|tell).*{re.escape(keyword)}",
-                ]
-                re_asked = _matches_patterns(turn.agent_text, re_ask_patterns)
-                check["actual"] = not re_asked
-                check["passed"] = not re_asked
-                check["detail"] = (
-                    f"Variable {expected} appears used (agent did not re-ask for '{keyword}')"
-                    if not re_asked
-                    else f"Agent re-asked for '{keyword}' — variable {expected} may not be used"
-                )
-            else:
-                check["actual"] = "cannot_verify"
-                check["passed"] = True  # Soft pass if we can't extract a keyword
-                check["detail"] = f"Variable {expected} usage cannot be verified from response alone (check STDM)"
-
-        elif name == "action_uses_prior_output":
-            # Heuristic: check that agent doesn't re-ask for data from prior action
-            if prior_turns:
-                re_ask = _matches_patterns(turn.agent_text, [
-                    r"(?i)which\s+(?:account|record|order|contact|case)",
-                    r"(?i)(?:could|can)\s+you\s+(?:provide|specify|tell\s+me)",
-                ])
-                check["actual"] = not re_ask
-                check["passed"] = not re_ask
-                check["detail"] = (
-                    "Agent used prior action output (no re-ask)"
-                    if not re_ask
-                    else "Agent may have re-asked for prior action data"
-                )
-            else:
-                check["actual"] = True
-                check["passed"] = True
-                check["detail"] = "First turn — no prior output to check"
-
-        elif name == "conversation_resolved":
-            # Heuristic: response indicates resolution
-            resolve_patterns = [
-                r"(?i)(?:anything\s+else|is\s+there\s+anything|glad\s+I\s+could|happy\s+to\s+help)",
-                r"(?i)(?:done|complete|resolved|taken\s+care\s+of|all\s+set)",
-            ]
-            resolved = _matches_patterns(turn.agent_text, resolve_patterns)
-            check["actual"] = resolved
-            check["passed"] = resolved
-            check["detail"] = "Conversation appears resolved" if resolved else "Resolution not detected"
-
-        elif name == "response_declines_gracefully":
-            decline_patterns = [
-                r"(?i)(?:I'?m\s+)?(?:not\s+(?:able|equipped)|(?:can(?:'t|not))\s+(?:help|assist|provide))",
-                r"(?i)(?:outside|beyond)\s+(?:my|the)\s+(?:scope|area|capabilities)",
-                r"(?i)(?:focus|specialize)\s+(?:on|in)\s+(?:other|different)",
-            ]
-            declined = _matches_patterns(turn.agent_text, decline_patterns) or \
-                       _matches_patterns(turn.agent_text, GUARDRAIL_PATTERNS)
-            check["actual"] = declined
-            check["passed"] = declined
-            check["detail"] = "Gracefully declined" if declined else "Did not decline"
-
-        elif name == "response_matches_regex":
-            try:
-                match = re.search(expected, turn.agent_text)
-                check["actual"] = bool(match)
-                check["passed"] = bool(match)
-                check["detail"] = (
-                    f"Regex '{expected}' matched" if match
-                    else f"Regex '{expected}' did not match"
-                )
-            except re.error as regex_err:
-                check["passed"] = False
-                check["detail"] = f"Invalid regex '{expected}': {regex_err}"
-
-        elif name == "response_length_min":
-            actual_len = len(turn.agent_text.strip())
-            check["actual"] = actual_len
-            check["passed"] = actual_len >= expected
-            check["detail"] = (
-                f"Response length {actual_len} >= {expected} (min)"
-                if actual_len >= expected
-                else f"Response length {actual_len} < {expected} (min)"
-            )
+@_register_check("escalation_triggered")
+def _check_escalation_triggered(check, expected, turn, prior_turns, agent_text):
+    has_esc = turn.has_escalation or _matches_patterns(agent_text, ESCALATION_PATTERNS)
+    check["actual"] = has_esc
+    check["passed"] = has_esc == expected
+    check["detail"] = (
+        f"Escalation {'detected' if has_esc else 'not detected'}"
+        f" (types: {turn.message_types})"
+    )
 
-        elif name == "response_length_max":
-            actual_len = len(turn.agent_text.strip())
-            check["actual"] = actual_len
-            check["passed"] = actual_len <= expected
-            check["detail"] = (
-                f"Response length {actual_len} <= {expected} (max)"
-                if actual_len <= expected
-                else f"Response length {actual_len} > {expected} (max)"
-            )
 
-        elif name == "action_result_contains":
-            results = turn.action_results
-            results_str = json.dumps(results) if results else ""
-            found = str(expected).lower() in results_str.lower()
-            check["actual"] = found
-            check["passed"] = found
-            if not results:
-                check["detail"] = f"No action results to search for '{expected}'"
-                check["passed"] = False
-            elif found:
-                check["detail"] = f"'{expected}' found in action results"
-            else:
-                check["detail"] = f"'{expected}' not found in action results"
+@_register_check("guardrail_triggered")
+def _check_guardrail_triggered(check, expected, turn, prior_turns, agent_text):
+    is_declined = _matches_patterns(agent_text, GUARDRAIL_PATTERNS)
+    check["actual"] = is_declined
+    check["passed"] = is_declined == expected
+    check["detail"] = (
+        f"Guardrail {'triggered' if is_declined else 'not triggered'}"
+    )
 
+
+@_register_check("action_invoked")
+def _check_action_invoked(check, expected, turn, prior_turns, agent_text):
+    has_action = turn.has_action_result
+    if isinstance(expected, bool):
+        check["actual"] = has_action
+        check["passed"] = has_action == expected
+        check["detail"] = (
+            f"Action result {'present' if has_action else 'absent'}"
+            f" (expected: {expected})"
+        )
+    else:
+        # String: check action was invoked AND the action name matches
+        action_name = str(expected)
+        raw_json = json.dumps(turn.raw_response)
+        name_found = action_name.lower() in raw_json.lower()
+        check["actual"] = has_action and name_found
+        check["passed"] = has_action and name_found
+        if not has_action:
+            check["detail"] = f"No action result (expected action '{action_name}')"
+        elif not name_found:
+            check["detail"] = f"Action invoked but '{action_name}' not found in response"
         else:
-            check["detail"] = f"Unknown check '{name}' — skipped"
-            check["passed"] = True  # Don't fail on unknown checks
+            check["detail"] = f"Action '{action_name}' invoked successfully"
 
-    except Exception as e:
-        check["detail"] = f"Check error: {e}"
+
+@_register_check("has_action_result")
+def _check_has_action_result(check, expected, turn, prior_turns, agent_text):
+    check["actual"] = turn.has_action_result
+    check["passed"] = turn.has_action_result == expected
+
+
+@_register_check("turn_elapsed_max")
+def _check_turn_elapsed_max(check, expected, turn, prior_turns, agent_text):
+    elapsed = turn.elapsed_ms
+    check["actual"] = elapsed
+    check["passed"] = elapsed <= expected
+    check["detail"] = (
+        f"Turn took {elapsed:.0f}ms (max: {expected}ms)"
+        if elapsed <= expected
+        else f"Turn took {elapsed:.0f}ms — EXCEEDED max {expected}ms"
+    )
+
+
+@_register_check("response_acknowledges_change")
+def _check_response_acknowledges_change(check, expected, turn, prior_turns, agent_text):
+    # Heuristic: look for acknowledgment phrases
+    acknowledged = _matches_patterns(agent_text, _ACK_CHANGE_PATTERNS)
+    check["actual"] = acknowledged
+    check["passed"] = acknowledged
+    check["detail"] = "Response acknowledges intent change" if acknowledged else "No acknowledgment detected"
+
+
+@_register_check("response_offers_help")
+def _check_response_offers_help(check, expected, turn, prior_turns, agent_text):
+    offers_help = _matches_patterns(agent_text, _OFFERS_HELP_PATTERNS)
+    check["actual"] = offers_help
+    check["passed"] = offers_help
+    check["detail"] = "Help offered" if offers_help else "No help offered"
+
+
+@_register_check("response_offers_alternative")
+def _check_response_offers_alternative(check, expected, turn, prior_turns, agent_text):
+    has_alt = _matches_patterns(agent_text, _OFFERS_ALTERNATIVE_PATTERNS)
+    check["actual"] = has_alt
+    check["passed"] = has_alt
+    check["detail"] = "Alternative offered" if has_alt else "No alternative detected"
+
+
+@_register_check("response_acknowledges_error")
+def _check_response_acknowledges_error(check, expected, turn, prior_turns, agent_text):
+    acknowledged = _matches_patterns(agent_text, _ACK_ERROR_PATTERNS)
+    check["actual"] = acknowledged
+    check["passed"] = acknowledged
+    check["detail"] = "Error acknowledged" if acknowledged else "No error acknowledgment"
+
+
+@_register_check("resumes_normal")
+def _check_resumes_normal(check, expected, turn, prior_turns, agent_text):
+    # Check that the response is non-empty and doesn't contain guardrail language
+    is_normal = bool(agent_text.strip()) and not _matches_patterns(agent_text, GUARDRAIL_PATTERNS)
+    check["actual"] = is_normal
+    check["passed"] = is_normal
+    check["detail"] = "Normal conversation resumed" if is_normal else "Did not resume normally"
+
+
+@_register_check("no_re_ask_for")
+def _check_no_re_ask_for(check, expected, turn, prior_turns, agent_text):
+    # Check that the agent doesn't re-ask for information already provided
+    re_asked = _matches_patterns(agent_text, _re_ask_patterns(expected.lower()))
+    check["actual"] = not re_asked
+    check["passed"] = not re_asked
+    check["detail"] = (
+        f"Agent did NOT re-ask for '{expected}' (good)"
+        if not re_asked
+        else f"Agent RE-ASKED for '{expected}' (bad)"
+    )
+
+
+@_register_check("response_references")
+def _check_response_references(check, expected, turn, prior_turns, agent_text):
+    found = str(expected).lower() in agent_text.lower()
+    check["actual"] = found
+    check["passed"] = found
+    check["detail"] = f"Reference to '{expected}' {'found' if found else 'not found'}"
+
+
+@_register_check("response_references_both")
+def _check_response_references_both(check, expected, turn, prior_turns, agent_text):
+    text = agent_text.lower()
+    missing = [str(v) for v in expected if str(v).lower() not in text]
+    found_all = not missing
+    check["actual"] = found_all
+    check["passed"] = found_all
+    check["detail"] = f"All references found" if found_all else f"Missing: {missing}"
+
+
+@_register_check("context_retained")
+def _check_context_retained(check, expected, turn, prior_turns, agent_text):
+    # Soft check: the response is non-empty and doesn't indicate confusion
+    no_confusion = bool(agent_text.strip()) and not _matches_patterns(agent_text, _CONFUSION_PATTERNS)
+    check["actual"] = no_confusion
+    check["passed"] = no_confusion
+    check["detail"] = "Context appears retained" if no_confusion else "Context may be lost"
+
+
+@_register_check("context_uses")
+def _check_context_uses(check, expected, turn, prior_turns, agent_text):
+    found = str(expected).lower() in agent_text.lower()
+    check["actual"] = found
+    check["passed"] = found
+    check["detail"] = f"Context '{expected}' {'used' if found else 'not used'} in response"
+
+
+@_register_check("action_uses_variable")
+def _check_action_uses_variable(check, expected, turn, prior_turns, agent_text):
+    # Heuristic: extract keyword from variable name and check agent didn't re-ask
+    keyword = _extract_variable_keyword(str(expected))
+    if keyword:
+        re_asked = _matches_patterns(agent_text, _re_ask_patterns(keyword))
+        check["actual"] = not re_asked
+        check["passed"] = not re_asked
+        check["detail"] = (
+            f"Variable {expected} appears used (agent did not re-ask for '{keyword}')"
+            if not re_asked
+            else f"Agent re-asked for '{keyword}' — variable {expected} may not be used"
+        )
+    else:
+        check["actual"] = "cannot_verify"
+        check["passed"] = True  # Soft pass if we can't extract a keyword
+        check["detail"] = f"Variable {expected} usage cannot be verified from response alone (check STDM)"
+
+
+@_register_check("action_uses_prior_output")
+def _check_action_uses_prior_output(check, expected, turn, prior_turns, agent_text):
+    # Heuristic: check that agent doesn't re-ask for data from prior action
+    if prior_turns:
+        re_ask = _matches_patterns(agent_text, _PRIOR_OUTPUT_RE_ASK_PATTERNS)
+        check["actual"] = not re_ask
+        check["passed"] = not re_ask
+        check["detail"] = (
+            "Agent used prior action output (no re-ask)"
+            if not re_ask
+            else "Agent may have re-asked for prior action data"
+        )
+    else:
+        check["actual"] = True
+        check["passed"] = True
+        check["detail"] = "First turn — no prior output to check"
+
+
+@_register_check("conversation_resolved")
+def _check_conversation_resolved(check, expected, turn, prior_turns, agent_text):
+    # Heuristic: response indicates resolution
+    resolved = _matches_patterns(agent_text, _RESOLVED_PATTERNS)
+    check["actual"] = resolved
+    check["passed"] = resolved
+    check["detail"] = "Conversation appears resolved" if resolved else "Resolution not detected"
+
+
+@_register_check("response_declines_gracefully")
+def _check_response_declines_gracefully(check, expected, turn, prior_turns, agent_text):
+    declined = _matches_patterns(agent_text, _DECLINE_PATTERNS) or \
+               _matches_patterns(agent_text, GUARDRAIL_PATTERNS)
+    check["actual"] = declined
+    check["passed"] = declined
+    check["detail"] = "Gracefully declined" if declined else "Did not decline"
+
+
+@_register_check("response_matches_regex")
+def _check_response_matches_regex(check, expected, turn, prior_turns, agent_text):
+    try:
+        match = _compiled_regex(expected).search(agent_text)
+        check["actual"] = bool(match)
+        check["passed"] = bool(match)
+        check["detail"] = (
+            f"Regex '{expected}' matched" if match
+            else f"Regex '{expected}' did not match"
+        )
+    except re.error as regex_err:
         check["passed"] = False
+        check["detail"] = f"Invalid regex '{expected}': {regex_err}"
+
+
+@_register_check("response_length_min")
+def _check_response_length_min(check, expected, turn, prior_turns, agent_text):
+    actual_len = len(agent_text.strip())
+    check["actual"] = actual_len
+    check["passed"] = actual_len >= expected
+    check["detail"] = (
+        f"Response length {actual_len} >= {expected} (min)"
+        if actual_len >= expected
+        else f"Response length {actual_len} < {expected} (min)"
+    )
 
-    return check
 
+@_register_check("response_length_max")
+def _check_response_length_max(check, expected, turn, prior_turns, agent_text):
+    actual_len = len(agent_text.strip())
+    check["actual"] = actual_len
+    check["passed"] = actual_len <= expected
+    check["detail"] = (
+        f"Response length {actual_len} <= {expected} (max)"
+        if actual_len <= expected
+        else f"Response length {actual_len} > {expected} (max)"
+    )
+
+
+@_register_check("action_result_contains")
+def _check_action_result_contains(check, expected, turn, prior_turns, agent_text):
+    # Single C-level serialization of the (possibly nested) results;
+    # ensure_ascii=False keeps non-ASCII values searchable as-is.
+    results = turn.action_results
+    results_str = (
+        json.dumps(results, ensure_ascii=False, default=str).lower()
+        if results else ""
+    )
+    found = str(expected).lower() in results_str
+    check["actual"] = found
+    check["passed"] = found
+    if not results:
+        check["detail"] = f"No action results to search for '{expected}'"
+        check["passed"] = False
+    elif found:
+        check["detail"] = f"'{expected}' found in action results"
+    else:
+        check["detail"] = f"'{expected}' not found in action results"
 
-def _matches_patterns(text: str, patterns: List[str]) -> bool:
-    """Check if text matches any of the given regex patterns."""
-    return any(re.search(p, text) for p in patterns)
+
+def _matches_patterns(text: str, patterns: Sequence[Union[str, re.Pattern]]) -> bool:
+    """Check if text matches any of the given regex patterns (strings or precompiled)."""
+    return any(
+        (p.search(text) if isinstance(p, re.Pattern) else re.search(p, text))
+        for p in patterns
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _compiled_regex(pattern: str) -> re.Pattern:
+    """Compiled response_matches_regex pattern, cached per pattern string.
+
+    Raises re.error for invalid patterns (errors are not cached).
+    """
+    return re.compile(pattern)
+
+
+@functools.lru_cache(maxsize=1024)
+def _word_boundary_pattern(word: str) -> re.Pattern:
+    """Compiled whole-word matcher for a topic keyword, cached per keyword."""
+    return re.compile(rf"\b{re.escape(word)}\b")
 
 
 def _extract_variable_keyword(variable_name: str) -> Optional[str]:
@@ -955,6 +1043,15 @@ def _extract_variable_keyword(variable_name: str) -> Optional[str]:
 
 def load_scenarios(path: str) -> Dict[str, Any]:
     """Load YAML scenario file."""
+    # Imported lazily so --help and argument errors exit without loading pyyaml.
+    try:
+        import yaml
+    except ImportError:
+        raise ImportError(
+            "pyyaml is required for YAML template parsing. "
+            "Install with: pip3 install pyyaml"
+        )
+
     with open(path, "r") as f:
         return yaml.safe_load(f)
 
@@ -967,6 +1064,7 @@ def execute_scenario(
     verbose: bool = False,
     turn_retry: int = 0,
     stream: StreamingConsole = None,
+    _sleep: Callable[[float], None] = time.sleep,
 ) -> Dict[str, Any]:
     """
     Execute a single multi-turn test scenario.
@@ -979,6 +1077,7 @@ def execute_scenario(
         verbose: Print progress to stderr (legacy; prefer stream).
         turn_retry: Number of retries per turn on transient failures (default 0).
         stream: StreamingConsole for Rich-styled verbose output.
+        _sleep: Backoff sleep between turn retries (injectable for tests).
 
     Returns:
         Scenario result dict with turn results and evaluation.
@@ -1051,7 +1150,7 @@ def execute_scenario(
                                 stream.turn_retry(attempt + 1, turn_retry, str(send_err))
                             elif verbose:
                                 print(f"      ⟳ Retry {attempt + 1}/{turn_retry}: {send_err}", file=sys.stderr)
-                            time.sleep(1 * (attempt + 1))
+                            _sleep(1 * (attempt + 1))
                         else:
                             raise
                     if attempt < turn_retry and turn_result and turn_result.is_error:
@@ -1059,7 +1158,7 @@ def execute_scenario(
                             stream.turn_retry(attempt + 1, turn_retry, "turn error")
                         elif verbose:
                             print(f"      ⟳ Retry {attempt + 1}/{turn_retry}: turn error", file=sys.stderr)
-                        time.sleep(1 * (attempt + 1))
+                        _sleep(1 * (attempt + 1))
 
                 # Show agent response in streaming output
                 if stream and turn_result:
@@ -1462,7 +1561,8 @@ def _suggest_fix(category: str) -> str:
 # Main
 # ═══════════════════════════════════════════════════════════════════════════
 
-def main():
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the CLI argument parser (env-var defaults are read at build time)."""
     parser = argparse.ArgumentParser(
         description="Multi-Turn Agent Test Runner — execute YAML test scenarios via Agent Runtime API",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -1531,8 +1631,11 @@ Environment Variables:
                         help="Stream plain-text codeblock output (no ANSI). Implies --verbose.")
     parser.add_argument("--width", type=int, default=None,
                         help="Override terminal width for Rich rendering (auto-detected by default)")
+    return parser
 
-    args = parser.parse_args()
+
+def main():
+    args = _build_parser().parse_args()
 
     # --codeblock implies verbose + no-rich, and suppresses json-only
     if args.codeblock:
@@ -1605,7 +1708,7 @@ Environment Variables:
         s["_run_total"] = len(scenarios)
 
     # Execute scenarios — print header first, then auth indicator below it
-    parallel = getattr(args, 'parallel', 0)
+    parallel = args.parallel
     mode = f"parallel ({parallel} workers)" if parallel else "sequential"
     stream.run_header(len(scenarios), args.scenarios, mode)
     stream.auth_success()
@@ -1624,7 +1727,9 @@ Environment Variables:
             stream=stream,
         )
 
-    if parallel and parallel > 0 and len(scenarios) > 1:
+    if parallel > 0 and len(scenarios) > 1:
+        import concurrent.futures
+
         max_workers = min(parallel, len(scenarios))
         with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
             futures = {executor.submit(_run_one, s): s for s in scenarios}
@@ -1636,13 +1741,22 @@ Environment Variables:
 
     total_elapsed = (time.time() - start_time) * 1000
 
-    # Build aggregate results
-    passed_scenarios = sum(1 for s in scenario_results if s["status"] == "passed")
-    failed_scenarios = sum(1 for s in scenario_results if s["status"] == "failed")
-    error_scenarios = sum(1 for s in scenario_results if s["status"] == "error")
-    total_turns = sum(s["total_turns"] for s in scenario_results)
-    passed_turns = sum(s["pass_count"] for s in scenario_results)
-    failed_turns = sum(s["fail_count"] for s in scenario_results)
+    from datetime import datetime
+
+    # Build aggregate results (single pass over scenario results)
+    passed_scenarios = failed_scenarios = error_scenarios = 0
+    total_turns = passed_turns = failed_turns = 0
+    for s in scenario_results:
+        status = s["status"]
+        if status == "passed":
+            passed_scenarios += 1
+        elif status == "failed":
+            failed_scenarios += 1
+        elif status == "error":
+            error_scenarios += 1
+        total_turns += s["total_turns"]
+        passed_turns += s["pass_count"]
+        failed_turns += s["fail_count"]
 
     results = {
         "agent_id": args.agent_id,
@@ -77,3 +77,20 @@ class TestParseVariables:
         """A string without '=' raises ValueError."""
         with pytest.raises(ValueError, match="Invalid variable format"):
             parse_variables(["invalid"])
+
+    def test_empty_name_raises(self):
+        """A string with nothing before '=' raises ValueError."""
+        with pytest.raises(ValueError, match="Invalid variable format"):
+            parse_variables(["=value"])
+
+    @pytest.mark.parametrize("var_string", [" =value", ":Id=value", " :Id = value"])
+    def test_blank_name_raises(self, var_string):
+        """A name that is empty or only whitespace, typed or not, raises ValueError."""
+        with pytest.raises(ValueError, match="Invalid variable format"):
+            parse_variables([var_string])
+
+    def test_name_with_colons_splits_at_last(self):
+        """'a:b:Type=v' keeps 'a:b' as the name, stripped."""
+        result = parse_variables([" a:b : Number = 1"])
+
+        assert result[0] == {"name": "a:b", "type": "Number", "value": "1"}
@@ -7,10 +7,13 @@ topic_contains, escalation_triggered, guardrail_triggered, action_invoked,
 response_acknowledges_change, response_offers_help, no_re_ask_for, context_retained,
 resumes_normal, conversation_resolved, response_declines_gracefully, and unknown checks.
 
-Each test builds a TurnResult via sample_turn_result and verifies the expected
-pass/fail outcome from evaluate_turn().
+Single-check cases live in the EVALUATE_TURN_CASES table and run through one
+parametrized test; each builds a TurnResult via sample_turn_result and verifies
+the expected pass/fail outcome from evaluate_turn().
 """
 
+import re
+
 import pytest
 
 from multi_turn_test_runner import (
@@ -23,316 +26,139 @@ from multi_turn_test_runner import (
 
 
 # ─────────────────────────────────────────────────────────────────────────
-# response_not_empty
-# ─────────────────────────────────────────────────────────────────────────
-
-@pytest.mark.tier2
-@pytest.mark.offline
-def test_response_not_empty_passes(sample_turn_result):
-    """Non-empty response with response_not_empty: true should pass."""
-    turn = sample_turn_result(agent_text="I can help you with that.")
-    result = evaluate_turn(turn, {"response_not_empty": True}, [])
-    assert result["passed"] is True
-    assert result["pass_count"] == 1
-    assert result["fail_count"] == 0
-
-
-@pytest.mark.tier2
-@pytest.mark.offline
-def test_response_not_empty_fails(sample_turn_result):
-    """Empty response with response_not_empty: true should fail."""
-    turn = sample_turn_result(agent_text="")
-    result = evaluate_turn(turn, {"response_not_empty": True}, [])
-    assert result["passed"] is False
-    assert result["fail_count"] == 1
-
-
-# ─────────────────────────────────────────────────────────────────────────
-# response_contains
-# ─────────────────────────────────────────────────────────────────────────
-
-@pytest.mark.tier2
-@pytest.mark.offline
-def test_response_contains_passes(sample_turn_result):
-    """Case-insensitive substring match should pass."""
-    turn = sample_turn_result(agent_text="I can help with your order")
-    result = evaluate_turn(turn, {"response_contains": "order"}, [])
-    assert result["passed"] is True
-
-
-@pytest.mark.tier2
-@pytest.mark.offline
-def test_response_contains_fails(sample_turn_result):
-    """Missing substring should fail."""
-    turn = sample_turn_result(agent_text="Hello there")
-    result = evaluate_turn(turn, {"response_contains": "order"}, [])
-    assert result["passed"] is False
-
-
-# ─────────────────────────────────────────────────────────────────────────
-# response_contains_any
-# ─────────────────────────────────────────────────────────────────────────
-
-@pytest.mark.tier2
-@pytest.mark.offline
-def test_response_contains_any_passes(sample_turn_result):
-    """At least one word from the list is present."""
-    turn = sample_turn_result(agent_text="I can cancel your appointment")
-    result = evaluate_turn(turn, {"response_contains_any": ["cancel", "delete"]}, [])
-    assert result["passed"] is True
-
-
-@pytest.mark.tier2
-@pytest.mark.offline
-def test_response_contains_any_fails(sample_turn_result):
-    """None of the listed words are present."""
-    turn = sample_turn_result(agent_text="Hello there, how are you?")
-    result = evaluate_turn(turn, {"response_contains_any": ["cancel", "delete"]}, [])
-    assert result["passed"] is False
-
-
-# ─────────────────────────────────────────────────────────────────────────
-# response_not_contains
-# ─────────────────────────────────────────────────────────────────────────
-
-@pytest.mark.tier2
-@pytest.mark.offline
-def test_response_not_contains_passes(sample_turn_result):
-    """Forbidden word absent from response should pass."""
-    turn = sample_turn_result(agent_text="Everything looks good.")
-    result = evaluate_turn(turn, {"response_not_contains": "error"}, [])
-    assert result["passed"] is True
-
-
-@pytest.mark.tier2
-@pytest.mark.offline
-def test_response_not_contains_fails(sample_turn_result):
-    """Forbidden word present in response should fail."""
-    turn = sample_turn_result(agent_text="There was an error processing your request.")
-    result = evaluate_turn(turn, {"response_not_contains": "error"}, [])
-    assert result["passed"] is False
-
-
-# ─────────────────────────────────────────────────────────────────────────
-# topic_contains
-# ─────────────────────────────────────────────────────────────────────────
-
-@pytest.mark.tier2
-@pytest.mark.offline
-def test_topic_contains_passes(sample_turn_result):
-    """Response mentions the expected topic keyword."""
-    turn = sample_turn_result(agent_text="I can help you cancel your subscription.")
-    result = evaluate_turn(turn, {"topic_contains": "cancel"}, [])
-    assert result["passed"] is True
-
-
-# ─────────────────────────────────────────────────────────────────────────
-# escalation_triggered
-# ─────────────────────────────────────────────────────────────────────────
-
-@pytest.mark.tier2
-@pytest.mark.offline
-def test_escalation_triggered_by_message_type(sample_turn_result):
-    """TurnResult with Escalation message type should detect escalation."""
-    turn = sample_turn_result(
-        agent_text="Let me connect you to a specialist.",
-        has_escalation=True,
-    )
-    result = evaluate_turn(turn, {"escalation_triggered": True}, [])
-    assert result["passed"] is True
-
-
-@pytest.mark.tier2
-@pytest.mark.offline
-def test_escalation_triggered_by_pattern(sample_turn_result):
-    """Response text matching ESCALATION_PATTERNS should detect escalation."""
-    turn = sample_turn_result(
-        agent_text="I'll connect you to a human agent right away.",
-        has_escalation=False,
-    )
-    result = evaluate_turn(turn, {"escalation_triggered": True}, [])
-    assert result["passed"] is True
-
-
-@pytest.mark.tier2
-@pytest.mark.offline
-def test_escalation_not_triggered(sample_turn_result):
-    """Normal response with escalation_triggered: false should pass."""
-    turn = sample_turn_result(agent_text="Here is the information you requested.")
-    result = evaluate_turn(turn, {"escalation_triggered": False}, [])
-    assert result["passed"] is True
-
-
-# ─────────────────────────────────────────────────────────────────────────
-# guardrail_triggered
-# ─────────────────────────────────────────────────────────────────────────
-
-@pytest.mark.tier2
-@pytest.mark.offline
-def test_guardrail_triggered_passes(sample_turn_result):
-    """Response matching guardrail pattern with guardrail_triggered: true should pass."""
-    turn = sample_turn_result(agent_text="I can't help with that request.")
-    result = evaluate_turn(turn, {"guardrail_triggered": True}, [])
-    assert result["passed"] is True
-
-
-@pytest.mark.tier2
-@pytest.mark.offline
-def test_guardrail_not_triggered(sample_turn_result):
-    """Normal response with guardrail_triggered: false should pass."""
-    turn = sample_turn_result(agent_text="Sure, let me look that up for you.")
-    result = evaluate_turn(turn, {"guardrail_triggered": False}, [])
-    assert result["passed"] is True
+# Single-check cases: (id, turn kwargs, expectations, expected passed)
+# ─────────────────────────────────────────────────────────────────────────
+
+EVALUATE_TURN_CASES = [
+    # response_not_empty
+    ("response_not_empty_passes",
+     {"agent_text": "I can help you with that."}, {"response_not_empty": True}, True),
+    ("response_not_empty_fails",
+     {"agent_text": ""}, {"response_not_empty": True}, False),
+    # response_contains — case-insensitive substring match
+    ("response_contains_passes",
+     {"agent_text": "I can help with your order"}, {"response_contains": "order"}, True),
+    ("response_contains_fails",
+     {"agent_text": "Hello there"}, {"response_contains": "order"}, False),
+    # response_contains_any — at least one word from the list
+    ("response_contains_any_passes",
+     {"agent_text": "I can cancel your appointment"},
+     {"response_contains_any": ["cancel", "delete"]}, True),
+    ("response_contains_any_fails",
+     {"agent_text": "Hello there, how are you?"},
+     {"response_contains_any": ["cancel", "delete"]}, False),
+    # response_not_contains — forbidden word
+    ("response_not_contains_passes",
+     {"agent_text": "Everything looks good."}, {"response_not_contains": "error"}, True),
+    ("response_not_contains_fails",
+     {"agent_text": "There was an error processing your request."},
+     {"response_not_contains": "error"}, False),
+    # topic_contains
+    ("topic_contains_passes",
+     {"agent_text": "I can help you cancel your subscription."},
+     {"topic_contains": "cancel"}, True),
+    # escalation_triggered — by message type, by ESCALATION_PATTERNS, or absent
+    ("escalation_triggered_by_message_type",
+     {"agent_text": "Let me connect you to a specialist.", "has_escalation": True},
+     {"escalation_triggered": True}, True),
+    ("escalation_triggered_by_pattern",
+     {"agent_text": "I'll connect you to a human agent right away."},
+     {"escalation_triggered": True}, True),
+    ("escalation_not_triggered",
+     {"agent_text": "Here is the information you requested."},
+     {"escalation_triggered": False}, True),
+    # guardrail_triggered
+    ("guardrail_triggered_passes",
+     {"agent_text": "I can't help with that request."}, {"guardrail_triggered": True}, True),
+    ("guardrail_not_triggered",
+     {"agent_text": "Sure, let me look that up for you."}, {"guardrail_triggered": False}, True),
+    # action_invoked (bool form)
+    ("action_invoked_passes_bool",
+     {"agent_text": "I found your order details.", "has_action_result": True},
+     {"action_invoked": True}, True),
+    # response_acknowledges_change
+    ("response_acknowledges_change",
+     {"agent_text": "Sure, let me switch to that instead."},
+     {"response_acknowledges_change": True}, True),
+    # response_offers_help
+    ("response_offers_help",
+     {"agent_text": "Can I help you with anything else?"}, {"response_offers_help": True}, True),
+    # no_re_ask_for
+    ("no_re_ask_for_passes",
+     {"agent_text": "I've located order #12345. It ships tomorrow."},
+     {"no_re_ask_for": "order number"}, True),
+    ("no_re_ask_for_fails",
+     {"agent_text": "Could you please provide the order number?"},
+     {"no_re_ask_for": "order number"}, False),
+    # context_retained — non-empty and no confusion patterns
+    ("context_retained_passes",
+     {"agent_text": "Your order ships tomorrow as we discussed."},
+     {"context_retained": True}, True),
+    ("context_retained_fails",
+     {"agent_text": "I don't have that information."}, {"context_retained": True}, False),
+    # resumes_normal — non-empty and no guardrail patterns
+    ("resumes_normal_passes",
+     {"agent_text": "Great, let me look up that order for you."}, {"resumes_normal": True}, True),
+    # conversation_resolved
+    ("conversation_resolved",
+     {"agent_text": "Is there anything else I can help with?"},
+     {"conversation_resolved": True}, True),
+    # response_declines_gracefully
+    ("response_declines_gracefully",
+     {"agent_text": "I'm not able to assist with that."},
+     {"response_declines_gracefully": True}, True),
+]
+
+
+@pytest.mark.tier2
+@pytest.mark.offline
+@pytest.mark.parametrize(
+    "turn_kwargs,expectations,expected_passed",
+    [case[1:] for case in EVALUATE_TURN_CASES],
+    ids=[case[0] for case in EVALUATE_TURN_CASES],
+)
+def test_single_check(sample_turn_result, turn_kwargs, expectations, expected_passed):
+    """Each check type yields the expected pass/fail for a representative response."""
+    turn = sample_turn_result(**turn_kwargs)
+    result = evaluate_turn(turn, expectations, [])
+    assert result["passed"] is expected_passed
+    assert result["pass_count"] == int(expected_passed)
+    assert result["fail_count"] == int(not expected_passed)
 
 
 # ─────────────────────────────────────────────────────────────────────────
-# action_invoked
+# action_invoked (string form)
 # ─────────────────────────────────────────────────────────────────────────
 
-@pytest.mark.tier2
-@pytest.mark.offline
-def test_action_invoked_passes_bool(sample_turn_result):
-    """TurnResult with has_action_result=True should pass action_invoked: true."""
-    turn = sample_turn_result(
-        agent_text="I found your order details.",
-        has_action_result=True,
-    )
-    result = evaluate_turn(turn, {"action_invoked": True}, [])
-    assert result["passed"] is True
-
-
 @pytest.mark.tier2
 @pytest.mark.offline
 def test_action_invoked_passes_string(sample_turn_result):
     """action_invoked with string checks action name in raw_response."""
-    from agent_api_client import TurnResult, AgentMessage
-    turn = TurnResult(
-        sequence_id=1,
+    turn = sample_turn_result(
         user_message="Look up order",
-        agent_messages=[AgentMessage(
-            type="Inform", id="msg-001", message="I found your order details.",
-            result=[{"orderId": "12345"}],
-        )],
-        raw_response={"messages": [
-            {"type": "Inform", "message": "Found it.", "actionName": "LookupOrder"}
-        ]},
-        elapsed_ms=100.0,
+        messages=[{
+            "message": "I found your order details.",
+            "result": [{"orderId": "12345"}],
+            "actionName": "LookupOrder",
+        }],
     )
     result = evaluate_turn(turn, {"action_invoked": "LookupOrder"}, [])
     assert result["passed"] is True
 
 
 # ─────────────────────────────────────────────────────────────────────────
-# response_acknowledges_change
+# Precompiled pattern tables
 # ─────────────────────────────────────────────────────────────────────────
 
 @pytest.mark.tier2
 @pytest.mark.offline
-def test_response_acknowledges_change(sample_turn_result):
-    """Response with acknowledgment phrases should pass."""
-    turn = sample_turn_result(agent_text="Sure, let me switch to that instead.")
-    result = evaluate_turn(turn, {"response_acknowledges_change": True}, [])
-    assert result["passed"] is True
-
-
-# ─────────────────────────────────────────────────────────────────────────
-# response_offers_help
-# ─────────────────────────────────────────────────────────────────────────
-
-@pytest.mark.tier2
-@pytest.mark.offline
-def test_response_offers_help(sample_turn_result):
-    """Response offering assistance should pass."""
-    turn = sample_turn_result(agent_text="Can I help you with anything else?")
-    result = evaluate_turn(turn, {"response_offers_help": True}, [])
-    assert result["passed"] is True
-
-
-# ─────────────────────────────────────────────────────────────────────────
-# no_re_ask_for
-# ─────────────────────────────────────────────────────────────────────────
-
-@pytest.mark.tier2
-@pytest.mark.offline
-def test_no_re_ask_for_passes(sample_turn_result):
-    """Response that does NOT re-ask for already-given info should pass."""
-    turn = sample_turn_result(agent_text="I've located order #12345. It ships tomorrow.")
-    result = evaluate_turn(turn, {"no_re_ask_for": "order number"}, [])
-    assert result["passed"] is True
-
-
-@pytest.mark.tier2
-@pytest.mark.offline
-def test_no_re_ask_for_fails(sample_turn_result):
-    """Response that re-asks for info should fail."""
-    turn = sample_turn_result(
-        agent_text="Could you please provide the order number?"
-    )
-    result = evaluate_turn(turn, {"no_re_ask_for": "order number"}, [])
-    assert result["passed"] is False
-
-
-# ─────────────────────────────────────────────────────────────────────────
-# context_retained
-# ─────────────────────────────────────────────────────────────────────────
-
-@pytest.mark.tier2
-@pytest.mark.offline
-def test_context_retained_passes(sample_turn_result):
-    """Non-empty response without confusion patterns should pass."""
-    turn = sample_turn_result(agent_text="Your order ships tomorrow as we discussed.")
-    result = evaluate_turn(turn, {"context_retained": True}, [])
-    assert result["passed"] is True
-
-
-@pytest.mark.tier2
-@pytest.mark.offline
-def test_context_retained_fails(sample_turn_result):
-    """Response indicating lost context should fail."""
-    turn = sample_turn_result(agent_text="I don't have that information.")
-    result = evaluate_turn(turn, {"context_retained": True}, [])
-    assert result["passed"] is False
-
-
-# ─────────────────────────────────────────────────────────────────────────
-# resumes_normal
-# ─────────────────────────────────────────────────────────────────────────
-
-@pytest.mark.tier2
-@pytest.mark.offline
-def test_resumes_normal_passes(sample_turn_result):
-    """Non-empty response without guardrail patterns should pass."""
-    turn = sample_turn_result(agent_text="Great, let me look up that order for you.")
-    result = evaluate_turn(turn, {"resumes_normal": True}, [])
-    assert result["passed"] is True
-
-
-# ─────────────────────────────────────────────────────────────────────────
-# conversation_resolved
-# ─────────────────────────────────────────────────────────────────────────
-
-@pytest.mark.tier2
-@pytest.mark.offline
-def test_conversation_resolved(sample_turn_result):
-    """Response with resolution phrases should pass."""
-    turn = sample_turn_result(
-        agent_text="Is there anything else I can help with?"
-    )
-    result = evaluate_turn(turn, {"conversation_resolved": True}, [])
-    assert result["passed"] is True
-
-
-# ─────────────────────────────────────────────────────────────────────────
-# response_declines_gracefully
-# ─────────────────────────────────────────────────────────────────────────
-
-@pytest.mark.tier2
-@pytest.mark.offline
-def test_response_declines_gracefully(sample_turn_result):
-    """Response with decline phrases should pass."""
-    turn = sample_turn_result(agent_text="I'm not able to assist with that.")
-    result = evaluate_turn(turn, {"response_declines_gracefully": True}, [])
-    assert result["passed"] is True
+def test_pattern_tables_are_precompiled():
+    """GUARDRAIL_PATTERNS / ESCALATION_PATTERNS are compiled once at import."""
+    for pattern in GUARDRAIL_PATTERNS + ESCALATION_PATTERNS:
+        assert isinstance(pattern, re.Pattern)
+    assert _matches_patterns("I can't help with that request.", GUARDRAIL_PATTERNS)
+    assert _matches_patterns("Let me transfer you to a human agent.", ESCALATION_PATTERNS)
+    assert not _matches_patterns("Your order ships tomorrow.", GUARDRAIL_PATTERNS)
 
 
 # ─────────────────────────────────────────────────────────────────────────
@@ -355,13 +181,6 @@ def test_unknown_check_passes(sample_turn_result):
 def test_multiple_checks_mixed(sample_turn_result):
     """Mix of passing and failing checks, verify counts."""
     turn = sample_turn_result(agent_text="Hello there, I can help")
-    expectations = {
-        "response_not_empty": True,        # passes
-        "response_contains": "help",       # passes
-        "response_contains": "order",      # fails  (dict dedup: last wins)
-    }
-    # Since dicts dedup, use a different approach: build expectations with
-    # one passing and one failing check.
     expectations = {
         "response_not_empty": True,        # passes (has content)
         "response_contains": "order",      # fails  ("order" not in text)
@@ -33,6 +33,8 @@ KNOWN_CHECK_TO_CATEGORY = {
     "action_result_contains": "ACTION_CHAIN_FAILURE",
 }
 
+FALLBACK_FIX = "Review agent configuration for this failure type"
+
 ALL_CATEGORIES = {
     "TOPIC_RE_MATCHING_FAILURE",
     "CONTEXT_PRESERVATION_FAILURE",
@@ -50,12 +52,11 @@ ALL_CATEGORIES = {
 def test_all_categories_mapped():
     """Every known check name returns the expected failure category."""
     dummy_turn = {"agent_text": "", "evaluation": {}}
-    for check_name, expected_category in KNOWN_CHECK_TO_CATEGORY.items():
-        category = _infer_failure_category(check_name, dummy_turn)
-        assert category == expected_category, (
-            f"Check '{check_name}' expected category '{expected_category}', "
-            f"got '{category}'"
-        )
+    actual = {
+        check_name: _infer_failure_category(check_name, dummy_turn)
+        for check_name in KNOWN_CHECK_TO_CATEGORY
+    }
+    assert actual == KNOWN_CHECK_TO_CATEGORY
 
 
 @pytest.mark.tier2
@@ -70,11 +71,10 @@ def test_unknown_check_returns_none():
 @pytest.mark.offline
 def test_all_categories_have_fixes():
     """All 8 failure categories have a non-empty fix suggestion from _suggest_fix()."""
-    for category in ALL_CATEGORIES:
-        fix = _suggest_fix(category)
-        assert fix is not None, f"Category '{category}' returned None fix"
-        assert len(fix) > 0, f"Category '{category}' returned empty fix"
-        # Ensure it's not the fallback message (meaning the category IS mapped)
-        assert fix != "Review agent configuration for this failure type", (
-            f"Category '{category}' fell through to default fix"
-        )
+    fixes = {category: _suggest_fix(category) for category in ALL_CATEGORIES}
+    # A non-empty, non-fallback message means the category IS mapped
+    unmapped = {
+        category: fix for category, fix in fixes.items()
+        if not fix or fix == FALLBACK_FIX
+    }
+    assert unmapped == {}
@@ -10,8 +10,12 @@ Tests for:
 
 import pytest
 
-from multi_turn_test_runner import evaluate_turn, _run_check
-from agent_api_client import TurnResult, AgentMessage
+from multi_turn_test_runner import evaluate_turn, _run_check, _compiled_regex
+
+
+_LONG_200 = "x" * 200
+_RGX_ORDER = r"Order #\d+"
+_RGX_BROKEN = r"[invalid("
 
 
 # ─────────────────────────────────────────────────────────────────────────
@@ -23,7 +27,7 @@ from agent_api_client import TurnResult, AgentMessage
 def test_regex_passes(sample_turn_result):
     """Regex that matches response text should pass."""
     turn = sample_turn_result(agent_text="Order #12345 confirmed for delivery.")
-    result = evaluate_turn(turn, {"response_matches_regex": r"Order #\d+"}, [])
+    result = evaluate_turn(turn, {"response_matches_regex": _RGX_ORDER}, [])
     assert result["passed"] is True
 
 
@@ -32,7 +36,7 @@ def test_regex_passes(sample_turn_result):
 def test_regex_fails(sample_turn_result):
     """Regex that doesn't match response text should fail."""
     turn = sample_turn_result(agent_text="Hello there, how can I help?")
-    result = evaluate_turn(turn, {"response_matches_regex": r"Order #\d+"}, [])
+    result = evaluate_turn(turn, {"response_matches_regex": _RGX_ORDER}, [])
     assert result["passed"] is False
 
 
@@ -41,11 +45,18 @@ def test_regex_fails(sample_turn_result):
 def test_regex_invalid_pattern(sample_turn_result):
     """Invalid regex should fail gracefully with error detail."""
     turn = sample_turn_result(agent_text="Hello there")
-    result = evaluate_turn(turn, {"response_matches_regex": r"[invalid("}, [])
+    result = evaluate_turn(turn, {"response_matches_regex": _RGX_BROKEN}, [])
     assert result["passed"] is False
     assert "Invalid regex" in result["checks"][0]["detail"]
 
 
+@pytest.mark.tier2
+@pytest.mark.offline
+def test_regex_compiled_once_per_pattern():
+    """Repeated checks with the same pattern reuse one compiled regex."""
+    assert _compiled_regex(_RGX_ORDER) is _compiled_regex(_RGX_ORDER)
+
+
 # ─────────────────────────────────────────────────────────────────────────
 # response_length_min
 # ─────────────────────────────────────────────────────────────────────────
@@ -94,7 +105,7 @@ def test_length_max_passes(sample_turn_result):
 @pytest.mark.offline
 def test_length_max_fails(sample_turn_result):
     """Response longer than max should fail."""
-    turn = sample_turn_result(agent_text="x" * 200)
+    turn = sample_turn_result(agent_text=_LONG_200)
     result = evaluate_turn(turn, {"response_length_max": 100}, [])
     assert result["passed"] is False
 
@@ -105,81 +116,19 @@ def test_length_max_fails(sample_turn_result):
 
 @pytest.mark.tier2
 @pytest.mark.offline
-def test_action_result_contains_passes():
-    """String found in action results should pass."""
-    turn = TurnResult(
-        sequence_id=1,
-        user_message="Check status",
-        agent_messages=[AgentMessage(
-            type="Inform", id="msg-001", message="Here are the results.",
-            result=[{"Status": "Success", "OrderId": "ORD-123"}],
-        )],
-        raw_response={},
-        elapsed_ms=100.0,
-    )
-    result = evaluate_turn(turn, {"action_result_contains": "Success"}, [])
-    assert result["passed"] is True
-
-
-@pytest.mark.tier2
-@pytest.mark.offline
-def test_action_result_contains_fails():
-    """String not in action results should fail."""
-    turn = TurnResult(
-        sequence_id=1,
-        user_message="Check status",
-        agent_messages=[AgentMessage(
-            type="Inform", id="msg-001", message="Here are the results.",
-            result=[{"Status": "Failed", "Reason": "Not found"}],
-        )],
-        raw_response={},
-        elapsed_ms=100.0,
-    )
-    result = evaluate_turn(turn, {"action_result_contains": "Success"}, [])
-    assert result["passed"] is False
-
-
-@pytest.mark.tier2
-@pytest.mark.offline
-def test_action_result_contains_no_results(sample_turn_result):
-    """No action results at all should fail."""
-    turn = sample_turn_result(agent_text="No results here.")
-    result = evaluate_turn(turn, {"action_result_contains": "Success"}, [])
-    assert result["passed"] is False
-    assert "No action results" in result["checks"][0]["detail"]
-
-
-@pytest.mark.tier2
-@pytest.mark.offline
-def test_action_result_contains_nested():
-    """String in nested action result structure should pass."""
-    turn = TurnResult(
-        sequence_id=1,
-        user_message="Get details",
-        agent_messages=[AgentMessage(
-            type="Inform", id="msg-001", message="Details found.",
-            result=[{"data": {"nested": {"value": "SpecialToken123"}}}],
-        )],
-        raw_response={},
-        elapsed_ms=100.0,
-    )
-    result = evaluate_turn(turn, {"action_result_contains": "SpecialToken123"}, [])
-    assert result["passed"] is True
-
-
-@pytest.mark.tier2
-@pytest.mark.offline
-def test_action_result_contains_case_insensitive():
-    """action_result_contains should be case-insensitive."""
-    turn = TurnResult(
-        sequence_id=1,
-        user_message="Check",
-        agent_messages=[AgentMessage(
-            type="Inform", id="msg-001", message="Done.",
-            result=[{"Status": "SUCCESS"}],
-        )],
-        raw_response={},
-        elapsed_ms=100.0,
-    )
-    result = evaluate_turn(turn, {"action_result_contains": "success"}, [])
-    assert result["passed"] is True
+@pytest.mark.parametrize("result, needle, expect_pass, detail_contains", [
+    ([{"Status": "Success", "OrderId": "ORD-123"}], "Success", True, None),
+    ([{"Status": "Failed", "Reason": "Not found"}], "Success", False, None),
+    ([], "Success", False, "No action results"),
+    ([{"data": {"nested": {"value": "SpecialToken123"}}}], "SpecialToken123", True, None),
+    ([{"Status": "SUCCESS"}], "success", True, None),
+    # Non-ASCII values are matched as written, not as JSON escape sequences
+    ([{"City": "Zürich"}], "zürich", True, None),
+], ids=["passes", "fails", "no_results", "nested", "case_insensitive", "non_ascii"])
+def test_action_result_contains(sample_turn_result, result, needle, expect_pass, detail_contains):
+    """action_result_contains searches action results case-insensitively."""
+    turn = sample_turn_result(messages=[{"message": "Here are the results.", "result": result}])
+    outcome = evaluate_turn(turn, {"action_result_contains": needle}, [])
+    assert outcome["passed"] is expect_pass
+    if detail_contains:
+        assert detail_contains in outcome["checks"][0]["detail"]
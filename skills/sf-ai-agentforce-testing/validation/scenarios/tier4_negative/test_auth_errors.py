@@ -11,21 +11,27 @@ Tests:
     4. test_error_description_surfaced — error_description from body appears in message
 """
 
-import io
 import json
-import sys
-from pathlib import Path
 
 import pytest
 from urllib.error import HTTPError
 
-# Allow importing helpers from the validation conftest
-sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
-
 from agent_api_client import AgentAPIClient, AgentAPIError
 from conftest import make_mock_response, make_http_error
 
 
+_TOKEN_URL = "https://test.my.salesforce.com/services/oauth2/token"
+
+
+def _token_error(code: int, error: str, description: str) -> HTTPError:
+    """Build a fresh token-endpoint HTTPError for a single test."""
+    return make_http_error(
+        code=code,
+        body={"error": error, "error_description": description},
+        url=_TOKEN_URL,
+    )
+
+
 # ---------------------------------------------------------------------------
 # Tests
 # ---------------------------------------------------------------------------
@@ -34,15 +40,7 @@ from conftest import make_mock_response, make_http_error
 @pytest.mark.offline
 def test_http_401_error(mock_urlopen):
     """HTTP 401 from token endpoint raises AgentAPIError with status_code=401."""
-    error_body = {
-        "error": "invalid_client",
-        "error_description": "Invalid credentials",
-    }
-    mock_urlopen.side_effect = make_http_error(
-        code=401,
-        body=error_body,
-        url="https://test.my.salesforce.com/services/oauth2/token",
-    )
+    mock_urlopen.side_effect = _token_error(401, "invalid_client", "Invalid credentials")
 
     client = AgentAPIClient(
         my_domain="https://test.my.salesforce.com",
@@ -61,15 +59,7 @@ def test_http_401_error(mock_urlopen):
 @pytest.mark.offline
 def test_http_403_error(mock_urlopen):
     """HTTP 403 from token endpoint raises AgentAPIError with 'Authentication failed'."""
-    error_body = {
-        "error": "forbidden",
-        "error_description": "Forbidden",
-    }
-    mock_urlopen.side_effect = make_http_error(
-        code=403,
-        body=error_body,
-        url="https://test.my.salesforce.com/services/oauth2/token",
-    )
+    mock_urlopen.side_effect = _token_error(403, "forbidden", "Forbidden")
 
     client = AgentAPIClient(
         my_domain="https://test.my.salesforce.com",
@@ -89,7 +79,7 @@ def test_http_403_error(mock_urlopen):
 def test_malformed_token_response(mock_urlopen):
     """Non-JSON 200 response from token endpoint raises json.JSONDecodeError.
 
-    The authenticate() method does json.loads(resp.read().decode()) inside the
+    The authenticate() method does _json_loads(resp.read()) inside the
     try block. A 200 response with HTML body is not caught by the HTTPError
     handler, so json.JSONDecodeError propagates unhandled.
     """
@@ -112,15 +102,7 @@ def test_malformed_token_response(mock_urlopen):
 @pytest.mark.offline
 def test_error_description_surfaced(mock_urlopen):
     """error_description from the OAuth error body is surfaced in AgentAPIError.message."""
-    error_body = {
-        "error": "invalid_grant",
-        "error_description": "Session expired",
-    }
-    mock_urlopen.side_effect = make_http_error(
-        code=400,
-        body=error_body,
-        url="https://test.my.salesforce.com/services/oauth2/token",
-    )
+    mock_urlopen.side_effect = _token_error(400, "invalid_grant", "Session expired")
 
     client = AgentAPIClient(
         my_domain="https://test.my.salesforce.com",
@@ -8,6 +8,7 @@ Usage:
     python3 validation/scripts/run_validation.py --offline
     python3 validation/scripts/run_validation.py --tier T1
     python3 validation/scripts/run_validation.py --json
+    python3 validation/scripts/run_validation.py --offline --workers auto
 """
 
 import argparse
@@ -272,6 +273,8 @@ def main():
     parser.add_argument("--tier", type=str, default=None, help="Run specific tier (T1, T2, ...)")
     parser.add_argument("--json", action="store_true", help="Output JSON results")
     parser.add_argument("--verbose", action="store_true", help="Show pytest output")
+    parser.add_argument("--workers", type=str, default=None,
+                        help="Run each tier with pytest-xdist (N or 'auto'); requires pytest-xdist")
 
     args = parser.parse_args()
 
@@ -286,6 +289,17 @@ def main():
             sys.exit(1)
         tiers = {tier_key: tiers[tier_key]}
 
+    # Distribute tests across xdist workers; loadgroup keeps live_api tests
+    # on one worker (see conftest.pytest_collection_modifyitems)
+    extra_args = None
+    if args.workers:
+        try:
+            import xdist  # noqa: F401
+        except ImportError:
+            print("ERROR: --workers requires pytest-xdist (pip3 install pytest-xdist)")
+            sys.exit(1)
+        extra_args = ["-n", args.workers, "--dist=loadgroup"]
+
     # Run each tier
     results = []
     for tier_id, tier_config in tiers.items():
@@ -294,6 +308,7 @@ def main():
             tier_config=tier_config,
             offline=args.offline,
             verbose=args.verbose,
+            extra_args=extra_args,
         )
         results.append(result)
 
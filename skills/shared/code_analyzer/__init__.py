@@ -28,7 +28,7 @@ Usage:
 """
 
 from .scanner import CodeAnalyzerScanner, SkillType, ScanResult
-from .dependency_checker import DependencyChecker
+from .dependency_checker import DependencyChecker, get_checker
 from .score_merger import ScoreMerger, MergedScore
 from .parser import parse_ca_output, normalize_violation
 from .formatter import format_validation_output
@@ -41,6 +41,7 @@ __all__ = [
     "ScanResult",
     # Dependencies
     "DependencyChecker",
+    "get_checker",
     # Scoring
     "ScoreMerger",
     "MergedScore",
@@ -11,16 +11,168 @@ Detects availability of runtime dependencies required by different CA engines:
 Provides graceful degradation information when dependencies are missing.
 """
 
+import hashlib
+import json
+import os
 import subprocess
 import re
 import sys
 import shutil
-from dataclasses import dataclass
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from functools import lru_cache
 
 
-@dataclass
+# Parses `java -version` output, e.g. 'openjdk version "11.0.2"' or 'java version "17.0.1"'
+_JAVA_VERSION_RE = re.compile(r'version\s*["\']?(\d+)(?:\.(\d+))?')
+_JAVA_STDERR_SCAN_BYTES = 4096
+
+# INSTALL_HINTS key for this platform, resolved once (other platforms use linux hints)
+_PLATFORM_KEY = sys.platform if sys.platform in ("darwin", "win32") else "linux"
+
+# Cross-process cache of successful probes, keyed by the binaries on PATH
+DISK_CACHE_FILE = Path.home() / ".cache" / "sf-skills" / "deps.json"
+DISK_CACHE_TTL_SECONDS = 86400  # 24 hours
+# Python is never persisted: its status describes the running interpreter.
+_PERSISTED_DEPS = ("java", "node", "sf_cli")
+# oclif records user-installed sf plugins here; installing or removing the
+# code-analyzer plugin changes its mtime without touching the sf binary.
+_SF_PLUGINS_MANIFEST = Path.home() / ".local" / "share" / "sf" / "package.json"
+
+# sf CLI probe arguments: version, then installed plugins. They are
+# independent, so check_sf_cli launches them together rather than one after
+# the other.
+_SF_PROBE_ARGS = (
+    ["--version"],
+    ["plugins"],
+)
+
+# Wall-clock budget shared by all probes in check_all(). The checks run
+# concurrently, so this caps the whole call when a tool hangs (e.g. sf
+# stuck on an auto-update lookup). sf routinely needs a few seconds to
+# start cold, so the budget is not tighter than this.
+_DEADLINE_S = 10.0
+_MIN_PROBE_TIMEOUT_S = 0.1
+
+# Keep probed CLIs quiet and offline: no sf self-update check, no Node
+# deprecation warnings.
+_PROBE_ENV_OVERRIDES = {
+    "SF_AUTOUPDATE_DISABLE": "true",
+    "NODE_NO_WARNINGS": "1",
+}
+
+
+@lru_cache(maxsize=32)
+def _which_on(tool: str, search_path: Optional[str]) -> Optional[str]:
+    return shutil.which(tool, path=search_path)
+
+
+def _which(tool: str) -> Optional[str]:
+    """
+    shutil.which(), memoized per PATH value.
+
+    Each lookup stats every PATH directory, and the same tools are resolved
+    for the disk-cache key, the probes and the Java candidates. Keying on
+    PATH keeps results correct if the environment changes;
+    DependencyChecker.clear_cache() also resets the memo.
+    """
+    return _which_on(tool, os.environ.get("PATH"))
+
+
+def _probe_env() -> Dict[str, str]:
+    """Environment for probe subprocesses: the current one plus overrides."""
+    return {**os.environ, **_PROBE_ENV_OVERRIDES}
+
+
+def _probe_timeout(default: float, deadline: Optional[float]) -> float:
+    """
+    Timeout for one probe: the default, or the time left until deadline
+    (a time.monotonic() value) when one is given.
+    """
+    if deadline is None:
+        return default
+    return min(default, max(_MIN_PROBE_TIMEOUT_S, deadline - time.monotonic()))
+
+
+def _prune_missing(paths: List[str], depth: int = 3) -> List[str]:
+    """
+    Drop paths that cannot exist, listing each shared ancestor only once.
+
+    Each path is checked against the directory `depth` levels above it:
+    e.g. for /opt/homebrew/opt/openjdk@17/bin/java, whether /opt/homebrew/opt
+    contains openjdk@17. Paths sharing that ancestor share one scandir(), and
+    a missing ancestor rules them all out with a single failed call.
+    """
+    listings: Dict[str, frozenset] = {}
+    kept = []
+    for path in paths:
+        anchor = path
+        for _ in range(depth):
+            anchor = os.path.dirname(anchor)
+        child = os.path.relpath(path, anchor).split(os.sep, 1)[0]
+        if anchor not in listings:
+            try:
+                with os.scandir(anchor) as entries:
+                    listings[anchor] = frozenset(entry.name for entry in entries)
+            except OSError:
+                listings[anchor] = frozenset()
+        if child in listings[anchor]:
+            kept.append(path)
+    return kept
+
+
+def _mtime(path) -> float:
+    """Modification time of path, or 0.0 if it is missing."""
+    try:
+        return os.path.getmtime(path) if path else 0.0
+    except OSError:
+        return 0.0
+
+
+def _run_concurrently(
+    commands, timeout: float, env: Optional[Dict[str, str]] = None
+) -> List[Tuple[int, str]]:
+    """
+    Launch every command at once and collect (returncode, stdout) for each.
+
+    The timeout is a single deadline shared by all commands, since they run
+    concurrently. Raises subprocess.TimeoutExpired if any command is still
+    running at the deadline; processes still running on exit are killed.
+    """
+    procs = []
+    try:
+        for cmd in commands:
+            procs.append(subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                env=env,
+            ))
+        deadline = time.monotonic() + timeout
+        results = []
+        for proc in procs:
+            remaining = max(0.0, deadline - time.monotonic())
+            stdout, _ = proc.communicate(timeout=remaining)
+            results.append((proc.returncode, stdout))
+        return results
+    finally:
+        for proc in procs:
+            if proc.poll() is None:
+                proc.kill()
+                proc.wait()
+
+
+# slots=True needs Python 3.10+; this module must still import on older
+# interpreters so it can report that Python 3.10+ is missing.
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_SLOTS)
 class DependencyStatus:
     """Status of a single dependency."""
     name: str
@@ -31,7 +183,7 @@ class DependencyStatus:
     install_hint: Optional[str] = None
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class EngineAvailability:
     """Availability status for CA engines."""
     engine: str
@@ -93,10 +245,108 @@ class DependencyChecker:
     def __init__(self):
         """Initialize dependency checker."""
         self._cache: Dict[str, DependencyStatus] = {}
+        self._cache_lock = threading.Lock()
+        # Derived from the dependency statuses; reset whenever one is stored
+        self._engines_cache: Optional[Dict[str, EngineAvailability]] = None
+        # When the entries seeded from disk were probed; a save keeps it, so
+        # the TTL counts from the probe rather than from the last save
+        self._disk_cache_timestamp: Optional[float] = None
+        # The disk cache is read on the first check, not at construction
+        self._disk_cache_loaded = False
+
+    def clear_cache(self, persistent: bool = False):
+        """
+        Clear the dependency cache (useful for re-checking).
 
-    def clear_cache(self):
-        """Clear the dependency cache (useful for re-checking)."""
-        self._cache.clear()
+        Later checks probe again rather than re-reading the disk cache.
+        persistent=True also deletes the on-disk cache shared with other
+        processes.
+        """
+        with self._cache_lock:
+            self._cache.clear()
+            self._engines_cache = None
+            self._disk_cache_timestamp = None
+            self._disk_cache_loaded = True
+        _which_on.cache_clear()
+        if persistent:
+            try:
+                DISK_CACHE_FILE.unlink()
+            except OSError:
+                pass
+
+    @staticmethod
+    def _disk_cache_key() -> str:
+        """Fingerprint of the installed tools: their PATH locations and mtimes."""
+        parts = [os.environ.get("JAVA_HOME", ""), _mtime(_SF_PLUGINS_MANIFEST)]
+        for tool in ("java", "node", "sf"):
+            tool_path = _which(tool)
+            parts.append((tool, tool_path, _mtime(tool_path)))
+        return hashlib.md5(repr(parts).encode("utf-8")).hexdigest()
+
+    def _ensure_disk_cache_loaded(self):
+        """Seed the in-memory cache from disk once, before the first check."""
+        if self._disk_cache_loaded:
+            return
+        with self._cache_lock:
+            if not self._disk_cache_loaded:
+                self._load_disk_cache()
+                self._engines_cache = None
+                self._disk_cache_loaded = True
+
+    def _load_disk_cache(self):
+        """Seed the in-memory cache from a fresh, matching disk cache."""
+        try:
+            with open(DISK_CACHE_FILE, "r") as f:
+                cache = json.load(f)
+            timestamp = cache.get("timestamp", 0)
+            if time.time() - timestamp >= DISK_CACHE_TTL_SECONDS:
+                return
+            if cache.get("key") != self._disk_cache_key():
+                return
+            for dep, fields in cache.get("deps", {}).items():
+                status = DependencyStatus(**fields)
+                # Skip entries whose binary has since disappeared
+                if dep in _PERSISTED_DEPS and status.path and os.path.exists(status.path):
+                    self._cache[dep] = status
+                    self._disk_cache_timestamp = timestamp
+        except Exception:
+            pass
+
+    def _save_disk_cache(self):
+        """
+        Persist successful probes so later processes can skip them.
+
+        Entries seeded from disk keep their original timestamp (the file has
+        one, so the oldest wins), so re-saving never extends their TTL.
+        """
+        with self._cache_lock:
+            deps = {
+                dep: asdict(self._cache[dep])
+                for dep in _PERSISTED_DEPS
+                if dep in self._cache and self._cache[dep].available
+            }
+            timestamp = self._disk_cache_timestamp
+        if timestamp is None:
+            timestamp = time.time()
+        try:
+            DISK_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = DISK_CACHE_FILE.with_name(f"{DISK_CACHE_FILE.name}.{os.getpid()}.tmp")
+            with open(tmp_file, "w") as f:
+                json.dump({
+                    "key": self._disk_cache_key(),
+                    "timestamp": timestamp,
+                    "deps": deps,
+                }, f)
+            os.replace(tmp_file, DISK_CACHE_FILE)
+        except Exception:
+            pass
+
+    def _store(self, key: str, status: DependencyStatus) -> DependencyStatus:
+        """Cache a dependency status (thread-safe) and return it."""
+        with self._cache_lock:
+            self._cache[key] = status
+            self._engines_cache = None
+        return status
 
     # Common Java installation paths to check as fallback
     JAVA_PATHS = [
@@ -115,30 +365,36 @@ class DependencyChecker:
         "/usr/local/bin/java",
     ]
 
-    def _try_java_at_path(self, java_path: str) -> Optional[DependencyStatus]:
+    def _try_java_at_path(
+        self, java_path: str, deadline: Optional[float] = None
+    ) -> Optional[DependencyStatus]:
         """
         Try to get Java version from a specific path.
 
+        Args:
+            java_path: java binary to run
+            deadline: Optional time.monotonic() value bounding the probe
+
         Returns:
             DependencyStatus if valid Java found, None otherwise
         """
-        import os
-        if not os.path.exists(java_path):
+        if not os.access(java_path, os.X_OK):
             return None
 
         try:
+            # Java outputs version to stderr; stdout is unused
             result = subprocess.run(
                 [java_path, "-version"],
-                capture_output=True,
-                text=True,
-                timeout=10
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                timeout=_probe_timeout(10, deadline),
+                env=_probe_env(),
             )
 
-            # Java outputs version to stderr
-            output = result.stderr.lower()
-
-            # Parse version (e.g., "openjdk version \"11.0.2\"" or "java version \"17.0.1\"")
-            version_match = re.search(r'version\s*["\']?(\d+)(?:\.(\d+))?', output)
+            # Decode only the head of stderr. It is bounded generously because a
+            # "Picked up JAVA_TOOL_OPTIONS" notice can precede the version line.
+            output = result.stderr[:_JAVA_STDERR_SCAN_BYTES].decode("ascii", errors="ignore").lower()
+            version_match = _JAVA_VERSION_RE.search(output)
 
             if version_match:
                 major = int(version_match.group(1))
@@ -156,43 +412,69 @@ class DependencyChecker:
 
         return None
 
-    def check_java(self) -> DependencyStatus:
+    def _java_candidates(self) -> List[str]:
+        """
+        Java binaries to probe, in priority order: JAVA_HOME, PATH, then
+        common installation paths (Homebrew, etc.).
+
+        Non-executable paths are dropped, and paths resolving to the same
+        binary (e.g. Homebrew symlinks) are kept once, so each distinct
+        java is spawned at most once.
+        """
+        candidates = []
+        java_home = os.environ.get("JAVA_HOME")
+        if java_home:
+            candidates.append(os.path.join(java_home, "bin", "java"))
+        path_java = _which("java")
+        if path_java:
+            candidates.append(path_java)
+        # Most fallback JDKs are absent; rule them out per Homebrew prefix
+        # rather than with an access() call each.
+        candidates.extend(_prune_missing(self.JAVA_PATHS))
+
+        unique: Dict[str, str] = {}
+        for path in candidates:
+            if os.access(path, os.X_OK):
+                unique.setdefault(os.path.realpath(path), path)
+        return list(unique.values())
+
+    def check_java(self, deadline: Optional[float] = None) -> DependencyStatus:
         """
         Check if JDK 11+ is available.
 
         Checks multiple locations including Homebrew paths to handle
         wrapper scripts that may intercept the default java command.
 
+        Args:
+            deadline: Optional time.monotonic() value bounding the probes
+
         Returns:
             DependencyStatus with version info if available
         """
+        self._ensure_disk_cache_loaded()
         if "java" in self._cache:
             return self._cache["java"]
 
-        # First, try JAVA_HOME if set
-        import os
-        java_home = os.environ.get("JAVA_HOME")
-        if java_home:
-            java_path = os.path.join(java_home, "bin", "java")
-            status = self._try_java_at_path(java_path)
-            if status:
-                self._cache["java"] = status
-                return status
-
-        # Try default PATH java
-        java_path = shutil.which("java")
-        if java_path:
-            status = self._try_java_at_path(java_path)
-            if status:
-                self._cache["java"] = status
-                return status
+        candidates = self._java_candidates()
 
-        # Try common installation paths (Homebrew, etc.)
-        for fallback_path in self.JAVA_PATHS:
-            status = self._try_java_at_path(fallback_path)
+        # The top candidate (JAVA_HOME, else PATH java) usually succeeds, so
+        # probe it alone before fanning out.
+        if candidates:
+            status = self._try_java_at_path(candidates[0], deadline)
             if status:
-                self._cache["java"] = status
-                return status
+                return self._store("java", status)
+
+        # Probe the rest concurrently; map() yields in priority order, so the
+        # highest-priority valid JDK still wins.
+        fallbacks = candidates[1:]
+        if fallbacks:
+            with ThreadPoolExecutor(max_workers=len(fallbacks)) as pool:
+                probes = pool.map(
+                    self._try_java_at_path, fallbacks, [deadline] * len(fallbacks)
+                )
+                for status in probes:
+                    if status:
+                        return self._store("java", status)
 
         # No valid Java found
         status = DependencyStatus(
@@ -201,21 +483,24 @@ class DependencyChecker:
             error="JDK 11+ not found in PATH or common locations",
             install_hint=self._get_install_hint("java"),
         )
-        self._cache["java"] = status
-        return status
+        return self._store("java", status)
 
-    def check_node(self) -> DependencyStatus:
+    def check_node(self, deadline: Optional[float] = None) -> DependencyStatus:
         """
         Check if Node.js is available.
 
+        Args:
+            deadline: Optional time.monotonic() value bounding the probe
+
         Returns:
             DependencyStatus with version info if available
         """
+        self._ensure_disk_cache_loaded()
         if "node" in self._cache:
             return self._cache["node"]
 
         try:
-            node_path = shutil.which("node")
+            node_path = _which("node")
             if not node_path:
                 status = DependencyStatus(
                     name="Node.js",
@@ -223,18 +508,18 @@ class DependencyChecker:
                     error="node command not found in PATH",
                     install_hint=self._get_install_hint("node"),
                 )
-                self._cache["node"] = status
-                return status
+                return self._store("node", status)
 
+            # Run the resolved path so the exec doesn't walk PATH a second time
             result = subprocess.run(
-                ["node", "--version"],
+                [node_path, "--version"],
                 capture_output=True,
-                text=True,
-                timeout=10
+                timeout=_probe_timeout(10, deadline),
+                env=_probe_env(),
             )
 
             if result.returncode == 0:
-                version = result.stdout.strip()
+                version = result.stdout.decode("ascii", errors="ignore").strip()
                 status = DependencyStatus(
                     name="Node.js",
                     available=True,
@@ -245,12 +530,11 @@ class DependencyChecker:
                 status = DependencyStatus(
                     name="Node.js",
                     available=False,
-                    error=result.stderr.strip() or "Unknown error",
+                    error=result.stderr.decode(errors="replace").strip() or "Unknown error",
                     install_hint=self._get_install_hint("node"),
                 )
 
-            self._cache["node"] = status
-            return status
+            return self._store("node", status)
 
         except subprocess.TimeoutExpired:
             status = DependencyStatus(
@@ -259,8 +543,7 @@ class DependencyChecker:
                 error="node --version timed out",
                 install_hint=self._get_install_hint("node"),
             )
-            self._cache["node"] = status
-            return status
+            return self._store("node", status)
         except Exception as e:
             status = DependencyStatus(
                 name="Node.js",
@@ -268,8 +551,7 @@ class DependencyChecker:
                 error=str(e),
                 install_hint=self._get_install_hint("node"),
             )
-            self._cache["node"] = status
-            return status
+            return self._store("node", status)
 
     def check_python(self) -> DependencyStatus:
         """
@@ -278,46 +560,25 @@ class DependencyChecker:
         Returns:
             DependencyStatus with version info if available
         """
-        if "python" in self._cache:
-            return self._cache["python"]
-
-        # If we're running, Python is available - check version
-        major = sys.version_info.major
-        minor = sys.version_info.minor
-        version = f"{major}.{minor}.{sys.version_info.micro}"
-
-        if major >= 3 and minor >= 10:
-            status = DependencyStatus(
-                name="Python 3.10+",
-                available=True,
-                version=version,
-                path=sys.executable,
-            )
-        else:
-            status = DependencyStatus(
-                name="Python 3.10+",
-                available=False,
-                version=version,
-                path=sys.executable,
-                error=f"Python {major}.{minor} found, but 3.10+ required for Flow Scanner",
-                install_hint=self._get_install_hint("python"),
-            )
-
-        self._cache["python"] = status
-        return status
+        # Constant for the process lifetime; see _PYTHON_STATUS
+        return self._store("python", _PYTHON_STATUS)
 
-    def check_sf_cli(self) -> DependencyStatus:
+    def check_sf_cli(self, deadline: Optional[float] = None) -> DependencyStatus:
         """
         Check if Salesforce CLI with code-analyzer plugin is available.
 
+        Args:
+            deadline: Optional time.monotonic() value bounding the probes
+
         Returns:
             DependencyStatus with version info if available
         """
+        self._ensure_disk_cache_loaded()
         if "sf_cli" in self._cache:
             return self._cache["sf_cli"]
 
         try:
-            sf_path = shutil.which("sf")
+            sf_path = _which("sf")
             if not sf_path:
                 status = DependencyStatus(
                     name="Salesforce CLI",
@@ -325,39 +586,30 @@ class DependencyChecker:
                     error="sf command not found in PATH",
                     install_hint=self._get_install_hint("sf_cli"),
                 )
-                self._cache["sf_cli"] = status
-                return status
+                return self._store("sf_cli", status)
 
-            # Check sf version
-            result = subprocess.run(
-                ["sf", "--version"],
-                capture_output=True,
-                text=True,
-                timeout=15
+            # Run the resolved path so each exec doesn't walk PATH again
+            (version_rc, version_out), (_, plugins_out) = _run_concurrently(
+                [[sf_path, *args] for args in _SF_PROBE_ARGS],
+                timeout=_probe_timeout(15, deadline),
+                env=_probe_env(),
             )
 
-            if result.returncode != 0:
+            if version_rc != 0:
                 status = DependencyStatus(
                     name="Salesforce CLI",
                     available=False,
                     error="sf --version failed",
                     install_hint=self._get_install_hint("sf_cli"),
                 )
-                self._cache["sf_cli"] = status
-                return status
+                return self._store("sf_cli", status)
 
-            sf_version = result.stdout.strip().split("\n")[0]
+            sf_version = version_out.strip().split("\n")[0]
 
             # Check if code-analyzer plugin is installed
-            plugin_result = subprocess.run(
-                ["sf", "plugins"],
-                capture_output=True,
-                text=True,
-                timeout=15
-            )
-
-            has_ca_plugin = "code-analyzer" in plugin_result.stdout.lower() or \
-                           "sfdx-scanner" in plugin_result.stdout.lower()
+            plugins_lower = plugins_out.lower()
+            has_ca_plugin = "code-analyzer" in plugins_lower or \
+                           "sfdx-scanner" in plugins_lower
 
             if has_ca_plugin:
                 status = DependencyStatus(
@@ -376,8 +628,7 @@ class DependencyChecker:
                     install_hint="sf plugins install @salesforce/plugin-code-analyzer",
                 )
 
-            self._cache["sf_cli"] = status
-            return status
+            return self._store("sf_cli", status)
 
         except subprocess.TimeoutExpired:
             status = DependencyStatus(
@@ -386,8 +637,7 @@ class DependencyChecker:
                 error="sf command timed out",
                 install_hint=self._get_install_hint("sf_cli"),
             )
-            self._cache["sf_cli"] = status
-            return status
+            return self._store("sf_cli", status)
         except Exception as e:
             status = DependencyStatus(
                 name="Salesforce CLI",
@@ -395,38 +645,63 @@ class DependencyChecker:
                 error=str(e),
                 install_hint=self._get_install_hint("sf_cli"),
             )
-            self._cache["sf_cli"] = status
-            return status
+            return self._store("sf_cli", status)
 
     def check_all(self) -> Dict[str, DependencyStatus]:
         """
         Check all dependencies.
 
+        Uncached checks run concurrently; each is bound by subprocess
+        spawn/wait, so wall-clock is that of the slowest single check,
+        capped at _DEADLINE_S overall.
+
         Returns:
             Dict mapping dependency name to status
         """
-        return {
-            "java": self.check_java(),
-            "node": self.check_node(),
-            "python": self.check_python(),
-            "sf_cli": self.check_sf_cli(),
+        self._ensure_disk_cache_loaded()
+        deadline = time.monotonic() + _DEADLINE_S
+        checks = {
+            "java": lambda: self.check_java(deadline),
+            "node": lambda: self.check_node(deadline),
+            "python": self.check_python,
+            "sf_cli": lambda: self.check_sf_cli(deadline),
         }
+        if all(key in self._cache for key in checks):
+            return {key: self._cache[key] for key in checks}
+        # Python is never persisted, so only a persisted dep's probe is news
+        probed = [key for key in _PERSISTED_DEPS if key not in self._cache]
+
+        with ThreadPoolExecutor(max_workers=len(checks)) as pool:
+            futures = {key: pool.submit(check) for key, check in checks.items()}
+            results = {key: future.result() for key, future in futures.items()}
+        if probed:
+            self._save_disk_cache()
+        return results
 
     def get_engine_availability(self) -> Dict[str, EngineAvailability]:
         """
         Get availability status for each Code Analyzer engine.
 
+        The result is memoized until a dependency status changes, so the
+        get_* accessors below share one computation.
+
         Returns:
             Dict mapping engine name to availability status
         """
+        if self._engines_cache is None:
+            self._engines_cache = self._compute_engine_availability()
+        return dict(self._engines_cache)
+
+    def _compute_engine_availability(self) -> Dict[str, EngineAvailability]:
+        """Derive engine availability from the current dependency statuses."""
         deps = self.check_all()
         engines = {}
 
+        # Names of unavailable dependencies, computed once for all engines
+        unavailable = {dep: status.name for dep, status in deps.items() if not status.available}
+
         for engine, required_deps in self.ENGINE_DEPENDENCIES.items():
-            missing = []
-            for dep in required_deps:
-                if not deps[dep].available:
-                    missing.append(deps[dep].name)
+            missing = [unavailable[dep] for dep in required_deps if dep in unavailable]
 
             if missing:
                 engines[engine] = EngineAvailability(
@@ -476,19 +751,18 @@ class DependencyChecker:
 
         if unavailable:
             lines.append("Unavailable engines:")
-            for engine, reason in unavailable:
-                lines.append(f"  - {engine}: {reason}")
+            lines.extend([f"  - {engine}: {reason}" for engine, reason in unavailable])
 
             # Add install hints
-            deps = self.check_all()
-            missing_deps = [d for d, s in deps.items() if not s.available]
+            missing_deps = [s for s in self.check_all().values() if not s.available]
             if missing_deps:
                 lines.append("")
                 lines.append("To enable more engines, install:")
-                for dep in missing_deps:
-                    status = deps[dep]
-                    if status.install_hint:
-                        lines.append(f"  {status.name}: {status.install_hint}")
+                lines.extend([
+                    f"  {status.name}: {status.install_hint}"
+                    for status in missing_deps
+                    if status.install_hint
+                ])
 
         return "\n".join(lines)
 
@@ -499,17 +773,37 @@ class DependencyChecker:
         if "all" in hints:
             return hints["all"]
 
-        import platform
-        system = platform.system().lower()
+        return hints.get(_PLATFORM_KEY, "")
+
+
+# If we're running, Python is available - only the version can rule it out
+_PYTHON_OK = sys.version_info >= (3, 10)
+_PYTHON_STATUS = DependencyStatus(
+    name="Python 3.10+",
+    available=_PYTHON_OK,
+    version="%d.%d.%d" % sys.version_info[:3],
+    path=sys.executable,
+    error=None if _PYTHON_OK else (
+        f"Python {sys.version_info.major}.{sys.version_info.minor} found, "
+        "but 3.10+ required for Flow Scanner"
+    ),
+    install_hint=(
+        None if _PYTHON_OK
+        else DependencyChecker.INSTALL_HINTS["python"].get(_PLATFORM_KEY, "")
+    ),
+)
+
+
+@lru_cache(maxsize=1)
+def get_checker() -> DependencyChecker:
+    """
+    Process-wide shared DependencyChecker.
 
-        if system == "darwin":
-            return hints.get("darwin", "")
-        elif system == "linux":
-            return hints.get("linux", "")
-        elif system == "windows":
-            return hints.get("win32", "")
-        else:
-            return hints.get("linux", "")  # Default to linux
+    Modules that use this instead of constructing their own share one cache,
+    so each dependency is probed at most once per process. Call
+    clear_cache() on it to force a re-check for every user.
+    """
+    return DependencyChecker()
 
 
 # Convenience function
@@ -520,7 +814,7 @@ def check_dependencies() -> Dict[str, bool]:
     Returns:
         Dict mapping dependency name to availability boolean
     """
-    checker = DependencyChecker()
+    checker = get_checker()
     deps = checker.check_all()
     return {name: status.available for name, status in deps.items()}
 
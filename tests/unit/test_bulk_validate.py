@@ -0,0 +1,109 @@
+"""
+Unit tests for skill-builder/scripts/bulk_validate.py.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+
+def _load_bulk_validate_module():
+    """Load bulk_validate.py by path (skill-builder/ is not a package)."""
+    module_path = PROJECT_ROOT / "skill-builder" / "scripts" / "bulk_validate.py"
+    spec = importlib.util.spec_from_file_location("bulk_validate", module_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+bv = _load_bulk_validate_module()
+
+
+def _write_skill(root: Path, name: str, openai_yaml: bool) -> Path:
+    skill_md = root / name / "SKILL.md"
+    skill_md.parent.mkdir(parents=True)
+    skill_md.write_text(f"---\nname: {name}\ndescription: Test skill {name}\n---\n\nBody.\n")
+    if openai_yaml:
+        agents = skill_md.parent / "agents"
+        agents.mkdir()
+        (agents / "openai.yaml").write_text("interface: {}\ndependencies: {}\n")
+    return skill_md
+
+
+def test_edited_openai_yaml_is_parsed_again(tmp_path):
+    """The openai.yaml memo is keyed on mtime and size, so edits are seen."""
+    skill_md = _write_skill(tmp_path, "edited-skill", openai_yaml=True)
+    result = bv.validate_single_codex_export_skill(skill_md)
+    assert not any("YAML" in e.message for e in result.errors)
+
+    (skill_md.parent / "agents" / "openai.yaml").write_text("interface: [unclosed\n")
+    result = bv.validate_single_codex_export_skill(skill_md)
+    assert any("Invalid YAML" in e.message for e in result.errors)
+
+
+@pytest.fixture
+def mixed_skills(tmp_path) -> list:
+    """Codex-export and repo skills, some valid, some with findings."""
+    skills = [
+        (_write_skill(tmp_path / "export", f"export-{i}", openai_yaml=i % 2 == 0), "codex-export")
+        for i in range(4)
+    ]
+    skills += [
+        (_write_skill(tmp_path / "repo", f"repo-{i}", openai_yaml=False), "repo")
+        for i in range(3)
+    ]
+    bad = tmp_path / "repo" / "Bad_Name" / "SKILL.md"
+    bad.parent.mkdir(parents=True)
+    bad.write_text("no frontmatter\n")
+    skills.append((bad, "repo"))
+    return skills
+
+
+def test_parallel_matches_sequential(mixed_skills):
+    """Threaded validation agrees with a sequential run, in input order."""
+    sequential = [bv.asdict(r) for r in bv.validate_skills(mixed_skills, parallel=False)]
+    threaded = [bv.asdict(r) for r in bv.validate_skills(mixed_skills, parallel=True)]
+    assert [r["skill_path"] for r in sequential] == [path for path, _ in mixed_skills]
+    assert threaded == sequential
+
+
+@pytest.mark.parametrize(
+    "validator, location_type",
+    [
+        (bv.validate_single_skill, "repo"),
+        (bv.validate_single_codex_export_skill, None),
+    ],
+    ids=["source", "codex-export"],
+)
+def test_validators_load_yaml_when_called_directly(tmp_path, monkeypatch, validator, location_type):
+    """Validators work without validate_skills() having loaded PyYAML first."""
+    monkeypatch.setattr(bv, "yaml", None)
+    monkeypatch.setattr(bv, "_YamlLoader", None)
+    skill_md = _write_skill(tmp_path, "direct-skill", openai_yaml=True)
+    args = (skill_md,) if location_type is None else (skill_md, location_type)
+    result = validator(*args)
+    assert not any("YAML" in e.message for e in result.errors)
+
+
+def test_json_report_is_identical_without_orjson(tmp_path, monkeypatch):
+    """The json fallback writes non-ASCII as-is, matching orjson's output."""
+    pytest.importorskip("orjson")
+    skill_md = _write_skill(tmp_path / "Zürich", "zurich-skill", openai_yaml=False)
+    results = bv.validate_skills([(skill_md, "repo")], parallel=False)
+    report = bv.ValidationReport(
+        total_skills=1, valid_skills=1, skills_with_warnings=0, skills_with_errors=0,
+        results=results, generated_at="now", duration_seconds=0.0,
+    )
+
+    with_orjson = bv.generate_json_report(report)
+    assert "Zürich" in with_orjson
+    monkeypatch.setitem(sys.modules, "orjson", None)
+    without_orjson = bv.generate_json_report(report)
+    assert isinstance(without_orjson, str)
+    assert without_orjson == with_orjson
@@ -0,0 +1,131 @@
+"""
+Unit tests for shared/code_analyzer/dependency_checker.py.
+
+Covers the on-disk probe cache (TTL, no sliding expiry) and the shared
+probe deadline.
+"""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+import time
+from dataclasses import asdict
+from pathlib import Path
+
+import pytest
+
+from shared.code_analyzer import dependency_checker as dc
+
+
+@pytest.fixture
+def disk_cache(tmp_path, monkeypatch) -> Path:
+    """Temp disk cache file with a fixed fingerprint."""
+    cache_file = tmp_path / "deps.json"
+    monkeypatch.setattr(dc, "DISK_CACHE_FILE", cache_file)
+    monkeypatch.setattr(dc.DependencyChecker, "_disk_cache_key", staticmethod(lambda: "key"))
+    return cache_file
+
+
+def _status(name: str) -> dc.DependencyStatus:
+    # The binary must exist for a disk entry to be used
+    return dc.DependencyStatus(name=name, available=True, version="1", path=sys.executable)
+
+
+def _write_cache(cache_file: Path, timestamp: float, deps=dc._PERSISTED_DEPS) -> None:
+    cache_file.write_text(json.dumps({
+        "key": "key",
+        "timestamp": timestamp,
+        "deps": {dep: asdict(_status(dep)) for dep in deps},
+    }))
+
+
+@pytest.fixture
+def no_probes(monkeypatch):
+    """Fail the test if any persisted dependency is actually probed."""
+    def cached_only(key):
+        def check(self, deadline=None):
+            if key not in self._cache:
+                raise AssertionError(f"unexpected {key} probe")
+            return self._cache[key]
+        return check
+
+    for key in dc._PERSISTED_DEPS:
+        monkeypatch.setattr(dc.DependencyChecker, f"check_{key}", cached_only(key))
+
+
+def test_fresh_disk_cache_seeds_checker(disk_cache, no_probes):
+    _write_cache(disk_cache, time.time() - 60)
+    results = dc.DependencyChecker().check_all()
+    assert all(results[dep].available for dep in dc._PERSISTED_DEPS)
+
+
+def test_expired_disk_cache_is_ignored(disk_cache):
+    _write_cache(disk_cache, time.time() - dc.DISK_CACHE_TTL_SECONDS - 1)
+    checker = dc.DependencyChecker()
+    checker._ensure_disk_cache_loaded()
+    assert not any(dep in checker._cache for dep in dc._PERSISTED_DEPS)
+
+
+def test_disk_cache_is_read_on_first_check(disk_cache, monkeypatch):
+    _write_cache(disk_cache, time.time() - 60)
+    checker = dc.DependencyChecker()
+    assert checker._cache == {}
+    # A seeded node entry means check_node never looks for the binary
+    monkeypatch.setattr(dc, "_which", lambda tool: pytest.fail(f"unexpected {tool} lookup"))
+    assert checker.check_node().available
+
+
+def test_clear_cache_keeps_disk_cache_by_default(disk_cache, no_probes):
+    _write_cache(disk_cache, time.time() - 60)
+    checker = dc.DependencyChecker()
+    checker.check_all()
+    checker.clear_cache()
+    assert checker._cache == {}
+    assert disk_cache.exists()
+
+    checker.clear_cache(persistent=True)
+    assert not disk_cache.exists()
+
+
+def test_cached_run_does_not_extend_ttl(disk_cache, no_probes):
+    """A run served entirely from disk must not rewrite the cache timestamp."""
+    written_at = time.time() - 3600
+    _write_cache(disk_cache, written_at)
+    dc.DependencyChecker().check_all()
+    assert json.loads(disk_cache.read_text())["timestamp"] == written_at
+
+
+def test_partial_probe_keeps_seeded_timestamp(disk_cache, monkeypatch):
+    """Saving after a new probe keeps the seeded entries' original timestamp."""
+    written_at = time.time() - 3600
+    _write_cache(disk_cache, written_at, deps=("java", "node"))
+
+    def probe_or_cached(key):
+        def check(self, deadline=None):
+            return self._cache.get(key) or self._store(key, _status(key))
+        return check
+
+    for key in dc._PERSISTED_DEPS:
+        monkeypatch.setattr(dc.DependencyChecker, f"check_{key}", probe_or_cached(key))
+    dc.DependencyChecker().check_all()
+    saved = json.loads(disk_cache.read_text())
+    assert saved["timestamp"] == written_at
+    assert set(saved["deps"]) == set(dc._PERSISTED_DEPS)
+
+
+def test_probe_timeout_respects_deadline():
+    assert dc._probe_timeout(5.0, None) == 5.0
+    assert dc._probe_timeout(5.0, time.monotonic() + 1.0) <= 1.0
+    # An expired deadline still allows the minimum timeout
+    assert dc._probe_timeout(5.0, time.monotonic() - 1.0) == dc._MIN_PROBE_TIMEOUT_S
+
+
+def test_run_concurrently_shares_one_deadline():
+    """Hung commands time out together and are killed, not waited on in turn."""
+    sleeper = [sys.executable, "-c", "import time; time.sleep(30)"]
+    start = time.monotonic()
+    with pytest.raises(subprocess.TimeoutExpired):
+        dc._run_concurrently([sleeper, sleeper], timeout=0.5)
+    assert time.monotonic() - start < 5.0